@@ -62,6 +62,8 @@ runcmd.add_argument("-L","--nlayers", type=int, default=None, metavar="INT",
                     help="Number of layers, problem-specific (default - auto)")
 runcmd.add_argument("--vqe-diff-method", type=str, default="finite-diff",
                     help="VQE-specific: Differentiation method (default - backprop)")
+runcmd.add_argument("--opt-level", type=int, default=2, metavar="INT",
+                    help="Catalyst-specific: Optimization level of the compilation (default - 2)")
 # fmt: on
 
 a = parse_args(ap, sys.argv[1:])
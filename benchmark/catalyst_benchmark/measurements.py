@@ -173,7 +173,7 @@ def measure_compile_catalyst(a: ParsedArguments) -> BenchmarkResult:
         weights = p.trial_params(i)
 
         b = time()
-        jit_main = qjit(_main)
+        jit_main = qjit(_main, opt_level=a.opt_level)
         e = time()
         times.append(e - b)
 
@@ -238,7 +238,7 @@ def measure_runtime_catalyst(a: ParsedArguments) -> BenchmarkResult:
         return workflow(p, weights)
 
     b = time()
-    jit_main = qjit(_main)
+    jit_main = qjit(_main, opt_level=a.opt_level)
     e = time()
     cmptime = e - b
 
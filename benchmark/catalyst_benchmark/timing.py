@@ -0,0 +1,57 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This file contains the timing and reporting utilities shared by the microbenchmarks of
+``benchmark/microbenchmarks``."""
+
+from argparse import ArgumentParser
+from time import perf_counter
+from timeit import repeat as timeit_repeat
+from typing import Any, Callable, Tuple
+
+
+def make_parser(doc: str) -> ArgumentParser:
+    """Create the command line parser of a microbenchmark, described by the first line of its
+    module docstring ``doc``"""
+    return ArgumentParser(description=doc.splitlines()[0])
+
+
+def best_time(fn: Callable[[], Any], repeat: int = 5, number: int = 1) -> float:
+    """Return the best time of a call of ``fn`` in seconds, over ``repeat`` repetitions of
+    ``number`` calls"""
+    return min(timeit_repeat(fn, number=number, repeat=repeat)) / number
+
+
+def timed(fn: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    """Call ``fn`` once and return its result along with the elapsed time in seconds"""
+    start = perf_counter()
+    result = fn(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+class Table:
+    """A table of measurements printed row by row. Each column is given by its title, the format
+    specification of its values, and optionally its width. Columns are right-aligned and, by
+    default, one character wider than their titles."""
+
+    def __init__(self, *columns: Tuple):
+        self.titles = [title for title, *_ in columns]
+        self.specs = [spec for _, spec, *_ in columns]
+        self.widths = [width[0] if width else len(title) + 1 for title, _, *width in columns]
+        print(" ".join(f"{title:>{width}}" for title, width in zip(self.titles, self.widths)))
+
+    def row(self, *values) -> None:
+        """Print a row of values"""
+        assert len(values) == len(self.specs)
+        cells = [f"{value:{spec}}" for value, spec in zip(values, self.specs)]
+        print(" ".join(f"{cell:>{width}}" for cell, width in zip(cells, self.widths)))
@@ -0,0 +1,86 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the repeated program capture time of workflows calling many QNodes.
+
+Each QNode of the workflow creates a QJIT device, which loads the capabilities of the device from
+its config file. The capture is repeated with the capabilities cache cleared before each capture
+(cold) and kept across captures (warm).
+
+    $ python3 benchmark/microbenchmarks/capture_qnodes.py --qnodes 1 10 50 --repeat 5
+"""
+import pennylane as qml
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+from catalyst import qjit
+from catalyst.device import qjit_device
+
+
+def make_workflow(device, num_qnodes):
+    """A workflow summing the results of ``num_qnodes`` small QNodes."""
+
+    def make_qnode(i):
+        @qml.qnode(qml.device(device, wires=2))
+        def circuit(x):
+            qml.RX(x * (i + 1), wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        return circuit
+
+    qnodes = [make_qnode(i) for i in range(num_qnodes)]
+
+    @qjit(target="jaxpr")
+    def workflow(x):
+        return sum(qnode(x) for qnode in qnodes)
+
+    return workflow
+
+
+def clear_caches():
+    """Clear the parsed and derived device capabilities."""
+    qjit_device._parse_device_capabilities.cache_clear()  # pylint: disable=protected-access
+    qjit_device._get_cached_qjit_device_capabilities.cache_clear()  # pylint: disable=protected-access
+
+
+def capture_time(workflow, repeat, cold):
+    """Return the best capture time of ``workflow`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        if cold:
+            clear_caches()
+        times.append(timed(workflow.capture, (0.5,))[1])
+    return min(times)
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--qnodes", type=int, nargs="+", default=[1, 10, 50])
+    ap.add_argument("--device", default="lightning.qubit")
+    ap.add_argument("--repeat", type=int, default=5, help="Number of captures per measurement")
+    a = ap.parse_args()
+
+    table = Table(
+        ("qnodes", "d"), ("cold [ms]", ".2f"), ("warm [ms]", ".2f"), ("saved per qnode [ms]", ".3f")
+    )
+    for num_qnodes in a.qnodes:
+        workflow = make_workflow(a.device, num_qnodes)
+        cold = capture_time(workflow, a.repeat, cold=True)
+        warm = capture_time(workflow, a.repeat, cold=False)
+        saved = 1e3 * (cold - warm) / num_qnodes
+        table.row(num_qnodes, 1e3 * cold, 1e3 * warm, saved)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the throughput of a compiled function called concurrently from several threads.
+
+The same compiled circuit is called synchronously from a pool of threads. Each call releases the
+GIL while executing, so the throughput scales with the number of threads as long as the circuit
+dominates the Python overhead of the call.
+
+    $ python3 benchmark/microbenchmarks/concurrent_calls.py --threads 1 2 4 8 --layers 100
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pennylane as qml
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+from catalyst import for_loop, qjit
+
+
+def make_circuit(device, num_qubits, num_layers):
+    """A circuit of ``num_layers`` layers of rotations and entangling gates."""
+
+    @qjit
+    @qml.qnode(qml.device(device, wires=num_qubits))
+    def circuit(x):
+        @for_loop(0, num_layers, 1)
+        def layer(_):
+            for i in range(num_qubits):
+                qml.RX(x, wires=i)
+            for i in range(num_qubits - 1):
+                qml.CNOT(wires=[i, i + 1])
+
+        layer()
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--device", default="lightning.qubit")
+    ap.add_argument("--qubits", type=int, default=10)
+    ap.add_argument("--layers", type=int, default=100)
+    ap.add_argument("--calls", type=int, default=256, help="Number of calls per measurement")
+    a = ap.parse_args()
+
+    circuit = make_circuit(a.device, a.qubits, a.layers)
+    xs = np.linspace(0, np.pi, a.calls)
+    expected = [circuit(x) for x in xs]
+
+    table = Table(("threads", "d"), ("calls/s", ".1f", 10), ("speedup", ".2f"))
+    baseline = None
+    for num_threads in a.threads:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            results, elapsed = timed(lambda executor=executor: list(executor.map(circuit, xs)))
+        assert np.allclose(results, expected)
+
+        throughput = a.calls / elapsed
+        baseline = baseline or throughput
+        table.row(num_threads, throughput, throughput / baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-call overhead of invoking an already compiled QJIT function.
+
+The compiled programs are trivial, so that the reported time is dominated by the Python-side
+dispatch: argument marshalling, device setup and teardown, and the conversion of the results.
+
+    $ python3 benchmark/microbenchmarks/dispatch_overhead.py --calls 20000
+"""
+import jax.numpy as jnp
+import pennylane as qml
+from catalyst_benchmark.timing import Table, best_time, make_parser
+
+from catalyst import qjit
+
+
+def classical(num_args):
+    """A purely classical program taking a list of ``num_args`` scalars."""
+
+    @qjit
+    def f(args):
+        return sum(args)
+
+    return f, [jnp.float64(i) for i in range(num_args)]
+
+
+def variational(num_args):
+    """A small variational circuit taking a list of ``num_args`` rotation angles."""
+
+    @qjit
+    @qml.qnode(qml.device("lightning.qubit", wires=2))
+    def f(args):
+        for i, x in enumerate(args):
+            qml.RX(x, wires=i % 2)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(0))
+
+    return f, [jnp.float64(0.1 * i) for i in range(num_args)]
+
+
+BENCHMARKS = {"classical": classical, "variational": variational}
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--calls", type=int, default=10000, help="Calls per repetition")
+    ap.add_argument("--repeat", type=int, default=5, help="Number of repetitions")
+    ap.add_argument(
+        "--num-args", type=int, nargs="+", default=[1, 4, 16], help="Number of arguments"
+    )
+    ap.add_argument("--benchmark", choices=list(BENCHMARKS), nargs="+", default=list(BENCHMARKS))
+    a = ap.parse_args()
+
+    table = Table(("benchmark", ""), ("args", "d"), ("us/call", ".2f"))
+    for name in a.benchmark:
+        for num_args in a.num_args:
+            fn, args = BENCHMARKS[name](num_args)
+            fn(args)  # compile
+            usec = 1e6 * best_time(lambda fn=fn, args=args: fn(args), a.repeat, a.calls)
+            table.row(name, num_args, usec)
+
+
+if __name__ == "__main__":
+    main()
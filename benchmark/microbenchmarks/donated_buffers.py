@@ -0,0 +1,65 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time of optimization loops updating large parameter arrays with donated buffers.
+
+Each step updates a slice of the parameters and returns the whole array, as done by optimizers
+updating a block of parameters at a time. Without donation, every step allocates and fills a new
+array of the size of the parameters.
+
+    $ python3 benchmark/microbenchmarks/donated_buffers.py --sizes 1000 1000000 10000000
+"""
+import jax
+import numpy as np
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+from catalyst import qjit
+
+
+def make_step(donate):
+    """A step updating the first parameters, optionally donating the parameter array."""
+
+    @qjit(donate_argnums=0 if donate else None, output_format="numpy")
+    def step(params, grad):
+        block = jax.lax.dynamic_slice(params, (0,), grad.shape)
+        return jax.lax.dynamic_update_slice(params, block - 0.1 * grad, (0,))
+
+    return step
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 1000000, 10000000])
+    ap.add_argument("--block", type=int, default=16, help="Number of parameters updated per step")
+    ap.add_argument("--steps", type=int, default=100, help="Number of optimization steps")
+    a = ap.parse_args()
+
+    table = Table(("size", "d", 10), ("donated", ""), ("step [us]", ".1f"))
+    for size in a.sizes:
+        grad = np.ones(a.block)
+        for donate in (False, True):
+            step = make_step(donate)
+
+            def optimize(params, step=step, grad=grad):
+                for _ in range(a.steps):
+                    params = step(params, grad)
+                return params
+
+            params, elapsed = timed(optimize, step(np.zeros(size), grad))
+            assert np.isclose(params[0], -0.1 * (a.steps + 1))
+            table.row(size, donate, 1e6 * elapsed / a.steps)
+
+
+if __name__ == "__main__":
+    main()
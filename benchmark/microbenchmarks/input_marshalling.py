@@ -0,0 +1,79 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the cost of passing large arrays to compiled functions.
+
+A circuit preparing a state vector given as argument is called with JAX and NumPy arrays of
+increasing size. For each, report the time to convert the arguments to memref descriptors, whether
+the data of the argument is shared with the compiled function, and the time of the complete call.
+
+    $ python3 benchmark/microbenchmarks/input_marshalling.py --qubits 10 16 20
+"""
+import jax.numpy as jnp
+import numpy as np
+import pennylane as qml
+from catalyst_benchmark.timing import Table, best_time, make_parser
+
+from catalyst import qjit
+
+
+def make_circuit(num_qubits):
+    """A circuit preparing the state vector given as argument."""
+
+    @qjit
+    @qml.qnode(qml.device("lightning.qubit", wires=num_qubits))
+    def circuit(state):
+        qml.StatePrep(state, wires=range(num_qubits))
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--qubits", type=int, nargs="+", default=[10, 16, 20])
+    ap.add_argument("--repeat", type=int, default=5, help="Number of repetitions")
+    ap.add_argument("--number", type=int, default=20, help="Number of calls per repetition")
+    a = ap.parse_args()
+
+    table = Table(
+        ("qubits", "d"),
+        ("input", ""),
+        ("marshal [us]", ".1f"),
+        ("shared", ""),
+        ("call [us]", ".1f"),
+    )
+    for num_qubits in a.qubits:
+        state = np.full(2**num_qubits, 2 ** (-num_qubits / 2), dtype=np.complex128)
+        circuit = make_circuit(num_qubits)
+        circuit(state)
+        compiled_function = circuit.compiled_function
+
+        for name, arg in (("numpy", state), ("jax", jnp.asarray(state))):
+            args = (arg,)
+
+            def marshal(args=args):
+                return compiled_function.args_to_memref_descs(compiled_function.restype, args)
+
+            _, buffers = marshal()
+            pointer = state.ctypes.data if name == "numpy" else arg.unsafe_buffer_pointer()
+            shared = buffers[0].ctypes.data == pointer
+
+            marshal_time = 1e6 * best_time(marshal, a.repeat, a.number)
+            call_time = 1e6 * best_time(lambda args=args: circuit(*args), a.repeat, a.number)
+            table.row(num_qubits, name, marshal_time, shared, call_time)
+
+
+if __name__ == "__main__":
+    main()
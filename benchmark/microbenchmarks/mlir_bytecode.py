@@ -0,0 +1,85 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare textual MLIR and MLIR bytecode as the format handed from the frontend to the compiler.
+
+For unrolled circuits of increasing size, report the time to emit the module in either format, the
+time to parse it back, and the size of the serialized module.
+
+    $ python3 benchmark/microbenchmarks/mlir_bytecode.py --gates 1000 10000 50000
+"""
+import functools
+import io
+
+import pennylane as qml
+from catalyst_benchmark.timing import Table, best_time, make_parser
+from jax.interpreters import mlir
+
+from catalyst import qjit
+
+
+def make_module(num_gates, num_wires):
+    """Lower an unrolled circuit with ``num_gates`` parametrized gates to an MLIR module."""
+
+    @qjit(target="mlir")
+    @qml.qnode(qml.device("lightning.qubit", wires=num_wires))
+    def circuit(x):
+        for i in range(num_gates):
+            qml.RX(x * i, wires=i % num_wires)
+            qml.CNOT(wires=[i % num_wires, (i + 1) % num_wires])
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit.mlir_module
+
+
+def emit_text(module):
+    """Serialize a module to textual MLIR, as done when intermediate files are kept."""
+    return module.operation.get_asm(binary=False, print_generic_op_form=False, assume_verified=True)
+
+
+def emit_bytecode(module):
+    """Serialize a module to MLIR bytecode, as done by default."""
+    buffer = io.BytesIO()
+    module.operation.write_bytecode(buffer)
+    return buffer.getvalue()
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--gates", type=int, nargs="+", default=[100, 1000, 10000])
+    ap.add_argument("--wires", type=int, default=8, help="Number of qubits of the circuit")
+    ap.add_argument("--repeat", type=int, default=5, help="Number of repetitions")
+    a = ap.parse_args()
+
+    table = Table(
+        ("gates", "d", 8),
+        ("format", "", 9),
+        ("emit [ms]", ".2f"),
+        ("parse [ms]", ".2f"),
+        ("size [kB]", ".1f"),
+    )
+    for num_gates in a.gates:
+        module = make_module(num_gates, a.wires)
+        for name, emit in (("text", emit_text), ("bytecode", emit_bytecode)):
+            emit_time = 1e3 * best_time(functools.partial(emit, module), a.repeat)
+            data = emit(module)
+            with module.context:
+                parse = functools.partial(mlir.ir.Module.parse, data)
+                parse_time = 1e3 * best_time(parse, a.repeat)
+            size = len(data.encode() if isinstance(data, str) else data) / 1e3
+            table.row(num_gates, name, emit_time, parse_time, size)
+
+
+if __name__ == "__main__":
+    main()
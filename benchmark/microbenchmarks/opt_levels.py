@@ -0,0 +1,85 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the compilation time and the runtime of the benchmark problems across opt levels.
+
+Each problem of ``benchmark/catalyst_benchmark/test_cases`` is measured by the Catalyst runtime
+measurement of ``catalyst_benchmark`` at every requested ``opt_level``, reporting the time to
+compile it, the time to execute it, and the number of executions after which the compilation time
+saved over the default level is paid back.
+
+    $ python3 benchmark/microbenchmarks/opt_levels.py --problems grover qft --levels 0 1 2 3
+"""
+from argparse import Namespace
+
+import numpy as np
+from catalyst_benchmark.measurements import measure_runtime_catalyst
+from catalyst_benchmark.timing import Table, make_parser
+
+PROBLEMS = ["grover", "qft"]
+
+
+def measure(problem, num_qubits, num_layers, calls, opt_level):
+    """Return the compilation time, the best execution time, and the numeric result of a benchmark
+    problem compiled at the given optimization level."""
+    a = Namespace(
+        problem=problem,
+        nqubits=num_qubits,
+        nlayers=num_layers,
+        niter=calls,
+        opt_level=opt_level,
+        timeout="inf",
+        argv=[],
+    )
+    r = measure_runtime_catalyst(a)
+    return r.prepare_sec, min(r.measurement_sec), r.numeric_result
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--problems", nargs="+", choices=PROBLEMS, default=PROBLEMS)
+    ap.add_argument("--levels", type=int, nargs="+", default=[0, 1, 2, 3])
+    ap.add_argument("--qubits", type=int, default=11)
+    ap.add_argument("--layers", type=int, default=10)
+    ap.add_argument("--calls", type=int, default=20, help="Number of calls per measurement")
+    a = ap.parse_args()
+
+    table = Table(
+        ("problem", "", 8),
+        ("level", "d", 6),
+        ("compile [s]", ".3f"),
+        ("run [ms]", ".3f", 10),
+        ("break-even", ""),
+    )
+    for problem in a.problems:
+        results = {}
+        expected = None
+        for level in a.levels:
+            compile_time, run_time, result = measure(problem, a.qubits, a.layers, a.calls, level)
+            expected = result if expected is None else expected
+            assert np.allclose(result, expected)
+            results[level] = (compile_time, run_time)
+
+        for level, (compile_time, run_time) in results.items():
+            # Number of calls after which the default level recovers its longer compilation.
+            break_even = ""
+            if 2 in results and level != 2:
+                saved = results[2][0] - compile_time
+                lost = run_time - results[2][1]
+                break_even = f"{saved / lost:.0f}" if saved > 0 and lost > 0 else "-"
+            table.row(problem, level, compile_time, 1e3 * run_time, break_even)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the peak memory of returning large state vectors from compiled functions.
+
+Each configuration runs in a fresh process, which reports its peak resident memory after calling a
+circuit returning ``qml.state()``. The size of the state vector itself is printed for reference:
+without copies, the peak is reached by the state held by the device and the returned state.
+
+    $ python3 benchmark/microbenchmarks/output_memory.py --qubits 20 24 26
+"""
+import json
+import resource
+import subprocess
+import sys
+from argparse import SUPPRESS
+
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+
+def measure(num_qubits, output_format):
+    """Return the peak resident memory in MiB and the call time of a state vector circuit."""
+    # pylint: disable=import-outside-toplevel
+    import pennylane as qml
+
+    from catalyst import qjit
+
+    @qjit(output_format=output_format)
+    @qml.qnode(qml.device("lightning.qubit", wires=num_qubits))
+    def circuit():
+        for wire in range(num_qubits):
+            qml.Hadamard(wires=wire)
+        return qml.state()
+
+    circuit.jit_compile(())
+    state, elapsed = timed(circuit)
+    assert state.shape == (2**num_qubits,)
+
+    # On Linux, the peak resident set size is reported in KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, elapsed
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--qubits", type=int, nargs="+", default=[20, 22, 24])
+    ap.add_argument("--formats", nargs="+", default=["jax", "numpy"], choices=["jax", "numpy"])
+    ap.add_argument("--child", nargs=2, help=SUPPRESS)
+    a = ap.parse_args()
+
+    if a.child:
+        print(json.dumps(measure(int(a.child[0]), a.child[1])))
+        return
+
+    table = Table(
+        ("qubits", "d"),
+        ("format", ""),
+        ("state [MiB]", ".1f"),
+        ("peak RSS [MiB]", ".1f"),
+        ("call [s]", ".3f"),
+    )
+    for num_qubits in a.qubits:
+        state_size = 16 * 2**num_qubits / 2**20
+        for output_format in a.formats:
+            cmd = [sys.executable, __file__, "--child", str(num_qubits), output_format]
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            peak, elapsed = json.loads(out.splitlines()[-1])
+            table.row(num_qubits, output_format, state_size, peak, elapsed)
+
+
+if __name__ == "__main__":
+    main()
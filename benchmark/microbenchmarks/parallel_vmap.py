@@ -0,0 +1,74 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the throughput of catalyst.vmap over a parameter sweep for varying thread counts.
+
+The sequential baseline maps the circuit with a loop compiled into the program, while the parallel
+runs dispatch the batch of a qjit-compiled circuit over a pool of worker threads.
+
+    $ python3 benchmark/microbenchmarks/parallel_vmap.py --batch-size 1000 10000 --threads 1 2 4 8
+"""
+import jax.numpy as jnp
+import pennylane as qml
+from catalyst_benchmark.timing import Table, best_time, make_parser
+
+from catalyst import qjit, vmap
+
+
+def make_circuit(num_wires, num_layers):
+    """A hardware-efficient ansatz taking one rotation angle per layer."""
+
+    @qml.qnode(qml.device("lightning.qubit", wires=num_wires))
+    def circuit(x):
+        for layer in range(num_layers):
+            for wire in range(num_wires):
+                qml.RY(x * (layer + 1), wires=wire)
+            for wire in range(num_wires - 1):
+                qml.CNOT(wires=[wire, wire + 1])
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def measure(fn, x, repeat):
+    """Return the best execution time in seconds, after a warm-up call which compiles ``fn``."""
+    fn(x)
+    return best_time(lambda: fn(x), repeat)
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--batch-size", type=int, nargs="+", default=[100, 1000, 10000])
+    ap.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--wires", type=int, default=8, help="Number of qubits of the circuit")
+    ap.add_argument("--layers", type=int, default=4, help="Number of layers of the circuit")
+    ap.add_argument("--repeat", type=int, default=3, help="Number of repetitions")
+    a = ap.parse_args()
+
+    circuit = make_circuit(a.wires, a.layers)
+    sequential = qjit(vmap(circuit))
+    compiled = qjit(circuit)
+
+    table = Table(("batch", "d"), ("threads", ""), ("time [s]", ".4f"), ("speedup", ".2f"))
+    for batch_size in a.batch_size:
+        x = jnp.linspace(0, jnp.pi, batch_size)
+        baseline = measure(sequential, x, a.repeat)
+        table.row(batch_size, "loop", baseline, 1)
+        for num_threads in a.threads:
+            elapsed = measure(vmap(compiled, num_threads=num_threads), x, a.repeat)
+            table.row(batch_size, num_threads, elapsed, baseline / elapsed)
+
+
+if __name__ == "__main__":
+    main()
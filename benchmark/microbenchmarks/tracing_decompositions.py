@@ -0,0 +1,77 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the program capture time of circuits repeating operators which require decomposition.
+
+The circuit repeats layers of a template unsupported by the device, acting either on the same wires
+in every layer or on shifted wires. The capture time is measured with the decomposition cache
+disabled and enabled, and the cache statistics of the latter are reported.
+
+    $ python3 benchmark/microbenchmarks/tracing_decompositions.py --layers 10 100 1000
+"""
+import pennylane as qml
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+from catalyst import qjit
+from catalyst.device import decomposition_cache
+
+
+def make_circuit(num_wires, num_layers, width, shifted):
+    """A circuit of ``num_layers`` QFTs over ``width`` wires, shifted by one wire per layer if
+    ``shifted`` is set."""
+
+    @qjit(target="jaxpr")
+    @qml.qnode(qml.device("lightning.qubit", wires=num_wires))
+    def circuit():
+        for i in range(num_layers):
+            offset = i % (num_wires - width + 1) if shifted else 0
+            qml.QFT(wires=range(offset, offset + width))
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def capture_time(circuit, maxsize):
+    """Capture ``circuit`` with a decomposition cache of the given size."""
+    decomposition_cache.clear()
+    decomposition_cache.maxsize = maxsize
+    return timed(circuit.capture, ())[1]
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--layers", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--wires", type=int, default=16)
+    ap.add_argument("--width", type=int, default=8, help="Number of wires of each QFT")
+    a = ap.parse_args()
+
+    maxsize = decomposition_cache.maxsize
+    table = Table(
+        ("layers", "d"),
+        ("shifted", ""),
+        ("uncached [s]", ".3f"),
+        ("cached [s]", ".3f"),
+        ("hits", "d", 6),
+    )
+    for num_layers in a.layers:
+        for shifted in (False, True):
+            circuit = make_circuit(a.wires, num_layers, a.width, shifted)
+            uncached = capture_time(circuit, 0)
+            cached = capture_time(circuit, maxsize)
+            hits = decomposition_cache.cache_info().hits
+            table.row(num_layers, shifted, uncached, cached, hits)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the program capture time of circuits with many mid-circuit measurements.
+
+Each layer of the circuit entangles neighbouring qubits and measures one of them, in the style of
+syndrome extraction rounds of error correction codes. Measurements are forced-order operations, so
+the reported time spent ordering the traced equations shows how it scales with their number.
+
+    $ python3 benchmark/microbenchmarks/tracing_mcm.py --layers 100 1000 10000
+"""
+import pennylane as qml
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+import catalyst.jax_tracer
+from catalyst import measure, qjit
+
+
+class SortTimer:
+    """Accumulate the time spent in ``sort_eqns`` and the number of equations it orders."""
+
+    def __init__(self, sort_eqns):
+        self.sort_eqns = sort_eqns
+        self.elapsed = 0.0
+        self.num_eqns = 0
+
+    def reset(self):
+        """Reset the accumulated statistics."""
+        self.elapsed = 0.0
+        self.num_eqns = 0
+
+    def __call__(self, eqns, *args, **kwargs):
+        result, elapsed = timed(self.sort_eqns, eqns, *args, **kwargs)
+        self.elapsed += elapsed
+        self.num_eqns += len(eqns)
+        return result
+
+
+def make_circuit(num_layers, num_wires):
+    """A circuit of ``num_layers`` layers, each with ``num_wires`` gates and one measurement."""
+
+    @qjit(target="jaxpr")
+    @qml.qnode(qml.device("lightning.qubit", wires=num_wires))
+    def circuit(x):
+        for layer in range(num_layers):
+            for wire in range(num_wires - 1):
+                qml.CNOT(wires=[wire, wire + 1])
+            qml.RX(x, wires=layer % num_wires)
+            measure(layer % num_wires)
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--layers", type=int, nargs="+", default=[100, 1000, 10000])
+    ap.add_argument("--wires", type=int, default=10, help="Number of qubits of the circuit")
+    a = ap.parse_args()
+
+    timer = SortTimer(catalyst.jax_tracer.sort_eqns)
+    catalyst.jax_tracer.sort_eqns = timer
+
+    table = Table(
+        ("layers", "d", 8), ("equations", "d"), ("capture [s]", ".3f"), ("sort_eqns [s]", ".3f")
+    )
+    for num_layers in a.layers:
+        circuit = make_circuit(num_layers, a.wires)
+        timer.reset()
+        _, elapsed = timed(circuit.capture, (0.5,))
+        table.row(num_layers, timer.num_eqns, elapsed, timer.elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the program capture time of wide circuits over the number of qubits.
+
+The circuit applies a fixed number of gates spread over all qubits, so that the capture time per
+gate should not depend on the width of the circuit. Part of the gates act on a dynamic wire, which
+exercises the tracking of dynamic wires in the quantum register.
+
+    $ python3 benchmark/microbenchmarks/tracing_wide.py --wires 10 100 1000 --gates 100000
+"""
+import pennylane as qml
+from catalyst_benchmark.timing import Table, make_parser, timed
+
+from catalyst import qjit
+
+
+def make_circuit(num_wires, num_gates, dynamic_every):
+    """A circuit of ``num_gates`` gates over ``num_wires`` qubits, where every ``dynamic_every``-th
+    gate acts on a dynamic wire."""
+
+    @qjit(target="jaxpr")
+    @qml.qnode(qml.device("lightning.qubit", wires=num_wires))
+    def circuit(x, w):
+        for i in range(num_gates):
+            if dynamic_every and i % dynamic_every == 0:
+                qml.RY(x, wires=w)
+            elif i % 2:
+                qml.CNOT(wires=[i % num_wires, (i + 1) % num_wires])
+            else:
+                qml.RX(x, wires=i % num_wires)
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def main():
+    """Entry point."""
+    ap = make_parser(__doc__)
+    ap.add_argument("--wires", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--gates", type=int, default=10000, help="Number of gates of the circuit")
+    ap.add_argument(
+        "--dynamic-every",
+        type=int,
+        default=100,
+        help="Apply every n-th gate on a dynamic wire, 0 for static wires only",
+    )
+    a = ap.parse_args()
+
+    table = Table(
+        ("wires", "d", 8), ("gates", "d", 8), ("capture [s]", ".3f"), ("per gate [us]", ".2f")
+    )
+    for num_wires in a.wires:
+        circuit = make_circuit(num_wires, a.gates, a.dynamic_every)
+        _, elapsed = timed(circuit.capture, (0.5, 0))
+        table.row(num_wires, a.gates, elapsed, 1e6 * elapsed / a.gates)
+
+
+if __name__ == "__main__":
+    main()
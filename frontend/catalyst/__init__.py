@@ -75,7 +75,7 @@ from catalyst.autograph import *
 from catalyst.autograph import __all__ as _autograph_functions
 from catalyst.compiler import CompileOptions
 from catalyst.debug.assertion import debug_assert
-from catalyst.jit import QJIT, qjit
+from catalyst.jit import QJIT, precompile, qjit
 from catalyst.passes.pass_api import pipeline
 from catalyst.utils.exceptions import (
     AutoGraphError,
@@ -166,6 +166,7 @@ while processing the following with AutoGraph:
 __all__ = (
     "qjit",
     "QJIT",
+    "precompile",
     "autograph_ignore_fallbacks",
     "autograph_strict_conversion",
     "AutoGraphError",
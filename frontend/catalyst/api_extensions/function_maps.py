@@ -21,6 +21,8 @@ additional dimensions to the inputs and outputs of a function.
 import copy
 import functools
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Any, Callable, Optional, Union
 
 import jax
@@ -43,6 +45,7 @@ def vmap(
     in_axes=0,
     out_axes=0,
     axis_size=None,
+    num_threads=None,
 ):  # pylint: disable=unused-argument
     """A :func:`~.qjit` compatible vectorizing map.
     Creates a function which maps an input function over argument axes.
@@ -56,6 +59,10 @@ def vmap(
         axis_size (int): An integer can be optionally provided to indicate the size of the
             axis to be mapped. If omitted, the size of the mapped axis will be inferred from
             the provided arguments.
+        num_threads (int): If provided, the batch is executed in parallel on a pool of
+            ``num_threads`` worker threads, rather than with a sequential loop. This mode is only
+            available outside of :func:`~.qjit`, and is intended to map an already qjit-compiled
+            function. See below for more details.
 
     Returns:
         Callable: Vectorized version of ``fn``.
@@ -127,6 +134,30 @@ def vmap(
 
         The ``out_axes`` parameter can be also used to specify the positions of the mapped axis
         in the output. ``out_axes`` is subject to the same modes as well.
+
+    .. details::
+        :title: Parallel execution
+
+        When ``num_threads`` is provided, the batch is split between a pool of worker threads. Each
+        worker executes ``fn`` on its share of the batch and writes the results into preallocated
+        output arrays. The first batch element is executed on the calling thread, which compiles
+        ``fn`` if it is a :func:`~.qjit` function that has not been compiled for these arguments
+        yet. The compiled program releases the Python GIL while it executes, and every worker
+        obtains its own instance of the quantum device from the runtime, so the simulations run
+        concurrently.
+
+        .. code-block:: python
+
+            @qjit
+            @qml.qnode(qml.device("lightning.qubit", wires=1))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                return qml.expval(qml.PauliZ(0))
+
+        >>> vmap(circuit, num_threads=4)(jnp.linspace(0, 1, 10000))
+
+        Parallel execution is not supported inside a :func:`~.qjit` function, where the mapped
+        function is compiled into a loop instead.
     """
 
     kwargs = copy.copy(locals())
@@ -155,6 +186,7 @@ class VmapCallable(CatalystCallable):
         axis_size (int): An integer can be optionally provided to indicate the size of the
             axis to be mapped. If omitted, the size of the mapped axis will be inferred from
             the provided arguments.
+        num_threads (int): Optional number of worker threads executing the batch in parallel.
 
     Raises:
         ValueError: Invalid ``in_axes``, ``out_axes``, and ``axis_size`` values.
@@ -166,6 +198,7 @@ class VmapCallable(CatalystCallable):
         in_axes: Union[int, Sequence[Any]],
         out_axes: Union[int, Sequence[Any]],
         axis_size: Optional[int],
+        num_threads: Optional[int] = None,
     ):
         functools.update_wrapper(self, fn)
         self.fn = fn
@@ -174,6 +207,7 @@ class VmapCallable(CatalystCallable):
         self.in_axes = in_axes
         self.out_axes = out_axes
         self.axis_size = axis_size
+        self.num_threads = num_threads
         self._validate_configuration()
 
         super().__init__("fn")
@@ -192,29 +226,30 @@ class VmapCallable(CatalystCallable):
                 f"but got {self.out_axes}"
             )
 
+        if self.num_threads is not None and (
+            not isinstance(self.num_threads, int) or self.num_threads < 1
+        ):
+            raise ValueError(
+                f"Invalid 'num_threads'; it must be a positive integer, but got {self.num_threads}"
+            )
+
     def __call__(self, *args, **kwargs):
         """Vectorization around the hybrid program using catalyst.for_loop"""
 
+        if self.num_threads is not None:
+            if EvaluationContext.is_tracing():
+                raise ValueError(
+                    "Parallel execution with 'num_threads' is not supported inside a qjit "
+                    "function. Apply vmap to the qjit-compiled function instead."
+                )
+            return self._parallel_call(*args, **kwargs)
+
         # Dispatch to jax.vmap when it is called outside qjit.
         if not EvaluationContext.is_tracing():
             return jax.vmap(self.fn, self.in_axes, self.out_axes)(*args, **kwargs)
 
         args_flat, args_tree = tree_flatten(args)
-        in_axes_flat, _ = tree_flatten(self.in_axes, is_leaf=lambda x: x is None)
-
-        # Check the validity of the input arguments w.r.t. in_axes
-        in_axes_deep_struct = tree_structure(self.in_axes, is_leaf=lambda x: x is None)
-        args_deep_struct = tree_structure(args, is_leaf=lambda x: x is None)
-        if not isinstance(self.in_axes, int) and in_axes_deep_struct != args_deep_struct:
-            raise ValueError(
-                "Invalid 'in_axes'; it must be an int or match the length of positional "
-                f"arguments, but got {in_axes_deep_struct} axis specifiers "
-                f"and {args_deep_struct} arguments."
-            )
-        if isinstance(self.in_axes, int):
-            in_axes_flat = [
-                self.in_axes,
-            ] * len(args_flat)
+        in_axes_flat = self._get_in_axes_flat(args, args_flat)
 
         batch_size = self._get_batch_size(args_flat, in_axes_flat, self.axis_size)
         batch_loc = self._get_batch_loc(in_axes_flat)
@@ -235,24 +270,8 @@ class VmapCallable(CatalystCallable):
         init_result_flat = [jnp.zeros(shape=shape.shape, dtype=shape.dtype) for shape, _ in shapes]
         init_result = tree_unflatten(init_result_tree, init_result_flat)
 
-        # Check the validity of the output w.r.t. out_axes
-        out_axes_deep_struct = tree_structure(self.out_axes, is_leaf=lambda x: x is None)
-        init_result_deep_struct = tree_structure(init_result, is_leaf=lambda x: x is None)
-        if not isinstance(self.out_axes, int) and out_axes_deep_struct != init_result_deep_struct:
-            raise ValueError(
-                "Invalid 'out_axes'; it must be an int or match "
-                "the number of function results, but got "
-                f"{out_axes_deep_struct} axis specifiers and {init_result_deep_struct} results."
-            )
-
         num_axes_out = len(init_result_flat)
-
-        if isinstance(self.out_axes, int):
-            out_axes_flat = [
-                self.out_axes,
-            ] * num_axes_out
-        else:
-            out_axes_flat, _ = tree_flatten(self.out_axes, is_leaf=lambda x: x is None)
+        out_axes_flat = self._get_out_axes_flat(init_result, num_axes_out)
 
         out_loc = self._get_batch_loc(out_axes_flat)
 
@@ -294,6 +313,140 @@ class VmapCallable(CatalystCallable):
         # Unflatten batched_result before return
         return tree_unflatten(init_result_tree, batched_result_list)
 
+    def _parallel_call(self, *args, **kwargs):
+        """Vectorization by executing the function on a pool of worker threads"""
+
+        # pylint: disable=import-outside-toplevel
+        from catalyst.jit import QJIT
+
+        args_flat, args_tree = tree_flatten(args)
+        in_axes_flat = self._get_in_axes_flat(args, args_flat)
+        batch_size = self._get_batch_size(args_flat, in_axes_flat, self.axis_size)
+        batch_loc = self._get_batch_loc(in_axes_flat)
+
+        # Move batch axes to the front once, so that each batch element is a cheap view
+        for loc in batch_loc:
+            args_flat[loc] = np.moveaxis(np.asarray(args_flat[loc]), in_axes_flat[loc], 0)
+
+        def get_fn_args(i):
+            fn_args_flat = args_flat.copy()
+            for loc in batch_loc:
+                fn_args_flat[loc] = args_flat[loc][i]
+            return tree_unflatten(args_tree, fn_args_flat)
+
+        with ExitStack() as stack:
+            if isinstance(self.fn, QJIT):
+                run, result_tree, shared_object = self.fn.get_runner(get_fn_args(0), kwargs)
+                stack.callback(shared_object.release)
+                # Keep the runtime initialized for the whole batch, so that the workers reuse
+                # the devices of the execution context instead of re-creating them.
+                stack.enter_context(shared_object)
+                first_result_flat = run(*get_fn_args(0))
+            else:
+
+                def run(*fn_args):
+                    return tree_flatten(self.fn(*fn_args, **kwargs))[0]
+
+                first_result_flat, result_tree = tree_flatten(self.fn(*get_fn_args(0), **kwargs))
+
+            # Results are written in place into preallocated buffers
+            first_result_flat = [np.asarray(r) for r in first_result_flat]
+            batched_result_list = [
+                np.empty((batch_size, *r.shape), dtype=r.dtype) for r in first_result_flat
+            ]
+            for buffer, r in zip(batched_result_list, first_result_flat):
+                buffer[0] = r
+
+            def run_range(start, stop):
+                for i in range(start, stop):
+                    for buffer, r in zip(batched_result_list, run(*get_fn_args(i))):
+                        buffer[i] = r
+
+            bounds = np.linspace(1, batch_size, min(self.num_threads, batch_size) + 1, dtype=int)
+            with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+                futures = [
+                    executor.submit(run_range, start, stop)
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                    if start < stop
+                ]
+                for future in futures:
+                    future.result()
+
+        result = tree_unflatten(result_tree, batched_result_list)
+        num_axes_out = len(batched_result_list)
+        out_axes_flat = self._get_out_axes_flat(result, num_axes_out)
+
+        # Support out_axes on dim > 0
+        for loc in self._get_batch_loc(out_axes_flat):
+            if ax := out_axes_flat[loc]:
+                batched_result_list[loc] = np.moveaxis(batched_result_list[loc], 0, ax)
+
+        batched_result_list = [jnp.asarray(r) for r in batched_result_list]
+        return tree_unflatten(result_tree, batched_result_list)
+
+    def _get_in_axes_flat(self, args, args_flat):
+        """Get the flattened list of in-axes matching the flattened arguments.
+
+        Args:
+            args (Tuple): Positional arguments.
+            args_flat (List): Flatten list of arguments.
+
+        Returns:
+            List: Flattened list of in-axes including `None` elements.
+
+        Raises:
+            ValueError: The structure of `in_axes` must match the arguments.
+        """
+
+        # Check the validity of the input arguments w.r.t. in_axes
+        in_axes_deep_struct = tree_structure(self.in_axes, is_leaf=lambda x: x is None)
+        args_deep_struct = tree_structure(args, is_leaf=lambda x: x is None)
+        if not isinstance(self.in_axes, int) and in_axes_deep_struct != args_deep_struct:
+            raise ValueError(
+                "Invalid 'in_axes'; it must be an int or match the length of positional "
+                f"arguments, but got {in_axes_deep_struct} axis specifiers "
+                f"and {args_deep_struct} arguments."
+            )
+        if isinstance(self.in_axes, int):
+            return [
+                self.in_axes,
+            ] * len(args_flat)
+
+        in_axes_flat, _ = tree_flatten(self.in_axes, is_leaf=lambda x: x is None)
+        return in_axes_flat
+
+    def _get_out_axes_flat(self, result, num_axes_out):
+        """Get the flattened list of out-axes matching the flattened results.
+
+        Args:
+            result (Any): Results of a single application of the function.
+            num_axes_out (int): Number of flattened results.
+
+        Returns:
+            List: Flattened list of out-axes including `None` elements.
+
+        Raises:
+            ValueError: The structure of `out_axes` must match the results.
+        """
+
+        # Check the validity of the output w.r.t. out_axes
+        out_axes_deep_struct = tree_structure(self.out_axes, is_leaf=lambda x: x is None)
+        result_deep_struct = tree_structure(result, is_leaf=lambda x: x is None)
+        if not isinstance(self.out_axes, int) and out_axes_deep_struct != result_deep_struct:
+            raise ValueError(
+                "Invalid 'out_axes'; it must be an int or match "
+                "the number of function results, but got "
+                f"{out_axes_deep_struct} axis specifiers and {result_deep_struct} results."
+            )
+
+        if isinstance(self.out_axes, int):
+            return [
+                self.out_axes,
+            ] * num_axes_out
+
+        out_axes_flat, _ = tree_flatten(self.out_axes, is_leaf=lambda x: x is None)
+        return out_axes_flat
+
     def _get_batch_loc(self, axes_flat):
         """
         Get the list of mapping locations in the flattened list of in-axes or out-axes.
@@ -14,15 +14,18 @@
 
 """This module contains classes to manage compiled functions and their underlying resources."""
 
+import atexit
 import ctypes
+import functools
 import logging
+import threading
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Any, Optional, Tuple
 
-import jax.numpy as jnp
+import jax
 import numpy as np
 from jax.interpreters import mlir
-from jax.tree_util import PyTreeDef, tree_flatten, tree_unflatten
+from jax.tree_util import PyTreeDef, tree_flatten, tree_map, tree_unflatten
 from mlir_quantum.runtime import (
     as_ctype,
     make_nd_memref_descriptor,
@@ -40,31 +43,47 @@ from catalyst.tracing.type_signatures import (
 from catalyst.utils import wrapper
 from catalyst.utils.c_template import get_template, mlir_type_to_numpy_type
 from catalyst.utils.filesystem import Directory
-from catalyst.utils.jnp_to_memref import get_ranked_memref_descriptor
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Default number of function versions kept per combination of PyTreeDefs and static arguments.
+DEFAULT_MAX_VERSIONS = 8
+
 
 class SharedObjectManager:
     """Shared object manager.
 
     Manages the life time of the shared object. When is it loaded, when to close it.
 
+    In a persistent session, the runtime execution context is initialized once when the shared
+    object is opened and only finalized when it is closed, or at interpreter exit. Executions still
+    go through ``setup`` and ``teardown``, but they reuse the existing context, including its
+    devices and their loaded backend libraries, instead of creating new ones.
+
+    Executions which may outlive the owner of the shared object, such as asynchronous calls, pin it
+    with ``acquire`` and ``release``. Closing a pinned shared object is deferred until it has been
+    released by all such executions.
+
     Args:
         shared_object_file (str): path to shared object containing compiled function
         func_name (str): name of compiled function
+        persistent (bool): whether to keep the runtime initialized between executions
     """
 
     @debug_logger_init
-    def __init__(self, shared_object_file, func_name):
+    def __init__(self, shared_object_file, func_name, persistent=False):
         self.shared_object_file = shared_object_file
         self.shared_object = None
         self.func_name = func_name
+        self.persistent = persistent
         self.function = None
         self.setup = None
         self.teardown = None
         self.mem_transfer = None
+        self._users = 0
+        self._close_pending = False
+        self._lock = threading.Lock()
         self.open()
 
     def open(self):
@@ -72,8 +91,38 @@ class SharedObjectManager:
         self.shared_object = ctypes.CDLL(self.shared_object_file)
         self.function, self.setup, self.teardown, self.mem_transfer = self.load_symbols()
 
+        if self.persistent:
+            self.initialize()
+            atexit.register(self.close)
+
+    def acquire(self):
+        """Keep the shared object loaded until a matching call to ``release``."""
+        with self._lock:
+            self._users += 1
+
+    def release(self):
+        """Release the shared object, closing it if a close was requested while it was in use."""
+        with self._lock:
+            self._users -= 1
+            close = self._users == 0 and self._close_pending
+
+        if close:
+            self.close()
+
     def close(self):
         """Close the shared object"""
+        with self._lock:
+            self._close_pending = self._users > 0
+            if self._close_pending:
+                return
+
+        if self.shared_object is None:
+            return
+
+        if self.persistent:
+            atexit.unregister(self.close)
+            self.finalize()
+
         self.function = None
         self.setup = None
         self.teardown = None
@@ -82,6 +131,7 @@ class SharedObjectManager:
         dlclose.argtypes = [ctypes.c_void_p]
         # pylint: disable=protected-access
         dlclose(self.shared_object._handle)
+        self.shared_object = None
 
     def load_symbols(self):
         """Load symbols necessary for for execution of the compiled function.
@@ -112,16 +162,156 @@ class SharedObjectManager:
 
         return function, setup, teardown, mem_transfer
 
-    def __enter__(self):
+    def initialize(self):
+        """Initialize the runtime execution context of the compiled function."""
         params_to_setup = [b"jitted-function"]
         argc = len(params_to_setup)
         array_of_char_ptrs = (ctypes.c_char_p * len(params_to_setup))()
         array_of_char_ptrs[:] = params_to_setup
         self.setup(ctypes.c_int(argc), array_of_char_ptrs)
+
+    def finalize(self):
+        """Finalize the runtime execution context of the compiled function."""
+        self.teardown()
+
+    def __enter__(self):
+        self.initialize()
         return self
 
     def __exit__(self, _type, _value, _traceback):
-        self.teardown()
+        self.finalize()
+
+
+@functools.lru_cache(maxsize=None)
+def _memref_descriptor_type(rank):
+    """Get a ctypes structure type which is ABI compatible with a ranked memref descriptor.
+
+    Unlike MLIR's descriptors, the type does not depend on the element type, which allows the same
+    descriptor to be reused for arrays of any dtype. Pointers are stored as plain addresses so that
+    they can be updated without constructing ctypes pointer objects.
+    """
+    fields = [
+        ("allocated", ctypes.c_void_p),
+        ("aligned", ctypes.c_void_p),
+        ("offset", ctypes.c_longlong),
+    ]
+    if rank > 0:
+        fields += [("shape", ctypes.c_longlong * rank), ("strides", ctypes.c_longlong * rank)]
+
+    return type(f"MemRefDescriptor{rank}D", (ctypes.Structure,), {"_fields_": fields})
+
+
+# JAX arrays of at least this many bytes are exchanged through DLPack, which never copies buffers
+# residing in host memory. Smaller arrays go through ``np.asarray``, as copying them is cheaper than
+# the DLPack exchange.
+DLPACK_MIN_NBYTES = 1 << 16
+
+
+def _is_host_array(array):
+    """Whether a JAX array resides in host memory, i.e. on a single CPU device."""
+    sharding = array.sharding
+    if not isinstance(sharding, jax.sharding.SingleDeviceSharding):
+        return False
+    return next(iter(sharding.device_set)).platform == "cpu"
+
+
+def _as_memref_buffer(arg):
+    """Obtain a NumPy array viewing the data of an argument, to be passed to a compiled function.
+
+    The data of JAX arrays in host memory is shared rather than copied. The returned array keeps the
+    underlying buffer alive, and is only copied if its layout cannot be described by a memref, that
+    is if its elements are misaligned, its byte order is not native, or its strides are not
+    multiples of the element size.
+
+    Args:
+        arg: a flattened argument, e.g. a JAX array, NumPy array or Python scalar
+
+    Returns:
+        np.ndarray: an array compatible with the memref ABI
+    """
+    if isinstance(arg, np.ndarray):
+        array = arg
+    elif (
+        isinstance(arg, jax.Array)
+        and arg.size * arg.dtype.itemsize >= DLPACK_MIN_NBYTES
+        and _is_host_array(arg)
+    ):
+        array = np.from_dlpack(arg)
+    else:
+        array = np.asarray(arg)
+
+    dtype = array.dtype
+    if (
+        array.flags.aligned
+        and dtype.isnative
+        and all(stride % dtype.itemsize == 0 for stride in array.strides)
+    ):
+        return array
+
+    return np.ascontiguousarray(array, dtype=dtype.newbyteorder("="))
+
+
+def _as_donated_buffer(arg):
+    """Obtain a NumPy array holding the data of a donated argument, which the compiled function may
+    write to. Only writable NumPy arrays are donated without a copy, as JAX arrays are immutable.
+
+    Args:
+        arg: a flattened donated argument
+
+    Returns:
+        np.ndarray: a writable array compatible with the memref ABI
+    """
+    array = _as_memref_buffer(arg)
+    if not array.flags.writeable:
+        array = np.array(array)
+    return array
+
+
+class CallingStub:
+    """Precomputed C ABI argument structure for a given list of argument ranks.
+
+    The structure and the memref descriptors it points to are allocated once. Invoking the compiled
+    function then only requires writing the data pointers, shapes and strides of the arguments into
+    the existing descriptors.
+
+    Args:
+        ranks (Tuple[int]): the rank of each flattened argument
+    """
+
+    def __init__(self, ranks):
+        self.descriptors = [_memref_descriptor_type(rank)() for rank in ranks]
+
+        class CompiledFunctionArgValue(ctypes.Structure):
+            """Programmatically create a structure which holds tensors of varying base types."""
+
+            _fields_ = [
+                ("f" + str(i), ctypes.POINTER(type(descriptor)))
+                for i, descriptor in enumerate(self.descriptors)
+            ]
+
+        self.arg_value = CompiledFunctionArgValue(*map(ctypes.pointer, self.descriptors))
+        self.arg_value_pointer = ctypes.pointer(self.arg_value)
+
+    def fill(self, numpy_args):
+        """Point the memref descriptors to the given arrays.
+
+        Args:
+            numpy_args (List[np.ndarray]): flattened arguments, matching the ranks of the stub
+
+        Returns:
+            a pointer to a CompiledFunctionArgValue
+        """
+        for descriptor, array in zip(self.descriptors, numpy_args):
+            address = array.ctypes.data
+            descriptor.allocated = address
+            descriptor.aligned = address
+            if array.ndim > 0:
+                descriptor.shape[:] = array.shape
+                # Numpy strides are expressed in bytes, whereas MLIR uses a number of elements.
+                itemsize = array.itemsize
+                descriptor.strides[:] = [stride // itemsize for stride in array.strides]
+
+        return self.arg_value_pointer
 
 
 class CompiledFunction:
@@ -139,37 +329,40 @@ class CompiledFunction:
     def __init__(
         self, shared_object_file, func_name, restype, out_type, compile_options
     ):  # pylint: disable=too-many-arguments
-        self.shared_object = SharedObjectManager(shared_object_file, func_name)
+        self.shared_object = SharedObjectManager(
+            shared_object_file, func_name, compile_options.persistent_session
+        )
         self.compile_options = compile_options
-        self.return_type_c_abi = None
+        self.return_desc = None
+        # The ABI structures are written on every call, so each thread gets its own.
+        self._thread_abi = threading.local()
         self.func_name = func_name
         self.restype = restype
         self.out_type = out_type
 
     @staticmethod
-    def _exec(shared_object, has_return, out_type, numpy_dict, *args):
+    def _exec(shared_object, result_desc, out_type, numpy_dict, *args):
         """Execute the compiled function with arguments ``*args``.
 
         Args:
             lib: Shared object
-            has_return: whether the function returns a value or not
+            result_desc: the type of the return value structure, or None if there are no results
             out_type: Jaxpr output type holding information about implicit outputs
             numpy_dict: dictionary of numpy arrays of buffers from the runtime
             *args: arguments to the function
 
         Returns:
-            the return values computed by the function or None if the function has no results
+            the return values computed by the function as NumPy arrays owning the buffers allocated
+            by the runtime, or None if the function has no results
         """
 
         with shared_object as lib:
-            result_desc = type(args[0].contents) if has_return else None
             retval = wrapper.wrap(lib.function, args, result_desc, lib.mem_transfer, numpy_dict)
 
         if out_type is not None:
             keep_outputs = [k for _, k in out_type]
             retval = [r for (k, r) in zip(keep_outputs, retval) if k]
 
-        retval = [jnp.asarray(arr) for arr in retval]
         return retval
 
     @staticmethod
@@ -214,10 +407,21 @@ class CompiledFunction:
         shape = mlir.ir.RankedTensorType(mlir_tensor_type).shape
         return len(shape) if shape else 0
 
+    @property
+    def calling_stubs(self):
+        """Dict[Tuple[int], CallingStub]: the calling stubs of the current thread, indexed by the
+        ranks of the flattened arguments."""
+        try:
+            return self._thread_abi.calling_stubs
+        except AttributeError:
+            self._thread_abi.calling_stubs = {}
+            return self._thread_abi.calling_stubs
+
     def getCompiledReturnValueType(self, mlir_tensor_types):
         """Compute the type for the return value and memoize it
 
-        This type does not need to be recomputed as it is generated once per compiled function.
+        This type does not need to be recomputed as it is generated once per compiled function. The
+        return value itself is allocated once per thread.
         Args:
             mlir_tensor_types: a list of MLIR tensor types which match the expected return type
         Returns:
@@ -225,8 +429,20 @@ class CompiledFunction:
             fields match the expected return types
         """
 
-        if self.return_type_c_abi is not None:
-            return self.return_type_c_abi
+        return_value_pointer = getattr(self._thread_abi, "return_value_pointer", None)
+        if return_value_pointer is not None:
+            return return_value_pointer
+
+        if self.return_desc is None:
+            self.return_desc = self._make_return_value_type(mlir_tensor_types)
+
+        return_value_pointer = ctypes.pointer(self.return_desc())
+        self._thread_abi.return_value_pointer = return_value_pointer
+        return return_value_pointer
+
+    @staticmethod
+    def _make_return_value_type(mlir_tensor_types):
+        """Create the structure type for the return value of the compiled function."""
 
         error_msg = """This function must be called with a non-zero length list as an argument."""
         assert mlir_tensor_types, error_msg
@@ -252,10 +468,7 @@ class CompiledFunction:
             _etypes_ = etypes
             _sizes_ = sizes
 
-        return_value = CompiledFunctionReturnValue()
-        return_value_pointer = ctypes.pointer(return_value)
-        self.return_type_c_abi = return_value_pointer
-        return self.return_type_c_abi
+        return CompiledFunctionReturnValue
 
     def restype_to_memref_descs(self, mlir_tensor_types):
         """Converts the return type to a compatible type for the expected ABI.
@@ -272,7 +485,10 @@ class CompiledFunction:
         """Convert ``args`` to memref descriptors.
 
         Besides converting the arguments to memrefs, it also prepares the return value. To respect
-        the ABI, the return value is changed to a pointer and passed as the first parameter.
+        the ABI, the return value is changed to a pointer and passed as the first parameter. The
+        argument descriptors are provided by a ``CallingStub`` which is cached per thread and
+        argument ranks, so that repeated calls do not allocate new ctypes structures. Arguments
+        residing in host memory are passed without copying their data.
 
         Args:
             restype: the type of restype is a ``CompiledFunctionReturnValue``
@@ -285,39 +501,20 @@ class CompiledFunction:
                 numpy arrays.
 
         """
-        numpy_arg_buffer = []
         return_value_pointer = ctypes.POINTER(ctypes.c_int)()  # This is the null pointer
 
         if restype:
             return_value_pointer = self.restype_to_memref_descs(restype)
 
-        c_abi_args = []
-
-        args_data, args_shape = tree_flatten((args, kwargs))
-
-        for arg in args_data:
-            numpy_arg = np.asarray(arg)
-            numpy_arg_buffer.append(numpy_arg)
-            c_abi_ptr = ctypes.pointer(get_ranked_memref_descriptor(numpy_arg))
-            c_abi_args.append(c_abi_ptr)
+        args_data, _ = tree_flatten((args, kwargs))
+        numpy_arg_buffer = [_as_memref_buffer(arg) for arg in args_data]
 
-        args = tree_unflatten(args_shape, c_abi_args)
+        ranks = tuple(arr.ndim for arr in numpy_arg_buffer)
+        stub = self.calling_stubs.get(ranks)
+        if stub is None:
+            stub = self.calling_stubs[ranks] = CallingStub(ranks)
 
-        class CompiledFunctionArgValue(ctypes.Structure):
-            """Programmatically create a structure which holds tensors of varying base types."""
-
-            _fields_ = [("f" + str(i), type(t)) for i, t in enumerate(c_abi_args)]
-
-            def __init__(self, c_abi_args):
-                for ft_tuple, c_abi_arg in zip(CompiledFunctionArgValue._fields_, c_abi_args):
-                    f = ft_tuple[0]
-                    setattr(self, f, c_abi_arg)
-
-        arg_value_pointer = ctypes.POINTER(ctypes.c_int)()
-
-        if len(args) > 0:
-            arg_value = CompiledFunctionArgValue(c_abi_args)
-            arg_value_pointer = ctypes.pointer(arg_value)
+        arg_value_pointer = stub.fill(numpy_arg_buffer)
 
         c_abi_args = [return_value_pointer] + [arg_value_pointer]
         return c_abi_args, numpy_arg_buffer
@@ -329,6 +526,13 @@ class CompiledFunction:
         return get_template(self.func_name, self.restype, *buffer)
 
     def __call__(self, *args, **kwargs):
+        donate_argnums = self.compile_options.donate_argnums
+        if donate_argnums:
+            args = tuple(
+                tree_map(_as_donated_buffer, arg) if idx in donate_argnums else arg
+                for idx, arg in enumerate(args)
+            )
+
         static_argnums = self.compile_options.static_argnums
         dynamic_args = filter_static_args(args, static_argnums)
 
@@ -344,12 +548,18 @@ class CompiledFunction:
 
         result = CompiledFunction._exec(
             self.shared_object,
-            self.restype,
+            self.return_desc,
             self.out_type,
             numpy_dict,
             *abi_args,
         )
 
+        if self.compile_options.output_format == "jax":
+            # The runtime allocates buffers aligned such that JAX arrays wrap them without a copy.
+            # A single device_put of the whole list is cheaper than converting each output
+            # separately.
+            result = jax.device_put(result)
+
         return result
 
 
@@ -357,7 +567,7 @@ class CompiledFunction:
 class CacheKey:
     """A key by which to identify entries in the compiled function cache.
 
-    The cache only rembers one compiled function for each possible combination of:
+    The cache remembers a bounded number of compiled functions for each possible combination of:
      - dynamic argument PyTree metadata
      - static argument values
     """
@@ -377,13 +587,17 @@ class CacheEntry:
     """An entry in the compiled function cache.
 
     For each compiled function, the cache stores the dynamic argument signature, the output PyTree
-    definition, as well as the workspace in which compilation takes place.
+    definition and abstract values, as well as the workspace in which compilation takes place. Once
+    the function has been used with JAX transformations, the entry also holds its JAX wrapper,
+    along with the derivatives compiled for this signature.
     """
 
     compiled_fn: CompiledFunction
     signature: Tuple
     out_treedef: PyTreeDef
     workspace: Directory
+    out_avals: Optional[Tuple] = None
+    jaxed_function: Optional[Any] = None
 
 
 class CompilationCache:
@@ -400,14 +614,24 @@ class CompilationCache:
     signature via JAX type promotion rules. Additional leniency is provided in the shape of
     dynamic arguments in accordance with the abstracted axis specification.
 
-    To avoid excess promotion checks, only one function version is stored at a time for a given
-    combination of PyTreeDefs and static arguments.
+    Multiple function versions (specializations) are stored for a given combination of PyTreeDefs
+    and static arguments, such as versions for different precisions or array shapes. A full match
+    is always preferred over a version that requires promotion, and among the latter the version
+    with the narrowest dtypes is chosen. Once more than ``max_versions`` versions exist for a
+    combination, the least recently used version is evicted and its shared object is closed.
+
+    Args:
+        static_argnums (Tuple[int]): indices of static arguments
+        abstracted_axes: the abstracted axes specification of the function
+        max_versions (int): maximum number of versions kept per PyTreeDef and static arguments
     """
 
     @debug_logger_init
-    def __init__(self, static_argnums, abstracted_axes):
+    def __init__(self, static_argnums, abstracted_axes, max_versions=DEFAULT_MAX_VERSIONS):
         self.static_argnums = static_argnums
         self.abstracted_axes = abstracted_axes
+        self.max_versions = max_versions
+        # Each key maps to its versions, ordered from least to most recently used.
         self.cache = {}
 
     def get_function_status_and_key(self, args):
@@ -423,19 +647,33 @@ class CompilationCache:
         Returns:
             TypeCompatibility
             CacheKey | None
+            int | None: index of the best matching version under the key
         """
         if not self.cache:
-            return TypeCompatibility.NEEDS_COMPILATION, None
+            return TypeCompatibility.NEEDS_COMPILATION, None, None
 
         flat_runtime_sig, treedef, static_args = get_decomposed_signature(args, self.static_argnums)
         key = CacheKey(treedef, static_args)
         if key not in self.cache:
-            return TypeCompatibility.NEEDS_COMPILATION, None
+            return TypeCompatibility.NEEDS_COMPILATION, None, None
 
-        entry = self.cache[key]
         runtime_signature = tree_unflatten(treedef, flat_runtime_sig)
-        action = typecheck_signatures(entry.signature, runtime_signature, self.abstracted_axes)
-        return action, key
+
+        best_action, best_idx, best_width = TypeCompatibility.NEEDS_COMPILATION, None, None
+        # Visit the most recently used versions first, so that they win any ties.
+        for idx in reversed(range(len(self.cache[key]))):
+            entry = self.cache[key][idx]
+            action = typecheck_signatures(entry.signature, runtime_signature, self.abstracted_axes)
+
+            if action == TypeCompatibility.CAN_SKIP_PROMOTION:
+                return action, key, idx
+
+            if action == TypeCompatibility.NEEDS_PROMOTION:
+                width = _signature_width(entry.signature)
+                if best_width is None or width < best_width:
+                    best_action, best_idx, best_width = action, idx, width
+
+        return best_action, key, best_idx
 
     def lookup(self, args):
         """Get a function (if present) that matches the provided argument signature. Also computes
@@ -448,17 +686,22 @@ class CompilationCache:
             CacheEntry | None: the matched cache entry
             bool: whether the matched entry requires argument promotion
         """
-        action, key = self.get_function_status_and_key(args)
+        action, key, idx = self.get_function_status_and_key(args)
 
         if action == TypeCompatibility.NEEDS_COMPILATION:
             return None, None
-        elif action == TypeCompatibility.NEEDS_PROMOTION:
-            return self.cache[key], True
+
+        # Mark the version as most recently used.
+        entry = self.cache[key].pop(idx)
+        self.cache[key].append(entry)
+
+        if action == TypeCompatibility.NEEDS_PROMOTION:
+            return entry, True
         else:
             assert action == TypeCompatibility.CAN_SKIP_PROMOTION
-            return self.cache[key], False
+            return entry, False
 
-    def insert(self, fn, args, out_treedef, workspace):
+    def insert(self, fn, args, out_treedef, workspace, out_avals=None):
         """Inserts the provided function into the cache.
 
         Args:
@@ -466,6 +709,10 @@ class CompilationCache:
             args (Iterable): arguments to determine cache key and additional metadata from
             out_treedef (PyTreeDef): the output shape of the function
             workspace (Directory): directory where compilation artifacts are stored
+            out_avals (Tuple): the abstract values of the flattened results of the function
+
+        Returns:
+            CacheEntry: the inserted cache entry
         """
         assert isinstance(fn, CompiledFunction)
 
@@ -473,9 +720,25 @@ class CompilationCache:
         signature = tree_unflatten(treedef, flat_signature)
 
         key = CacheKey(treedef, static_args)
-        entry = CacheEntry(fn, signature, out_treedef, workspace)
-        self.cache[key] = entry
+        entry = CacheEntry(fn, signature, out_treedef, workspace, out_avals)
+        versions = self.cache.setdefault(key, [])
+        versions.append(entry)
+
+        while len(versions) > self.max_versions:
+            evicted = versions.pop(0)
+            evicted.compiled_fn.shared_object.close()
+
+        return entry
 
     def clear(self):
         """Clear all previous compiled functions"""
+        for versions in self.cache.values():
+            for entry in versions:
+                entry.compiled_fn.shared_object.close()
         self.cache.clear()
+
+
+def _signature_width(signature):
+    """Total number of bytes per element across a signature, used to rank promotion targets."""
+    flat_signature, _ = tree_flatten(signature)
+    return sum(np.dtype(aval.dtype).itemsize for aval in flat_signature)
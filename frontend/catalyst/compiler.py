@@ -16,6 +16,8 @@ MLIR/LLVM representations.
 """
 import glob
 import importlib
+import io
+import json
 import logging
 import os
 import pathlib
@@ -28,8 +30,10 @@ import warnings
 from os import path
 from typing import List, Optional
 
+from catalyst.debug.instruments import instrument_step, profiling_passes, report_pass_profile
 from catalyst.logging import debug_logger, debug_logger_init
 from catalyst.pipelines import CompileOptions, KeepIntermediateLevel
+from catalyst.utils.disk_cache import DEFAULT_MAX_SIZE, DiskCache
 from catalyst.utils.exceptions import CompileError
 from catalyst.utils.filesystem import Directory
 from catalyst.utils.runtime_environment import get_cli_path, get_lib_path
@@ -85,15 +89,7 @@ class LinkerDriver:
         mlir_lib_path = get_lib_path("llvm", "MLIR_LIB_DIR")
         rt_lib_path = get_lib_path("runtime", "RUNTIME_LIB_DIR")
 
-        # Adds RUNTIME_LIB_DIR to the Python system path to allow the catalyst_callback_registry
-        # to be importable.
-        sys.path.append(get_lib_path("runtime", "RUNTIME_LIB_DIR"))
-        import catalyst_callback_registry as registry  # pylint: disable=import-outside-toplevel
-
-        # We use MLIR's C runner utils library in the registry.
-        # In order to be able to dlopen that library we need to know the path
-        # So we set the path here.
-        registry.set_mlir_lib_path(mlir_lib_path)
+        LinkerDriver.configure_callback_registry()
 
         lib_path_flags = [
             f"-Wl,-rpath,{mlir_lib_path}",
@@ -178,6 +174,22 @@ class LinkerDriver:
 
         return default_flags
 
+    @staticmethod
+    @debug_logger
+    def configure_callback_registry():
+        """Prepare the callback registry used by compiled programs at run time."""
+        mlir_lib_path = get_lib_path("llvm", "MLIR_LIB_DIR")
+
+        # Adds RUNTIME_LIB_DIR to the Python system path to allow the catalyst_callback_registry
+        # to be importable.
+        sys.path.append(get_lib_path("runtime", "RUNTIME_LIB_DIR"))
+        import catalyst_callback_registry as registry  # pylint: disable=import-outside-toplevel
+
+        # We use MLIR's C runner utils library in the registry.
+        # In order to be able to dlopen that library we need to know the path
+        # So we set the path here.
+        registry.set_mlir_lib_path(mlir_lib_path)
+
     @staticmethod
     def _get_compiler_fallback_order(fallback_compilers):
         """Compiler fallback order"""
@@ -354,6 +366,9 @@ def _options_to_cli_flags(options):
     if options.async_qnodes:  # pragma: nocover
         extra_args += ["--async-qnodes"]
 
+    if options.opt_level != 2:
+        extra_args += [("--opt-level", options.opt_level)]
+
     return extra_args
 
 
@@ -385,16 +400,21 @@ class Compiler:
         self.options = options if options is not None else CompileOptions()
 
     @debug_logger
-    def get_cli_command(self, tmp_infile_name, output_ir_name, module_name, workspace):
+    def get_cli_command(
+        self, tmp_infile_name, output_ir_name, module_name, workspace, pass_profile_name=None
+    ):
         """Prepare the command to run the Catalyst CLI to compile the file.
 
         Args:
             module_name (str): Module name to use for naming
             workspace (Directory): directory that holds output files and/or debug dumps.
+            pass_profile_name (Optional[str]): file to write the time spent in each pass to.
         Returns:
             cmd (str): The command to be executed.
         """
         opts = _options_to_cli_flags(self.options)
+        if pass_profile_name:
+            opts += [("--pass-profile", pass_profile_name)]
         cmd = _get_catalyst_cli_cmd(
             ("-o", output_ir_name),
             ("--module-name", module_name),
@@ -407,10 +427,10 @@ class Compiler:
 
     @debug_logger
     def run_from_ir(self, ir: str, module_name: str, workspace: Directory):
-        """Compile a shared object from a textual IR (MLIR or LLVM).
+        """Compile a shared object from a textual IR (MLIR or LLVM) or MLIR bytecode.
 
         Args:
-            ir (str): Textual MLIR to be compiled
+            ir (bytes | str): MLIR bytecode or textual IR to be compiled
             module_name (str): Module name to use for naming
             workspace (Directory): directory that holds output files and/or debug dumps.
 
@@ -428,23 +448,72 @@ class Compiler:
             self.options.lower_to_llvm
         ), "lower_to_llvm must be set to True in order to compile to a shared object"
 
+        disk_cache = self.get_disk_cache()
+        if disk_cache is not None:
+            cache_key = self.get_disk_cache_key(ir, module_name)
+            cached_object = disk_cache.load(cache_key, workspace)
+            if cached_object is not None:
+                # Linking is skipped, but its run time side effects are still required.
+                LinkerDriver.configure_callback_registry()
+                if self.options.verbose:
+                    print(f"[LIB] Loaded {cached_object} from cache", file=self.options.logfile)
+                return str(pathlib.Path(cached_object).absolute()), None
+
         if self.options.verbose:
             print(f"[LIB] Running compiler driver in {workspace}", file=self.options.logfile)
 
+        # Plugins are loaded by the command line interface of the compiler only.
+        plugins = self.options.pass_plugins or self.options.dialect_plugins
+        if self.options.in_process and not plugins:
+            out_IR = self.run_driver_in_process(ir, module_name, workspace)
+        else:
+            out_IR = self.run_driver(ir, module_name, workspace)
+
+        output_object_name = os.path.join(str(workspace), f"{module_name}.o")
+        with instrument_step("linkObjectFile", stage="Linker"):
+            output = LinkerDriver.run(output_object_name, options=self.options)
+        output_object_name = str(pathlib.Path(output).absolute())
+
+        if disk_cache is not None:
+            disk_cache.store(cache_key, output_object_name, module_name=module_name)
+
+        return output_object_name, out_IR
+
+    @debug_logger
+    def run_driver(self, ir: str, module_name: str, workspace: Directory):
+        """Compile an IR to an object file in the workspace with the Catalyst CLI.
+
+        Args:
+            ir (bytes | str): MLIR bytecode or textual IR to be compiled
+            module_name (str): Module name to use for naming
+            workspace (Directory): directory that holds output files and/or debug dumps.
+
+        Returns:
+            Optional[str]: Output IR in textual form, if intermediate files are kept.
+        """
+        binary = isinstance(ir, bytes)
         with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".mlir", dir=str(workspace), delete=False
+            mode="wb" if binary else "w",
+            suffix=".mlirbc" if binary else ".mlir",
+            dir=str(workspace),
+            delete=False,
         ) as tmp_infile:
             tmp_infile_name = tmp_infile.name
             tmp_infile.write(ir)
 
-        output_object_name = os.path.join(str(workspace), f"{module_name}.o")
         output_ir_name = os.path.join(str(workspace), f"{module_name}.ll")
+        pass_profile_name = None
+        if profiling_passes():
+            pass_profile_name = os.path.join(str(workspace), f"{module_name}_pass_profile.json")
 
-        cmd = self.get_cli_command(tmp_infile_name, output_ir_name, module_name, workspace)
+        cmd = self.get_cli_command(
+            tmp_infile_name, output_ir_name, module_name, workspace, pass_profile_name
+        )
         try:
             if self.options.verbose:
                 print(f"[SYSTEM] {' '.join(cmd)}", file=self.options.logfile)
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            with instrument_step("runCompilerDriver"):
+                result = subprocess.run(cmd, check=True, capture_output=True, text=True)
             if self.options.verbose or os.getenv("ENABLE_DIAGNOSTICS"):
                 if result.stdout:
                     print(result.stdout.strip(), file=self.options.logfile)
@@ -459,8 +528,10 @@ class Compiler:
         else:
             out_IR = None
 
-        output = LinkerDriver.run(output_object_name, options=self.options)
-        output_object_name = str(pathlib.Path(output).absolute())
+        if pass_profile_name and os.path.exists(pass_profile_name):
+            with open(pass_profile_name, "r", encoding="utf-8") as f:
+                report_pass_profile(json.load(f))
+            os.remove(pass_profile_name)
 
         # Clean up temporary files
         if os.path.exists(tmp_infile_name):
@@ -468,7 +539,116 @@ class Compiler:
         if os.path.exists(output_ir_name):
             os.remove(output_ir_name)
 
-        return output_object_name, out_IR
+        return out_IR
+
+    @debug_logger
+    def run_driver_in_process(self, ir: str, module_name: str, workspace: Directory):
+        """Compile an IR to an object file in the workspace with the compiler driver library,
+        without spawning a process or writing the IR to disk.
+
+        Args:
+            ir (bytes | str): MLIR bytecode or textual IR to be compiled
+            module_name (str): Module name to use for naming
+            workspace (Directory): directory that holds output files and/or debug dumps.
+
+        Returns:
+            Optional[str]: Output IR in textual form, if intermediate files are kept.
+        """
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from mlir_quantum.compiler_driver import run_compiler_driver
+        except ImportError as e:  # pragma: nocover
+            raise CompileError("The in-process compiler driver is not available.") from e
+
+        if self.options.verbose:
+            print("[SYSTEM] Running compiler driver in-process", file=self.options.logfile)
+
+        try:
+            with instrument_step("runCompilerDriver"):
+                compiler_output = run_compiler_driver(
+                    ir if isinstance(ir, bytes) else ir.encode("utf-8"),
+                    str(workspace),
+                    module_name,
+                    keep_intermediate=int(self.options.keep_intermediate),
+                    async_qnodes=bool(self.options.async_qnodes),
+                    verbose=bool(self.options.verbose),
+                    lower_to_llvm=bool(self.options.lower_to_llvm),
+                    pipelines=self.options.get_pipelines(),
+                    checkpoint_stage=self.options.checkpoint_stage,
+                    opt_level=self.options.opt_level,
+                    profile_passes=profiling_passes(),
+                )
+        except RuntimeError as e:
+            raise CompileError(f"catalyst failed with error: {e}") from e
+
+        if self.options.verbose or os.getenv("ENABLE_DIAGNOSTICS"):
+            if messages := compiler_output.get_diagnostic_messages():
+                print(messages.strip(), file=self.options.logfile)
+
+        if pass_profile := compiler_output.get_pass_profile():
+            report_pass_profile(json.loads(pass_profile))
+
+        # The output IR is only written to the workspace when intermediate files are kept.
+        output_ir_name = os.path.join(str(workspace), f"{module_name}.ll")
+        if os.path.exists(output_ir_name):
+            os.remove(output_ir_name)
+
+        return compiler_output.get_output_ir() or None
+
+    @debug_logger
+    def get_disk_cache(self) -> Optional[DiskCache]:
+        """Get the persistent compilation cache, if one is configured.
+
+        The cache is bypassed whenever intermediate compilation results are requested, since
+        those are only produced by actually running the compiler.
+
+        Returns:
+            Optional[DiskCache]: the persistent cache or ``None``
+        """
+        cache_dir = self.options.cache_dir or os.getenv("CATALYST_CACHE_DIR")
+        if not cache_dir or self.options.keep_intermediate or self.options.checkpoint_stage:
+            return None
+
+        max_size = int(os.getenv("CATALYST_CACHE_MAX_SIZE", str(DEFAULT_MAX_SIZE)))
+        return DiskCache(cache_dir, max_size)
+
+    @debug_logger
+    def get_disk_cache_key(self, ir: str, module_name: str) -> str:
+        """Compute the persistent cache key of a program.
+
+        The key covers everything the produced shared object depends on: the input IR, the options
+        that affect compilation, the Catalyst build, the plugins, and the libraries linked against.
+
+        Args:
+            ir (str): Textual MLIR to be compiled
+            module_name (str): Module name to use for naming
+
+        Returns:
+            str: the cache key
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from catalyst import __revision__, __version__
+
+        plugins = []
+        all_plugins = {str(p) for p in (*self.options.pass_plugins, *self.options.dialect_plugins)}
+        for plugin in sorted(all_plugins):
+            # Rebuilding a plugin in place must invalidate programs compiled with it.
+            mtime = os.stat(plugin).st_mtime_ns if os.path.exists(plugin) else None
+            plugins.append((plugin, mtime))
+
+        return DiskCache.make_key(
+            __version__,
+            __revision__,
+            module_name,
+            self.options.get_pipelines(),
+            self.options.lower_to_llvm,
+            self.options.async_qnodes,
+            self.options.opt_level,
+            plugins,
+            get_lib_path("llvm", "MLIR_LIB_DIR"),
+            get_lib_path("runtime", "RUNTIME_LIB_DIR"),
+            ir,
+        )
 
     @debug_logger
     def is_using_python_compiler(self):
@@ -509,6 +689,27 @@ class Compiler:
             (str): filename of shared object
         """
 
+        return self.run_from_ir(*self.get_module_ir(mlir_module), *args, **kwargs)
+
+    @debug_logger
+    def get_module_ir(self, mlir_module):
+        """Get the serialized IR and name under which an MLIR module is compiled.
+
+        The module is serialized to MLIR bytecode, which is smaller and faster to emit and parse
+        than textual MLIR. Textual MLIR is used instead when intermediate files are kept, so that
+        the input of the compiler remains readable.
+
+        Producing the serialized IR requires access to the module's MLIR context, while compiling
+        it does not, so that the latter may happen on another thread.
+
+        Args:
+            mlir_module: The MLIR module to be compiled
+
+        Returns:
+            bytes | str: the MLIR bytecode or textual MLIR of the module
+            str: the module name
+        """
+
         if self.is_using_python_compiler():
             # We keep this module here to keep xDSL requirement optional
             # Only move this is it has been decided that xDSL is no longer optional.
@@ -518,14 +719,18 @@ class Compiler:
             compiler = PythonCompiler()
             mlir_module = compiler.run(mlir_module)
 
-        return self.run_from_ir(
-            mlir_module.operation.get_asm(
-                binary=False, print_generic_op_form=False, assume_verified=True
-            ),
-            str(mlir_module.operation.attributes["sym_name"]).replace('"', ""),
-            *args,
-            **kwargs,
-        )
+        with instrument_step("printMLIRModule"):
+            if self.options.keep_intermediate:
+                ir = mlir_module.operation.get_asm(
+                    binary=False, print_generic_op_form=False, assume_verified=True
+                )
+            else:
+                buffer = io.BytesIO()
+                mlir_module.operation.write_bytecode(buffer)
+                ir = buffer.getvalue()
+        module_name = str(mlir_module.operation.attributes["sym_name"]).replace('"', "")
+
+        return ir, module_name
 
     @debug_logger
     def get_output_of(self, pipeline, workspace) -> Optional[str]:
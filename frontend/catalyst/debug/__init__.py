@@ -22,7 +22,11 @@ from catalyst.debug.compiler_functions import (
     get_compilation_stages_groups,
     replace_ir,
 )
-from catalyst.debug.instruments import instrumentation
+from catalyst.debug.instruments import (
+    enable_latency_histograms,
+    instrumentation,
+    latency_histograms,
+)
 from catalyst.debug.printing import (  # pylint: disable=redefined-builtin
     print,
     print_memref,
@@ -36,6 +40,8 @@ __all__ = (
     "get_compilation_stages_groups",
     "get_cmain",
     "instrumentation",
+    "enable_latency_histograms",
+    "latency_histograms",
     "replace_ir",
     "compile_executable",
 )
@@ -16,12 +16,13 @@
 Instrumentation module to report Catalyst & program performance.
 """
 
-import copy
 import datetime
 import functools
+import json
 import os
 import platform
 import sys
+import threading
 import time
 import typing
 from contextlib import contextmanager
@@ -33,10 +34,14 @@ from contextlib import contextmanager
 
 ## API ##
 @contextmanager
-def instrumentation(session_name, filename=None, detailed=False):
+def instrumentation(session_name, filename=None, detailed=False, num_slowest_passes=10):
     """Instrumentation session to output information on wall time, CPU time,
     and intermediate program size of a program during compilation and execution.
 
+    Sizes are measured in memory, in lines of the captured program and of the generated IR, and
+    in instructions of the compiled program as reported by the compiler, so that a session does
+    not write intermediate files that would distort its timings. To monitor the latency of
+    programs in production instead, see :func:`~.enable_latency_histograms`.
 
     Args:
         session_name (str): identifier to distinguish multiple sessions or runs within the same result file
@@ -45,6 +50,12 @@ def instrumentation(session_name, filename=None, detailed=False):
         detailed (bool): Whether to instrument fine-grained steps in the compiler and runtime.
             If ``False``, only high-level steps such as "program capture" and
             "compilation" are reported.
+        num_slowest_passes (int): Number of compiler passes to report at the end of a detailed
+            session, starting with the slowest one.
+
+    Yields:
+        InstrumentSession: the session, whose ``pass_profile`` gives the time spent in each pass of
+        the compiler during a detailed session.
 
     **Example**
 
@@ -88,14 +99,31 @@ def instrumentation(session_name, filename=None, detailed=False):
       - run:
           walltime: 1.053613
           cputime: 1.019584
+
+    In a detailed session, the compiler also reports the time spent in each MLIR pass, LLVM
+    pipeline and in the linker, together with the size of the program after it. The profile of
+    every compilation is included in the results, and the slowest passes of the session are
+    summarized at its end:
+
+    >>> with debug.instrumentation("session_name", detailed=True) as session:
+    ...     expensive_function(1, 2)
+    ...
+    [DIAGNOSTICS] Slowest passes of session_name:
+    [DIAGNOSTICS]   compileObjectFile              LLVM                       selftime: 9.818 ms
+    [DIAGNOSTICS]   linkObjectFile                 Linker                     selftime: 7.214 ms
+    [DIAGNOSTICS]   one-shot-bufferize             BufferizationPass          selftime: 1.937 ms
+    ...
+    >>> session.pass_profile[0]
+    {'stage': 'Parser', 'name': 'parseMLIRSource', 'runs': 1, 'walltime': 0.214, 'cputime': 0.213,
+     'selftime': 0.214, 'size': 22, 'module': 'expensive_function'}
     """
     # A session cannot be tied to the creation of a QJIT object
     # nor its lifetime, because it involves both compile time and runtime measurements. It cannot
     # be a context-free process either since we need to write results to an existing results file.
-    session = InstrumentSession(session_name, filename, detailed)
+    session = InstrumentSession(session_name, filename, detailed, num_slowest_passes)
 
     try:
-        yield None
+        yield session
     finally:
         session.close()
 
@@ -142,22 +170,147 @@ def instrument(fn=None, *, size_from=None, has_finegrained=False):
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
         if not InstrumentSession.active:
-            return fn(*args, **kwargs)
+            if not LatencyHistograms.enabled:
+                return fn(*args, **kwargs)
+
+            start_wall = time.perf_counter_ns()
+            fn_results = fn(*args, **kwargs)
+            LatencyHistograms.record(stage_name, time.perf_counter_ns() - start_wall)
+            return fn_results
 
         with ResultReporter(stage_name, has_finegrained) as reporter:
-            self = args[0]
-            orig = copy.deepcopy(self.compile_options)
-            self.compile_options.keep_intermediate = True
+            InstrumentSession.program_size = None
             fn_results, wall_time, cpu_time = time_function(fn, args, kwargs)
             program_size = measure_program_size(fn_results, size_from)
             reporter.commit_results(wall_time, cpu_time, program_size)
-            self.compile_options = orig
+
+        if LatencyHistograms.enabled:
+            LatencyHistograms.record(stage_name, wall_time)
 
         return fn_results
 
     return wrapper
 
 
+@contextmanager
+def instrument_step(step_name, stage=None):
+    """Context manager that measures a fine-grained step of an instrumented stage which is performed
+    outside of the compiler, such as linking. The results are reported in the same format as the
+    fine-grained results of the compiler, and only during a detailed instrumentation session.
+
+    Args:
+        step_name (str): identifier of the step
+        stage (str | None): if provided, the step is also included in the pass profile of the
+            session, as part of the given compilation stage
+    """
+    if not (InstrumentSession.active and InstrumentSession.finegrained):
+        yield
+        return
+
+    start_wall = time.perf_counter_ns()
+    start_cpu = time.process_time_ns()
+    yield
+    cpu_time = time.process_time_ns() - start_cpu
+    wall_time = time.perf_counter_ns() - start_wall
+
+    if stage is not None:
+        InstrumentSession.passes.append(
+            {
+                "stage": stage,
+                "name": step_name,
+                "runs": 1,
+                "walltime": wall_time / 1e6,
+                "cputime": cpu_time / 1e6,
+                "selftime": wall_time / 1e6,
+                "size": None,
+                "module": None,
+            }
+        )
+
+    if InstrumentSession.filename:
+        with open(InstrumentSession.filename, mode="a", encoding="UTF-8") as file:
+            file.write(f"          - {step_name}:\n")
+            file.write(f"              walltime: {wall_time / 1e6}\n")
+            file.write(f"              cputime: {cpu_time / 1e6}\n")
+    else:
+        print(f"[DIAGNOSTICS] Running {step_name.ljust(23)}", end="\t", file=sys.stderr)
+        print(f"walltime: {wall_time / 1e6:.3f} ms", end="\t", file=sys.stderr)
+        print(f"cputime: {cpu_time / 1e6:.3f} ms", file=sys.stderr)
+
+
+def enable_latency_histograms(enabled=True):
+    """Record the latency of every call to an instrumented stage, such as ``capture``, ``compile``
+    and ``run``, into a histogram per stage.
+
+    Unlike an instrumentation session, recording latencies neither reports nor writes anything,
+    and only costs a timer read and a counter increment per call, so that it can remain enabled
+    in production. It is also enabled by setting the ``CATALYST_LATENCY_HISTOGRAMS`` environment
+    variable to ``ON``.
+
+    Args:
+        enabled (bool): whether to record the latencies of the instrumented stages
+
+    **Example**
+
+    >>> debug.enable_latency_histograms()
+    >>> f = qjit(lambda x: x + 1)
+    >>> for x in range(1000):
+    ...     f(x)
+    >>> debug.latency_histograms()["run"]
+    {'count': 1000, 'sum': 20.937, 'min': 0.0171, 'max': 0.262, 'p50': 0.02048, 'p90': 0.024576,
+     'p99': 0.028672, 'buckets': [(0.02048, 634), (0.024576, 301), (0.028672, 56), ...]}
+    """
+    LatencyHistograms.enabled = enabled
+
+
+def latency_histograms(reset=False):
+    """Get the histograms of the latencies recorded since they were enabled or last reset.
+
+    Latencies are counted in logarithmic buckets, four per power of two nanoseconds, such that the
+    reported quantiles are within 25% of the exact ones.
+
+    Args:
+        reset (bool): whether to clear the histograms after reading them
+
+    Returns:
+        dict[str, dict]: for each instrumented stage, the number of calls, the sum, minimum and
+        maximum of their latencies, their median, 90th and 99th percentiles, and the non-empty
+        buckets of the histogram as pairs of an upper bound and a count. All latencies are in
+        milliseconds.
+    """
+    return LatencyHistograms.export(reset)
+
+
+def profiling_passes():
+    """Whether the compiler should report the time spent in each of its passes, which is the case
+    during an instrumentation session. The profile is kept in memory by the compiler, and also
+    provides the size of the compiled program without writing intermediate files."""
+    return InstrumentSession.active
+
+
+def report_pass_profile(profile):
+    """Report the pass profile of a compilation, as returned by the compiler driver in JSON format.
+    The size of the program after the last pass is recorded as the size of the compiled program.
+    During a detailed session, the profile is also added to the session, and written to the
+    results file if there is one.
+
+    Args:
+        profile (dict): the name of the compiled module and the measurements of its passes
+    """
+    sizes = [entry["size"] for entry in profile["passes"] if entry["size"] is not None]
+    if sizes:
+        InstrumentSession.program_size = sizes[-1]
+
+    if not InstrumentSession.finegrained:
+        return
+
+    passes = [dict(entry, module=profile["module"]) for entry in profile["passes"]]
+    InstrumentSession.passes.extend(passes)
+
+    if InstrumentSession.filename:
+        ResultReporter.dump_pass_profile(passes)
+
+
 ## DATA COLLECTION ##
 def time_function(fn, args, kwargs):
     """Collect timing information for a function call.
@@ -188,6 +341,10 @@ def measure_program_size(results, size_from):
     of a given program representation. The representation is assumed to be provided in the
     instrumented function results at the provided index.
 
+    The size reported by the compiler takes precedence if there is one, i.e. the number of
+    instructions of the compiled program, since its textual form is only available when
+    intermediate files are kept.
+
     Args:
         results (Sequence): instrumented function results
         size_from (int | None): result index to use for size measurement
@@ -198,9 +355,15 @@ def measure_program_size(results, size_from):
     if size_from is None:
         return None
 
+    if InstrumentSession.program_size is not None:
+        return InstrumentSession.program_size
+
     if not isinstance(results, typing.Sequence):
         results = (results,)
 
+    if results[size_from] is None:
+        return None
+
     return str(results[size_from]).count("\n")
 
 
@@ -276,6 +439,41 @@ class ResultReporter:
 
             file.write(existing_text)
 
+    @staticmethod
+    def dump_pass_profile(passes):
+        """Dump the profile of the passes of a compilation to file, as a fine-grained result."""
+        with open(InstrumentSession.filename, mode="a", encoding="UTF-8") as file:
+            file.write(f"          - pass_profile:\n")
+            for entry in passes:
+                file.write(f"              - stage: {json.dumps(entry['stage'])}\n")
+                file.write(f"                name: {json.dumps(entry['name'])}\n")
+                file.write(f"                runs: {entry['runs']}\n")
+                file.write(f"                walltime: {entry['walltime']}\n")
+                file.write(f"                cputime: {entry['cputime']}\n")
+                file.write(f"                selftime: {entry['selftime']}\n")
+                file.write(f"                size: {json.dumps(entry['size'])}\n")
+
+    @staticmethod
+    def print_slowest_passes(session_name, passes):
+        """Print the slowest passes of a session to console."""
+        print(f"[DIAGNOSTICS] Slowest passes of {session_name}:", file=sys.stderr)
+        for entry in passes:
+            print(f"[DIAGNOSTICS]   {entry['name'].ljust(30)}", end=" ", file=sys.stderr)
+            print(f"{entry['stage'].ljust(26)}", end=" ", file=sys.stderr)
+            print(f"selftime: {entry['selftime']:.3f} ms", file=sys.stderr)
+
+    @staticmethod
+    def dump_slowest_passes(passes):
+        """Dump the slowest passes of a session to file, after the results of the session."""
+        with open(InstrumentSession.filename, mode="a", encoding="UTF-8") as file:
+            file.write(f"  slowest_passes:\n")
+            for entry in passes:
+                file.write(f"    - name: {json.dumps(entry['name'])}\n")
+                file.write(f"      stage: {json.dumps(entry['stage'])}\n")
+                file.write(f"      module: {json.dumps(entry['module'])}\n")
+                file.write(f"      selftime: {entry['selftime']}\n")
+                file.write(f"      walltime: {entry['walltime']}\n")
+
     @staticmethod
     def dump_header(session_name):
         """Write the session header to file, including timestamp, session name, and system info."""
@@ -300,23 +498,46 @@ class InstrumentSession:
     active = False
     filename = None
     finegrained = False
+    passes = []
+    program_size = None
 
-    def __init__(self, session_name, filename, detailed):
+    def __init__(self, session_name, filename, detailed, num_slowest_passes=10):
         self.enable_flag = os.environ.pop("ENABLE_DIAGNOSTICS", None)
         self.path_flag = os.environ.pop("DIAGNOSTICS_RESULTS_PATH", None)
+        self.session_name = session_name
+        self.num_slowest_passes = num_slowest_passes
 
         self.open_session(session_name, filename, detailed)
+        # Measurements are added in place, and remain available after the session is closed.
+        self.pass_profile = InstrumentSession.passes
 
     def close(self):
         """Terminate the instrumentation session."""
+        if self.pass_profile and self.num_slowest_passes:
+            self.report_slowest_passes()
         self.close_session(self.enable_flag, self.path_flag)
 
+    def slowest_passes(self, n):
+        """Get the ``n`` passes of the session with the largest self time, i.e. the time spent in
+        a pass excluding the passes nested in it."""
+        return sorted(self.pass_profile, key=lambda entry: entry["selftime"], reverse=True)[:n]
+
+    def report_slowest_passes(self):
+        """Report the slowest passes of the session to either the console or file."""
+        passes = self.slowest_passes(self.num_slowest_passes)
+        if InstrumentSession.filename:
+            ResultReporter.dump_slowest_passes(passes)
+        else:
+            ResultReporter.print_slowest_passes(self.session_name, passes)
+
     @staticmethod
     def open_session(session_name, filename, detailed):
         """Open an instrumentation session. Sets the global state and env variables."""
         InstrumentSession.active = True
         InstrumentSession.filename = filename
         InstrumentSession.finegrained = detailed
+        InstrumentSession.passes = []
+        InstrumentSession.program_size = None
 
         if detailed:
             os.environ["ENABLE_DIAGNOSTICS"] = "ON"
@@ -330,6 +551,8 @@ class InstrumentSession:
         InstrumentSession.active = False
         InstrumentSession.filename = None
         InstrumentSession.finegrained = False
+        InstrumentSession.passes = []
+        InstrumentSession.program_size = None
 
         if enable_flag is None:
             os.environ.pop("ENABLE_DIAGNOSTICS", None)  # safely delete
@@ -340,3 +563,110 @@ class InstrumentSession:
             os.environ.pop("ENABLE_DIAGNOSTICS", None)  # safely delete
         else:
             os.environ["DIAGNOSTICS_RESULTS_PATH"] = path_flag
+
+
+## LATENCY HISTOGRAMS ##
+class LatencyHistogram:
+    """Histogram of the latencies of an instrumented stage, in nanoseconds.
+
+    Latencies below 4 ns have a bucket each, and every following power of two is divided into four
+    buckets of equal width, so that recording a latency takes constant time and memory.
+    """
+
+    num_buckets = 4 * 63
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = [0] * LatencyHistogram.num_buckets
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_index(latency):
+        """The index of the bucket of a latency, from the position of its leading bit and the two
+        bits that follow it."""
+        exponent = latency.bit_length()
+        if exponent <= 2:
+            return latency
+        return 4 * (exponent - 2) + ((latency >> (exponent - 3)) & 3)
+
+    @staticmethod
+    def bucket_bounds(index):
+        """The lower and upper bounds of a bucket."""
+        if index < 4:
+            return index, index + 1
+        exponent, mantissa = divmod(index, 4)
+        return (4 + mantissa) << (exponent - 1), (5 + mantissa) << (exponent - 1)
+
+    def record(self, latency):
+        """Add a latency to the histogram."""
+        index = LatencyHistogram.bucket_index(latency)
+        with self.lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.total += latency
+            self.min = latency if self.min is None else min(self.min, latency)
+            self.max = latency if self.max is None else max(self.max, latency)
+
+    def quantile(self, q):
+        """An upper bound of the ``q``-th quantile of the latencies, tightened by the maximum."""
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(LatencyHistogram.bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def export(self, reset=False):
+        """Export the histogram in milliseconds, as returned by :func:`~.latency_histograms`."""
+        with self.lock:
+            result = {
+                "count": self.count,
+                "sum": self.total / 1e6,
+                "min": self.min / 1e6 if self.count else None,
+                "max": self.max / 1e6 if self.count else None,
+                "p50": self.quantile(0.5) / 1e6 if self.count else None,
+                "p90": self.quantile(0.9) / 1e6 if self.count else None,
+                "p99": self.quantile(0.99) / 1e6 if self.count else None,
+                "buckets": [
+                    (LatencyHistogram.bucket_bounds(index)[1] / 1e6, count)
+                    for index, count in enumerate(self.buckets)
+                    if count
+                ],
+            }
+            if reset:
+                self.buckets = [0] * LatencyHistogram.num_buckets
+                self.count = 0
+                self.total = 0
+                self.min = None
+                self.max = None
+
+        return result
+
+
+class LatencyHistograms:
+    """Provides access to the global latency histograms of the instrumented stages. Unlike an
+    instrumentation session, the histograms are not tied to a context and persist until reset."""
+
+    enabled = os.getenv("CATALYST_LATENCY_HISTOGRAMS", "OFF").upper() in ("ON", "1")
+    histograms = {}
+    lock = threading.Lock()
+
+    @staticmethod
+    def record(stage_name, latency):
+        """Add the latency of a call to the histogram of its stage."""
+        histogram = LatencyHistograms.histograms.get(stage_name)
+        if histogram is None:
+            with LatencyHistograms.lock:
+                histogram = LatencyHistograms.histograms.setdefault(stage_name, LatencyHistogram())
+        histogram.record(latency)
+
+    @staticmethod
+    def export(reset=False):
+        """Export the histograms of all stages."""
+        with LatencyHistograms.lock:
+            histograms = dict(LatencyHistograms.histograms)
+        return {stage: histogram.export(reset) for stage, histogram in histograms.items()}
@@ -16,6 +16,7 @@
 Internal API for the device module.
 """
 
+from catalyst.device.decomposition import decomposition_cache
 from catalyst.device.qjit_device import (
     BackendInfo,
     QJITDevice,
@@ -28,4 +29,5 @@ __all__ = (
     "BackendInfo",
     "extract_backend_info",
     "get_device_capabilities",
+    "decomposition_cache",
 )
@@ -18,10 +18,13 @@ compilation & execution on devices.
 """
 import copy
 import logging
+import threading
+from collections import OrderedDict
 from functools import partial
-from typing import Union
+from typing import NamedTuple, Union
 
 import jax
+import numpy as np
 import pennylane as qml
 from pennylane import transform
 from pennylane.devices.capabilities import DeviceCapabilities
@@ -43,7 +46,7 @@ from catalyst.device.op_support import (
     is_invertible,
     is_supported,
 )
-from catalyst.jax_tracer import HybridOpRegion, has_nested_tapes
+from catalyst.jax_tracer import HybridOp, HybridOpRegion, has_nested_tapes
 from catalyst.logging import debug_logger
 from catalyst.tracing.contexts import EvaluationContext
 from catalyst.utils.exceptions import CompileError
@@ -51,6 +54,163 @@ from catalyst.utils.exceptions import CompileError
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Maximum number of operator decompositions kept by the decomposition cache.
+DEFAULT_DECOMPOSITION_CACHE_SIZE = 1024
+
+
+class DecompositionCacheInfo(NamedTuple):
+    """Statistics of the decomposition cache, in the format of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DecompositionCache:
+    """Class to manage the decompositions of operators into the operations supported by a device.
+
+    Many programs apply the same operator, e.g. ``qml.QFT`` or ``qml.MultiControlledX``, to the
+    same or to different wires, sometimes thousands of times. Instead of decomposing each instance
+    recursively, the complete decomposition of the first instance is stored, and later instances
+    reuse it with their wires relabelled.
+
+    Only operators without parameters are cached, so that decompositions never hold values of
+    another trace. A decomposition is identified by the type and hyperparameters of the operator,
+    the position of its wires, the capabilities of the device and the gradient method. Device
+    capabilities are identified by object, and must therefore not be modified once used for
+    decomposition.
+
+    Args:
+        maxsize (int): maximum number of decompositions kept, the least recently used
+            decomposition is evicted first. A size of zero disables the cache.
+    """
+
+    def __init__(self, maxsize=DEFAULT_DECOMPOSITION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # Each key maps to the capabilities it refers to, which keeps their identity from being
+        # reused, the wires of the cached instance, and its decomposition.
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """Get the wires and the decomposition of the cached instance for a key, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            _, wires, ops = entry
+            return wires, ops
+
+    def insert(self, key, capabilities, wires, ops):
+        """Store the decomposition of an operator instance acting on ``wires``."""
+        with self._lock:
+            self._entries[key] = (capabilities, wires, tuple(ops))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all decompositions and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> DecompositionCacheInfo:
+        """Get the hit and miss counts and the size of the cache."""
+        with self._lock:
+            return DecompositionCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+decomposition_cache = DecompositionCache()
+
+
+def _freeze(value, wire_positions):
+    """Convert a hyperparameter into a hashable value, where the wires of the operator are
+    represented by their position. Raises a TypeError for values which cannot be compared, such as
+    traced values."""
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, np.generic)):
+        return (type(value), value)
+
+    if isinstance(value, qml.wires.Wires):
+        return (qml.wires.Wires, tuple(_freeze_wire(wire, wire_positions) for wire in value))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v, wire_positions) for v in value))
+
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v, wire_positions)) for k, v in value.items()))
+
+    if isinstance(value, qml.operation.Operator) and value.num_params == 0:
+        hyperparameters = _freeze(value.hyperparameters, wire_positions)
+        return (type(value), hyperparameters, _freeze(value.wires, wire_positions))
+
+    raise TypeError(f"Values of type {type(value)} are not cacheable.")
+
+
+def _freeze_wire(wire, wire_positions):
+    if isinstance(wire, jax.core.Tracer):
+        raise TypeError("Dynamic wires are not cacheable.")
+    position = wire_positions.get(wire)
+    return ("label", wire) if position is None else ("position", position)
+
+
+def _get_decomposition_key(op, capabilities: DeviceCapabilities, grad_method):
+    """Get the key of the decomposition of an operator in the decomposition cache, or ``None`` if
+    its decomposition cannot be cached."""
+
+    if isinstance(op, MidMeasureMP) or has_nested_tapes(op) or op.num_params > 0:
+        return None
+
+    wires = op.wires
+    if any(isinstance(wire, jax.core.Tracer) for wire in wires):
+        return None
+
+    try:
+        wire_positions = {wire: i for i, wire in enumerate(wires)}
+        frozen_op = (type(op), _freeze(op.hyperparameters, wire_positions), len(wires))
+    except TypeError:
+        return None
+
+    return frozen_op, id(capabilities), grad_method
+
+
+def _has_tracers(op):
+    return any(isinstance(x, jax.core.Tracer) for x in (*op.data, *op.wires))
+
+
+def _is_cacheable(ops):
+    """Whether a decomposition can be reused by other instances of an operator. Hybrid operations
+    hold traced regions which are neither visible from their data nor relabelled with their wires,
+    and thus cannot be shared."""
+    return not any(
+        _has_tracers(sub_op) or has_nested_tapes(sub_op) or isinstance(sub_op, HybridOp)
+        for sub_op in ops
+    )
+
+
+def _relabel_wires(ops, wires, new_wires):
+    """Relabel the wires of a decomposition, or return ``None`` if relabelling changes the type of
+    an operation, e.g. a controlled operation which is specialized for its new wires."""
+    if wires == new_wires:
+        return list(ops)
+
+    wire_map = dict(zip(wires, new_wires))
+    new_ops = [op.map_wires(wire_map) for op in ops]
+    # Subclasses are not interchangeable here, e.g. a ControlledOp relabelled into a CNOT, so that
+    # the exact types must match.
+    if any(type(new_op) is not type(op) for op, new_op in zip(ops, new_ops)):
+        return None
+    return new_ops
+
 
 def check_alternative_support(op, capabilities: DeviceCapabilities):
     """Verify that aliased operations aren't supported via alternative definitions."""
@@ -120,7 +280,9 @@ def catalyst_decompose(
         tape,
         stopping_condition=lambda op: catalyst_acceptance(op, capabilities, grad_method),
         skip_initial_state_prep=skip_initial_state_prep,
-        decomposer=partial(catalyst_decomposer, capabilities=capabilities),
+        decomposer=partial(
+            _cached_catalyst_decomposer, capabilities=capabilities, grad_method=grad_method
+        ),
         name="catalyst on this device",
         error=CompileError,
     )
@@ -135,6 +297,43 @@ def catalyst_decompose(
     return (tape,), lambda x: x[0]
 
 
+def _cached_catalyst_decomposer(op, capabilities: DeviceCapabilities, grad_method):
+    """A decomposer using the decomposition cache. Operators which can be cached are decomposed
+    completely, down to the operations supported by the device, while other operators are
+    decomposed by a single step of ``catalyst_decomposer``."""
+
+    key = None
+    if decomposition_cache.maxsize > 0:
+        key = _get_decomposition_key(op, capabilities, grad_method)
+    if key is None:
+        return catalyst_decomposer(op, capabilities)
+
+    cached = decomposition_cache.lookup(key)
+    if cached is not None:
+        wires, ops = cached
+        ops = _relabel_wires(ops, wires, op.wires)
+        return ops if ops is not None else catalyst_decomposer(op, capabilities)
+
+    decomposition = catalyst_decomposer(op, capabilities)
+    (decomposed_tape,), _ = decompose(
+        qml.tape.QuantumScript(decomposition),
+        stopping_condition=lambda sub_op: catalyst_acceptance(sub_op, capabilities, grad_method),
+        skip_initial_state_prep=False,
+        decomposer=partial(
+            _cached_catalyst_decomposer, capabilities=capabilities, grad_method=grad_method
+        ),
+        name="catalyst on this device",
+        error=CompileError,
+    )
+    ops = decomposed_tape.operations
+
+    if not _is_cacheable(ops):
+        return decomposition
+
+    decomposition_cache.insert(key, capabilities, op.wires, ops)
+    return ops
+
+
 def _decompose_to_matrix(op):
     try:
         mat = op.matrix()
@@ -16,6 +16,7 @@
 This module contains device stubs for the old and new PennyLane device API, which facilitate
 the application of decomposition and other device pre-processing routines.
 """
+import functools
 import logging
 import os
 import pathlib
@@ -118,6 +119,9 @@ RUNTIME_OBSERVABLES = {
 
 RUNTIME_MPS = {mp: [] for mp in RUNTIME_MPS}
 
+# Maximum number of device configurations whose parsed and derived capabilities are kept in memory.
+CAPABILITIES_CACHE_SIZE = 64
+
 # TODO: This should be removed after implementing `get_c_interface`
 # for the following backend devices:
 SUPPORTED_RT_DEVICES = {
@@ -328,7 +332,16 @@ class QJITDevice(qml.devices.Device):
         self.backend_name = backend.c_interface_name
         self.backend_lib = backend.lpath
         self.backend_kwargs = backend.kwargs
-        self.capabilities = get_qjit_device_capabilities(device_capabilities)
+
+        # Capabilities derived from a configuration file are shared by all the QJIT devices created
+        # for that file, and are therefore never modified.
+        config_key = _get_device_config_key(original_device)
+        if config_key is not None and not hasattr(original_device, "_to_matrix_ops"):
+            self.capabilities = _get_cached_qjit_device_capabilities(
+                *config_key, finite_shots=bool(original_device.shots)
+            )
+        else:
+            self.capabilities = get_qjit_device_capabilities(device_capabilities)
 
     @debug_logger
     def preprocess(
@@ -489,29 +502,34 @@ def filter_out_modifiers(operations):
     return set(filter(is_not_modifier, operations))
 
 
-def _load_device_capabilities(device) -> DeviceCapabilities:
-    """Get the contents of the device config file."""
+def _get_device_config_file(device):
+    """Get the path of the device config file."""
+
+    if getattr(device, "config_filepath") is not None:
+        return device.config_filepath
+
+    # TODO: Remove this section when devices are guaranteed to have their own config file
+    device_lpath = pathlib.Path(get_lib_path("runtime", "RUNTIME_LIB_DIR"))
+    name = device.short_name if isinstance(device, qml.devices.LegacyDevice) else device.name
+    # The toml files name convention we follow is to replace
+    # the dots with underscores in the device short name.
+    toml_file_name = name.replace(".", "_") + ".toml"
+    # And they are currently saved in the following directory.
+    return device_lpath.parent / "lib" / "backend" / toml_file_name
+
+
+def _get_device_config_key(device):
+    """Get the key identifying the current contents of the device config file, made of its path
+    and modification time, or ``None`` if the device provides its capabilities itself."""
 
     # TODO: This code exists purely for testing. Find another way to customize device Find a
     #       better way for a device to customize its capabilities as seen by Catalyst.
     if hasattr(device, "qjit_capabilities"):
-        return device.qjit_capabilities
-
-    if getattr(device, "config_filepath") is not None:
-        toml_file = device.config_filepath
-
-    else:
-        # TODO: Remove this section when devices are guaranteed to have their own config file
-        device_lpath = pathlib.Path(get_lib_path("runtime", "RUNTIME_LIB_DIR"))
-        name = device.short_name if isinstance(device, qml.devices.LegacyDevice) else device.name
-        # The toml files name convention we follow is to replace
-        # the dots with underscores in the device short name.
-        toml_file_name = name.replace(".", "_") + ".toml"
-        # And they are currently saved in the following directory.
-        toml_file = device_lpath.parent / "lib" / "backend" / toml_file_name
+        return None
 
+    toml_file = _get_device_config_file(device)
     try:
-        capabilities = DeviceCapabilities.from_toml_file(toml_file, "qjit")
+        mtime = os.stat(toml_file).st_mtime_ns
 
     except FileNotFoundError as e:
         raise CompileError(
@@ -519,7 +537,42 @@ def _load_device_capabilities(device) -> DeviceCapabilities:
             f"Config file ({toml_file}) does not exist"
         ) from e
 
-    return capabilities
+    return str(toml_file), mtime
+
+
+@functools.lru_cache(maxsize=CAPABILITIES_CACHE_SIZE)
+def _parse_device_capabilities(
+    toml_file: str, mtime: int  # pylint: disable=unused-argument
+) -> DeviceCapabilities:
+    """Parse a device config file. The result is shared between calls and must not be modified.
+
+    The modification time of the file is part of the arguments so that edited files are reloaded.
+    """
+    return DeviceCapabilities.from_toml_file(toml_file, "qjit")
+
+
+@functools.lru_cache(maxsize=CAPABILITIES_CACHE_SIZE)
+def _get_cached_qjit_device_capabilities(
+    toml_file: str, mtime: int, finite_shots: bool
+) -> DeviceCapabilities:
+    """Get the capabilities of the QJIT device for a device config file. The result is shared
+    between calls and must not be modified."""
+    device_capabilities = _parse_device_capabilities(toml_file, mtime)
+    return get_qjit_device_capabilities(device_capabilities.filter(finite_shots=finite_shots))
+
+
+def _load_device_capabilities(device) -> DeviceCapabilities:
+    """Get the contents of the device config file.
+
+    Config files are only parsed once per modification, and the returned capabilities are shared
+    between the devices using the same file.
+    """
+
+    config_key = _get_device_config_key(device)
+    if config_key is None:
+        return device.qjit_capabilities
+
+    return _parse_device_capabilities(*config_key)
 
 
 def get_device_capabilities(device) -> DeviceCapabilities:
@@ -21,6 +21,8 @@ from functools import partial
 
 import jax
 from jax._src.core import abstractify, standard_vma_rule
+from jax._src.custom_derivatives import linear_call_p
+from jax._src.interpreters import batching
 from jax._src.lax.slicing import (
     _argnum_weak_type,
     _gather_dtype_rule,
@@ -39,6 +41,7 @@ __all__ = (
     "_no_clean_up_dead_vars",
     "_gather_shape_rule_dynamic",
     "gather2_p",
+    "_linear_call_batching_rule",
 )
 
 
@@ -200,3 +203,24 @@ gather2_p = standard_primitive(
     sharding_rule=_gather_sharding_rule,
     vma_rule=partial(standard_vma_rule, "gather"),
 )
+
+
+def _linear_call_batching_rule(args, dims, **params):
+    """Batch a ``linear_call`` by mapping it sequentially over the batch dimension. Jax does not
+    provide a batching rule for ``linear_call``, which is needed to e.g. take the ``jax.jacobian``
+    of QJIT functions, whose derivatives are linear calls around host callbacks."""
+    mapped = [dim is not batching.not_mapped for dim in dims]
+    batched_args = [batching.moveaxis(x, dim, 0) for x, dim, m in zip(args, dims, mapped) if m]
+
+    def body(batched_args):
+        batched_args = iter(batched_args)
+        return linear_call_p.bind(
+            *(next(batched_args) if m else x for x, m in zip(args, mapped)), **params
+        )
+
+    outs = jax.lax.map(body, batched_args)
+    return outs, [0] * len(outs)
+
+
+# TODO: Remove once Jax provides a batching rule for ``linear_call``.
+batching.primitive_batchers.setdefault(linear_call_p, _linear_call_batching_rule)
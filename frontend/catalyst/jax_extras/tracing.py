@@ -217,6 +217,11 @@ def sort_eqns(eqns: List[JaxprEqn], forced_order_primitives: Set[JaxprPrimitive]
     # to the origin Boxed equations, [2] - initialize `parents` fields of boxes with the
     # correct values, [3] - add additional equation order restrictions to boxes, [4] - call the
     # topological sorting.
+    #
+    # Every equation following a forced-order equation must be placed after it. It is sufficient
+    # to make each equation a child of the closest preceding forced-order equation only, since the
+    # forced-order equations are themselves chained this way. This keeps the number of edges linear
+    # in the number of equations, and results in the same order as adding all the implied edges.
 
     class Box:
         """Wrapper for JaxprEqn keeping track of its id and parents."""
@@ -230,15 +235,16 @@ def sort_eqns(eqns: List[JaxprEqn], forced_order_primitives: Set[JaxprPrimitive]
             return self.id < other.id
 
     boxes = [Box(i, e) for i, e in enumerate(eqns)]
-    fixedorder = [(i, b) for (i, b) in enumerate(boxes) if b.e.primitive in forced_order_primitives]
     origin: Dict[int, Box] = {}
     for b in boxes:
         origin.update({ov.count: b for ov in b.e.outvars})  # [1]
+    barrier: Optional[Box] = None
     for b in boxes:
         b.parents = [origin[v.count] for v in b.e.invars if v.count in origin]  # [2]
-    for i, q in fixedorder:
-        for b in boxes[i + 1 :]:
-            b.parents.append(q)  # [3]
+        if barrier is not None:
+            b.parents.append(barrier)  # [3]
+        if b.e.primitive in forced_order_primitives:
+            barrier = b
     return [b.e for b in stable_toposort(boxes)]  # [4]
 
 
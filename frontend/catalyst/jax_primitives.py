@@ -49,7 +49,15 @@ from jaxlib.mlir.dialects.arith import (
     SubIOp,
 )
 from jaxlib.mlir.dialects.func import FunctionType
-from jaxlib.mlir.dialects.scf import ConditionOp, ForOp, IfOp, WhileOp, YieldOp
+from jaxlib.mlir.dialects.scf import (
+    ConditionOp,
+    ForallOp,
+    ForOp,
+    IfOp,
+    InParallelOp,
+    WhileOp,
+    YieldOp,
+)
 from jaxlib.mlir.dialects.stablehlo import ConstantOp as StableHLOConstantOp
 from jaxlib.mlir.dialects.stablehlo import ConvertOp as StableHLOConvertOp
 from mlir_quantum.dialects.catalyst import (
@@ -88,6 +96,8 @@ from mlir_quantum.dialects.quantum import (
     MultiRZOp,
     NamedObsOp,
     NumQubitsOp,
+    PRNGKeyOp,
+    PRNGStreamOp,
     ProbsOp,
     QubitUnitaryOp,
     SampleOp,
@@ -118,7 +128,12 @@ from catalyst.jax_primitives_utils import (
     lower_jaxpr,
 )
 from catalyst.utils.calculate_grad_shape import Signature, calculate_grad_shape
-from catalyst.utils.extra_bindings import FromElementsOp, TensorExtractOp
+from catalyst.utils.extra_bindings import (
+    FromElementsOp,
+    ParallelInsertSliceOp,
+    TensorEmptyOp,
+    TensorExtractOp,
+)
 from catalyst.utils.patching import Patcher
 from catalyst.utils.types import convert_shaped_arrays_to_tensors
 
@@ -285,6 +300,8 @@ while_p = DynshapePrimitive("while_loop")
 while_p.multiple_results = True
 for_p = DynshapePrimitive("for_loop")
 for_p.multiple_results = True
+parallel_for_p = Primitive("parallel_for")
+parallel_for_p.multiple_results = True
 grad_p = Primitive("grad")
 grad_p.multiple_results = True
 func_p = core.CallPrimitive("func")
@@ -2224,6 +2241,84 @@ def _for_loop_lowering(
     return for_op_scf.results
 
 
+#
+# parallel for loop
+#
+@parallel_for_p.def_abstract_eval
+def _parallel_for_abstract_eval(*args, body_jaxpr, num_iterations):
+    _assert_jaxpr_without_constants(body_jaxpr)
+
+    return [
+        core.ShapedArray((num_iterations, *aval.shape), aval.dtype) for aval in body_jaxpr.out_avals
+    ]
+
+
+@parallel_for_p.def_impl
+def _parallel_for_def_impl(*args, body_jaxpr, num_iterations):  # pragma: no cover
+    raise NotImplementedError()
+
+
+def _parallel_for_lowering(
+    jax_ctx: mlir.LoweringRuleContext,
+    *consts: tuple,
+    body_jaxpr: core.ClosedJaxpr,
+    num_iterations: int,
+):
+    """Lower the parallel loop to an ``scf.forall`` operation, whose iterations write their results
+    into disjoint slices of the outputs. Every iteration draws its random numbers from its own
+    stream, derived from a key drawn once before the loop, so that seeded programs remain
+    reproducible regardless of the thread executing each iteration. Since some iterations may run
+    on the calling thread, its generator is reset after the loop to the next stream of the same
+    key, so that the random numbers drawn afterwards do not depend on the number of threads."""
+    result_types = [mlir.aval_to_ir_types(a)[0] for a in jax_ctx.avals_out]
+    outputs = [TensorEmptyOp(result_type).result for result_type in result_types]
+
+    loop_index_type = mlir.aval_to_ir_types(body_jaxpr.in_avals[-1])[0].element_type
+    i64_type = ir.IntegerType.get_signless(64, jax_ctx.module_context.context)
+    prng_key = PRNGKeyOp(i64_type).result
+
+    forall_op = ForallOp(result_types, [], [], [], [0], [num_iterations], [1], outputs)
+    body_block = forall_op.regions[0].blocks.append(ir.IndexType.get(), *result_types)
+    body_ctx = jax_ctx.replace(name_stack=jax_ctx.name_stack.extend("parallel_for"))
+
+    with ir.InsertionPoint(body_block):
+        index = body_block.arguments[0]
+        PRNGStreamOp(prng_key, IndexCastOp(i64_type, index).result)
+
+        loop_iter = IndexCastOp(loop_index_type, index).result
+        loop_iter = FromElementsOp(ir.RankedTensorType.get((), loop_index_type), loop_iter).result
+
+        out, _ = mlir.jaxpr_subcomp(
+            body_ctx.module_context,
+            body_jaxpr.jaxpr,
+            body_ctx.name_stack,
+            mlir.TokenSet(),
+            [mlir.ir_constants(c) for c in body_jaxpr.consts],
+            *consts,
+            loop_iter,
+            dim_var_values=jax_ctx.dim_var_values,
+        )
+
+        in_parallel_op = InParallelOp()
+        with ir.InsertionPoint(in_parallel_op.region.blocks.append()):
+            dynamic = ir.ShapedType.get_dynamic_size()
+            for result, dest in zip(out, body_block.arguments[1:]):
+                shape = ir.RankedTensorType(dest.type).shape
+                ParallelInsertSliceOp(
+                    result,
+                    dest,
+                    [index],
+                    [dynamic] + [0] * (len(shape) - 1),
+                    [1, *shape[1:]],
+                    [1] * len(shape),
+                )
+
+    num_streams = ConstantOp(i64_type, num_iterations).result
+    PRNGStreamOp(prng_key, num_streams)
+
+    return forall_op.results
+
+
 #
 # assert
 #
@@ -2443,6 +2538,7 @@ CUSTOM_LOWERING_RULES = (
     (cond_p, _cond_lowering),
     (while_p, _while_loop_lowering),
     (for_p, _for_loop_lowering),
+    (parallel_for_p, _parallel_for_lowering),
     (grad_p, _grad_lowering),
     (func_p, _func_lowering),
     (jvp_p, _jvp_lowering),
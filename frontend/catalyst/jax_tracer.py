@@ -23,7 +23,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from enum import Enum
 from functools import partial, reduce
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import jax
 import jax.numpy as jnp
@@ -335,22 +335,25 @@ def unify_convert_result_types(jaxprs, consts, nimplouts):
 
 class QRegPromise:
     """QReg adaptor tracing the qubit extractions and insertions. The adaptor works by postponing
-    the insertions in order to re-use qubits later thus skipping the extractions."""
+    the insertions in order to re-use qubits later thus skipping the extractions.
+
+    Dynamic wires, i.e. wires which are not Python integers, are tracked in a separate set which is
+    kept up-to-date on insertions, so that each extraction only costs as much as the number of
+    wires it requests."""
 
     @debug_logger_init
     def __init__(self, qreg: DynamicJaxprTracer):
         self.base: DynamicJaxprTracer = qreg
         self.cache: Dict[Any, DynamicJaxprTracer] = {}
+        self.dynamic_wires: Set[Any] = set()
 
     @debug_logger
     def extract(self, wires: List[Any], allow_reuse=False) -> List[DynamicJaxprTracer]:
         """Extract qubits from the wrapped quantum register or get the already extracted qubits
         from cache"""
-        # pylint: disable=consider-iterating-dictionary
         qrp = self
-        cached_tracers = {w for w in qrp.cache.keys() if not isinstance(w, int)}
         requested_tracers = {w for w in wires if not isinstance(w, int)}
-        if cached_tracers != requested_tracers:
+        if qrp.dynamic_wires != requested_tracers:
             qrp.actualize()
         qubits = []
         for w in wires:
@@ -376,6 +379,8 @@ class QRegPromise:
                 qrp.cache[w] is None
             ), f"Attempting to insert an already-inserted wire {w} into {qrp.base}"
             qrp.cache[w] = qubit
+            if not isinstance(w, int):
+                qrp.dynamic_wires.add(w)
 
     @debug_logger
     def actualize(self) -> DynamicJaxprTracer:
@@ -386,6 +391,7 @@ class QRegPromise:
             if qubit is not None:
                 qreg = qinsert_p.bind(qreg, w, qubit)
         qrp.cache = {}
+        qrp.dynamic_wires = set()
         qrp.base = qreg
         return qreg
 
@@ -16,15 +16,21 @@
 compilation of hybrid quantum-classical functions using Catalyst.
 """
 
+import asyncio
 import copy
+import dataclasses
 import functools
 import inspect
 import logging
+import math
 import os
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import jax
-import jax.numpy as jnp
+import numpy as np
 import pennylane as qml
 from jax.api_util import debug_info
 from jax.interpreters import mlir
@@ -50,6 +56,7 @@ from catalyst.tracing.contexts import EvaluationContext
 from catalyst.tracing.type_signatures import (
     filter_static_args,
     get_abstract_signature,
+    get_decomposed_signature,
     get_type_annotations,
     merge_static_argname_into_argnum,
     merge_static_args,
@@ -60,7 +67,7 @@ from catalyst.utils.c_template import mlir_type_to_numpy_type
 from catalyst.utils.callables import CatalystCallable
 from catalyst.utils.exceptions import CompileError
 from catalyst.utils.filesystem import WorkspaceManager
-from catalyst.utils.gen_mlir import inject_functions
+from catalyst.utils.gen_mlir import inject_functions, set_donated_arguments
 from catalyst.utils.patching import Patcher
 
 logger = logging.getLogger(__name__)
@@ -74,6 +81,10 @@ setattr(jax.interpreters.partial_eval.DynamicJaxprTracer, "__hash__", lambda x:
 # that function is called must be consistent with the JAX configuration value.
 jax.config.update("jax_enable_x64", True)
 
+# Worker pool shared by the asynchronous calls of all QJIT objects, created on first use.
+_executor = None
+_executor_lock = threading.Lock()
+
 
 ## API ##
 @debug_logger
@@ -90,12 +101,20 @@ def qjit(
     pipelines=None,
     static_argnums=None,
     static_argnames=None,
+    donate_argnums=None,
     abstracted_axes=None,
     disable_assertions=False,
     seed=None,
     circuit_transform_pipeline=None,
     pass_plugins=None,
     dialect_plugins=None,
+    cache_dir=None,
+    persistent_session=False,
+    shot_threads=None,
+    in_process=False,
+    output_format="jax",
+    opt_level=2,
+    max_cached_versions=8,
 ):  # pylint: disable=too-many-arguments,unused-argument
     """A just-in-time decorator for PennyLane and JAX programs using Catalyst.
 
@@ -139,6 +158,11 @@ def qjit(
             positions of static arguments.
         static_argnames(str or Seqence[str]): a string or a sequence of strings that specifies the
             names of static arguments.
+        donate_argnums(int or Sequence[int]): an index or a sequence of indices that specifies the
+            positional arguments whose buffers are donated to the compiled function, which may then
+            write to them, e.g. to compute results in place instead of allocating new buffers.
+            Donated NumPy arrays must not be used after the call; JAX arrays, which are
+            immutable, are copied before being donated. See the Donated arguments section below.
         abstracted_axes (Sequence[Sequence[str]] or Dict[int, str] or Sequence[Dict[int, str]]):
             An experimental option to specify dynamic tensor shapes.
             This option affects the compilation of the annotated function.
@@ -167,6 +191,44 @@ def qjit(
             If not specified, the default pass pipeline will be applied.
         pass_plugins (Optional[List[Path]]): List of paths to pass plugins.
         dialect_plugins (Optional[List[Path]]): List of paths to dialect plugins.
+        cache_dir (Optional[str]): Directory of a persistent compilation cache shared between
+            processes. Compiled programs are stored under a hash of their MLIR, the compilation
+            options, the Catalyst version, and the plugins in use, and are reused instead of
+            recompiling in later processes. Defaults to the ``CATALYST_CACHE_DIR`` environment
+            variable, and no persistent caching is performed if neither is set. The total size of
+            the cache is bounded by ``CATALYST_CACHE_MAX_SIZE`` bytes (default 1 GiB), evicting the
+            least recently used programs first.
+        persistent_session (bool): If set to ``True``, the runtime execution context and the
+            devices it loads are kept alive between calls of the compiled function, instead of
+            being created and destroyed around every call. Device state is reset between calls,
+            and the session is closed together with the compiled function or at interpreter exit.
+            This reduces the fixed cost of each call for small, frequently executed programs.
+        shot_threads (Optional[int]): If provided, the shots of QNodes using
+            ``mcm_method="one-shot"`` are executed in parallel, on up to ``shot_threads`` threads,
+            instead of one after the other. Every shot draws its random numbers from its own stream
+            derived from ``seed``, so that seeded results do not depend on the number of threads.
+            Cannot be combined with ``async_qnodes``.
+        in_process (bool): If set to ``True``, the compiler driver runs inside the Python process
+            instead of as a separate ``catalyst`` executable, receiving the program from memory
+            rather than through temporary files. This removes a fixed start-up cost from every
+            compilation, which dominates the compile time of small programs. Programs using pass or
+            dialect plugins are always compiled by the ``catalyst`` executable.
+        output_format (str): The array type of the results of the compiled function. With the
+            default ``"jax"``, results are returned as JAX arrays, which share the memory allocated
+            by the compiled program. With ``"numpy"``, results are returned as NumPy arrays owning
+            that memory, which avoids any conversion cost, e.g. when the results are post-processed
+            with NumPy or their memory is released early.
+        opt_level (int): The optimization level of the compilation, from ``0`` to ``3``. Lower
+            levels compile faster, and higher levels produce faster programs. Level ``0`` skips the
+            optional MLIR optimizations, such as common subexpression elimination, detensorization
+            and the hoisting of buffers, and the LLVM optimizations except those required for
+            differentiation. Level ``3`` optimizes every program with the LLVM ``O3`` pipeline and
+            aggressive code generation. The default level ``2`` only runs the LLVM ``O2`` pipeline
+            on programs computing gradients.
+        max_cached_versions (int): The maximum number of compiled versions kept in memory for
+            arguments with the same PyTree structure and static arguments, e.g. for ``float32``
+            and ``float64`` inputs or different array shapes. Once the bound is exceeded, the least
+            recently used version is evicted and its library unloaded. Default is ``8``.
 
     Returns:
         QJIT object.
@@ -366,6 +428,30 @@ def qjit(
         are not yet available. Instead, compilation will be just-in-time.
 
 
+    .. details::
+        :title: Donated arguments
+
+        The results of compiled functions are usually stored in newly allocated memory. When the
+        inputs of a function are no longer needed after the call, as for the parameters of an
+        optimization step, ``donate_argnums`` allows the compiled function to reuse their memory
+        instead, while the arguments which are not donated are never written to:
+
+        .. code-block:: python
+
+            @qjit(donate_argnums=0)
+            def update(params, grad):
+                return jax.lax.dynamic_update_slice(params, params[:1] - 0.1 * grad, (0,))
+
+            params = np.zeros(1_000_000)
+            for _ in range(100):
+                params = update(params, 1.0)
+
+        Whether a result is computed in place is decided by the compiler, and the buffer of a
+        donated argument may also be used as temporary memory. Donated arrays must therefore not
+        be read after the call, other than through the results of the function. Only writable
+        NumPy arrays are donated as is, other arguments are copied first, and donated arguments
+        cannot be static or combined with ``abstracted_axes``.
+
     .. details::
         :title: Dynamically-shaped arrays
 
@@ -502,9 +588,109 @@ def qjit(
     return QJIT(fn, CompileOptions(**kwargs))
 
 
+@debug_logger
+def precompile(functions, max_workers=None):
+    """Compile several qjit-compiled functions, or several specializations of them, concurrently.
+
+    Each function is captured and lowered to MLIR on the calling thread, while the compiler driver
+    and linker jobs of the functions lowered so far run concurrently in the background. Each job
+    runs the compiler and linker as separate processes, so that the total compilation time
+    approaches that of the slowest function, rather than the sum over all functions. The results
+    are added to the compilation cache of each function, so that subsequent calls with matching
+    arguments do not compile.
+
+    Args:
+        functions (Iterable[QJIT | Tuple[QJIT, Sequence] | Tuple[QJIT, Sequence, dict]]): the
+            functions to compile. A QJIT object on its own is compiled for the signature of its
+            type hints. Otherwise, it is paired with the positional arguments, and optionally the
+            keyword arguments, to compile it for. Dynamic arguments may be concrete values or
+            abstract values such as ``jax.core.ShapedArray``.
+        max_workers (int): maximum number of concurrent compilation jobs, defaults to the number
+            of processors on the machine
+
+    **Example**
+
+    .. code-block:: python
+
+        @qjit(static_argnums=1)
+        @qml.qnode(qml.device("lightning.qubit", wires=4))
+        def circuit(x, layers):
+            for _ in range(layers):
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        catalyst.precompile([(circuit, (0.1, layers)) for layers in range(1, 9)], max_workers=8)
+
+        circuit(0.5, 3)  # no compilation occurs here
+    """
+    if EvaluationContext.is_tracing():
+        raise CompileError("Functions cannot be precompiled from within a qjit-compiled program.")
+
+    pending = []
+    # Signatures submitted in this batch, which are not in the cache until their jobs complete.
+    submitted = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for entry in functions:
+            fn, args, kwargs = entry, None, {}
+            if isinstance(entry, tuple):
+                fn, args, *rest = entry
+                kwargs = rest[0] if rest else {}
+
+            if not isinstance(fn, QJIT):
+                raise TypeError(f"Expected a qjit-compiled function to precompile, got {fn}.")
+
+            if args is None:
+                args = fn.user_sig or ()
+
+            key = (id(fn), *get_decomposed_signature(args, fn.compile_options.static_argnums))
+            if key in submitted:
+                continue
+
+            # The active state of the compiler is shared with concurrent calls of the function.
+            with fn._lock:  # pylint: disable=protected-access
+                if fn.fn_cache.lookup(args)[0] is not None:
+                    continue
+
+                fn.capture_and_lower(args, **kwargs)
+                job = fn.get_compile_job()
+                state = (fn.out_treedef, fn.out_avals, fn.c_sig, fn.workspace)
+
+            submitted.add(key)
+            pending.append((fn, args, state, executor.submit(job)))
+
+        for fn, args, (out_treedef, out_avals, c_sig, workspace), future in pending:
+            compiled_function, _ = future.result()
+
+            with fn._lock:  # pylint: disable=protected-access
+                entry = fn.fn_cache.insert(
+                    compiled_function, args, out_treedef, workspace, out_avals
+                )
+
+                # The last specialization of each function corresponds to its captured IRs.
+                fn.cache_entry = entry
+                fn.compiled_function = compiled_function
+                fn.out_treedef = out_treedef
+                fn.out_avals = out_avals
+                fn.c_sig = c_sig
+                fn.workspace = workspace
+                fn.jaxed_function = None
+
+
 ## IMPL ##
 
 
+def _get_executor():
+    """Return the worker pool shared by the asynchronous calls of all QJIT objects."""
+    global _executor  # pylint: disable=global-statement
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="catalyst")
+
+    return _executor
+
+
 # pylint: disable=too-many-instance-attributes
 class QJIT(CatalystCallable):
     """Class representing a just-in-time compiled hybrid quantum-classical function.
@@ -533,15 +719,24 @@ class QJIT(CatalystCallable):
         self.compile_options = compile_options
         self.compiler = Compiler(compile_options)
         self.fn_cache = CompilationCache(
-            compile_options.static_argnums, compile_options.abstracted_axes
+            compile_options.static_argnums,
+            compile_options.abstracted_axes,
+            compile_options.max_cached_versions,
         )
         # Active state of the compiler.
         # TODO: rework ownership of workspace, possibly CompiledFunction
         self.workspace = None
         self.c_sig = None
         self.out_treedef = None
+        self.out_avals = None
         self.compiled_function = None
+        self.cache_entry = None
         self.jaxed_function = None
+        # Worker pool for asynchronous calls, the shared default pool is used if unset.
+        self.executor = None
+        # Guards the active state of the compiler and the compilation cache, which are updated by
+        # calls from several threads. Executions of compiled functions happen outside of it.
+        self._lock = threading.RLock()
         # IRs are only available for the most recently traced function.
         self.jaxpr = None
         self.mlir_module = None
@@ -558,6 +753,11 @@ class QJIT(CatalystCallable):
                 fn, compile_options.static_argnames, compile_options.static_argnums
             )
 
+        if set(compile_options.donate_argnums) & set(compile_options.static_argnums):
+            raise CompileError("Static arguments cannot be donated.")
+        if compile_options.donate_argnums and compile_options.abstracted_axes is not None:
+            raise CompileError("Donated arguments are not supported with abstracted axes.")
+
         self.user_function = self.pre_compilation()
 
         # Static arguments require values, so we cannot AOT compile.
@@ -593,19 +793,162 @@ class QJIT(CatalystCallable):
 
             return self.user_function(*args, **kwargs)
 
-        requires_promotion = self.jit_compile(args, **kwargs)
+        with self._lock:
+            requires_promotion = self.jit_compile(args, **kwargs)
+
+            # If we receive tracers as input, dispatch to the JAX integration.
+            if any(isinstance(arg, jax.core.Tracer) for arg in tree_flatten(args)[0]):
+                jaxed_function = self.get_jaxed_function()
+            else:
+                jaxed_function = None
+                # Concurrent calls may compile other signatures, evicting this function from the
+                # cache, so its shared object is kept loaded until the execution has completed.
+                cache_entry = self.cache_entry
+                cache_entry.compiled_fn.shared_object.acquire()
+
+        if jaxed_function is not None:
+            return jaxed_function(*args, **kwargs)
+
+        try:
+            if requires_promotion:
+                dynamic_args = filter_static_args(args, self.compile_options.static_argnums)
+                args = promote_arguments(cache_entry.signature, dynamic_args)
+
+            return self.run(args, kwargs, cache_entry)
+        finally:
+            cache_entry.compiled_fn.shared_object.release()
+
+    @debug_logger
+    def get_jaxed_function(self):
+        """Return the wrapper enabling JAX transformations of the active compiled function. The
+        wrapper is created lazily and stored in the compilation cache alongside the function, such
+        that the derivatives compiled for a signature survive the recompilation of the function for
+        other signatures.
+
+        Returns:
+            JAX_QJIT: the wrapper of the active compiled function
+        """
+        if self.jaxed_function is None:
+            self.jaxed_function = JAX_QJIT(self)  # lazy gradient compilation
+            if self.cache_entry is not None:
+                self.cache_entry.jaxed_function = self.jaxed_function
+        return self.jaxed_function
+
+    @debug_logger
+    def precompile_derivatives(self, *args, argnums=0, modes=("reverse",)):
+        """Compile the derivatives used to differentiate the function with JAX ahead of time.
+
+        The derivatives are otherwise only compiled the first time they are evaluated. Like the
+        compiled function itself, they are cached for the signature of the provided arguments.
+
+        Args:
+            *args: arguments to compile the function and its derivatives for
+            argnums (Union[int, Sequence[int]]): indices of the arguments to differentiate
+            modes (Sequence[str]): differentiation modes to prepare, ``"forward"`` for
+                ``jax.jvp`` and ``jax.jacfwd``, or ``"reverse"`` for ``jax.grad`` and
+                ``jax.jacobian``
+
+        **Example**
+
+        .. code-block:: python
+
+            @qjit
+            @qml.qnode(qml.device("lightning.qubit", wires=1))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                return qml.expval(qml.PauliZ(0))
+
+            circuit.precompile_derivatives(0.1)
+
+            jax.grad(circuit)(0.5)  # no compilation occurs here
+        """
+        if EvaluationContext.is_tracing():
+            raise CompileError("Derivatives cannot be precompiled from within a qjit function.")
+
+        kinds = {"forward": "jvp", "reverse": "vjp"}
+        if any(mode not in kinds for mode in modes):
+            raise ValueError(f"Differentiation modes must be 'forward' or 'reverse', got {modes}.")
+
+        argnums = [argnums] if isinstance(argnums, int) else sorted(argnums)
+
+        with self._lock:
+            self.jit_compile(args)
+            for mode in modes:
+                self.get_jaxed_function().get_derivative_qjit(kinds[mode], argnums)
+
+    @debug_logger
+    def submit(self, *args, **kwargs):
+        """Invoke the compiled function asynchronously on a worker thread.
+
+        Both the compilation, if required, and the execution are scheduled on ``self.executor``,
+        or on a thread pool shared by all QJIT objects if it is not set, so that the calling
+        thread is never blocked. Compilation errors are therefore raised by the returned future.
+        The execution does not hold the GIL while the compiled program runs, and all executions
+        share the process-wide runtime context, which is reference counted and remains alive while
+        any of them is in flight, so that many calls can be in flight at once.
+
+        Args:
+            *args: the positional arguments to the compiled function, which must not be tracers
+            **kwargs: the keyword arguments to the compiled function
+
+        Returns:
+            concurrent.futures.Future: a future resolving to the results of the execution, arranged
+            into the original function's output PyTrees
+
+        **Example**
+
+        .. code-block:: python
+
+            @qjit
+            @qml.qnode(qml.device("lightning.qubit", wires=1))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                return qml.expval(qml.PauliZ(0))
+
+        >>> futures = [circuit.submit(x) for x in (0.1, 0.2, 0.3)]
+        >>> [f.result() for f in futures]
+        [Array(0.99500417, dtype=float64), Array(0.98006658, dtype=float64),
+        Array(0.95533649, dtype=float64)]
+        """
+        if EvaluationContext.is_tracing():
+            raise CompileError("Asynchronous calls of qjit-compiled functions cannot be traced.")
 
-        # If we receive tracers as input, dispatch to the JAX integration.
         if any(isinstance(arg, jax.core.Tracer) for arg in tree_flatten(args)[0]):
-            if self.jaxed_function is None:
-                self.jaxed_function = JAX_QJIT(self)  # lazy gradient compilation
-            return self.jaxed_function(*args, **kwargs)
+            raise CompileError(
+                "Asynchronous calls of qjit-compiled functions require concrete arguments."
+            )
+
+        def execute():
+            runner, out_treedef, shared_object = self.get_runner(args, kwargs)
+            try:
+                return tree_unflatten(out_treedef, runner(*args))
+            finally:
+                shared_object.release()
+
+        executor = self.executor or _get_executor()
+        return executor.submit(execute)
+
+    async def call_async(self, *args, **kwargs):
+        """Invoke the compiled function from a coroutine without blocking the event loop.
 
-        elif requires_promotion:
-            dynamic_args = filter_static_args(args, self.compile_options.static_argnums)
-            args = promote_arguments(self.c_sig, dynamic_args)
+        This is the awaitable counterpart of :meth:`~.QJIT.submit`, see its documentation for
+        details.
+
+        Args:
+            *args: the positional arguments to the compiled function
+            **kwargs: the keyword arguments to the compiled function
+
+        Returns:
+            Any: results of the execution arranged into the original function's output PyTrees
 
-        return self.run(args, kwargs)
+        **Example**
+
+        >>> async def evaluate(xs):
+        ...     return await asyncio.gather(*(circuit.call_async(x) for x in xs))
+        >>> asyncio.run(evaluate([0.1, 0.2]))
+        [Array(0.99500417, dtype=float64), Array(0.98006658, dtype=float64)]
+        """
+        return await asyncio.wrap_future(self.submit(*args, **kwargs))
 
     @debug_logger
     def aot_compile(self):
@@ -618,14 +961,19 @@ class QJIT(CatalystCallable):
             self.jaxpr, self.out_type, self.out_treedef, self.c_sig = self.capture(
                 self.user_sig or ()
             )
+            self.out_avals = self.jaxpr.out_avals
 
         if self.compile_options.target in ("mlir", "binary"):
             self.mlir_module = self.generate_ir()
 
         if self.compile_options.target in ("binary",):
             self.compiled_function, _ = self.compile()
-            self.fn_cache.insert(
-                self.compiled_function, self.user_sig, self.out_treedef, self.workspace
+            self.cache_entry = self.fn_cache.insert(
+                self.compiled_function,
+                self.user_sig,
+                self.out_treedef,
+                self.workspace,
+                self.out_avals,
             )
 
     @property
@@ -659,32 +1007,42 @@ class QJIT(CatalystCallable):
 
             # Cleanup before recompilation:
             #  - recompilation should always happen in new workspace
-            #  - compiled functions for jax integration are not yet cached
-            #  - close existing shared library
-            self.workspace = self._get_workspace()
-            self.jaxed_function = None
-            if self.compiled_function and self.compiled_function.shared_object:
-                self.compiled_function.shared_object.close()
-
-            self.jaxpr, self.out_type, self.out_treedef, self.c_sig = self.capture(args, **kwargs)
-
-            self.mlir_module = self.generate_ir()
+            # The existing shared library stays open, as it remains available in the cache.
+            self.capture_and_lower(args, **kwargs)
             self.compiled_function, _ = self.compile()
 
-            self.fn_cache.insert(self.compiled_function, args, self.out_treedef, self.workspace)
+            self.cache_entry = self.fn_cache.insert(
+                self.compiled_function, args, self.out_treedef, self.workspace, self.out_avals
+            )
 
         elif self.compiled_function is not cached_fn.compiled_fn:
-            # Restore active state from cache.
+            # Restore active state from cache, including the derivatives compiled for it.
             self.workspace = cached_fn.workspace
             self.compiled_function = cached_fn.compiled_fn
             self.out_treedef = cached_fn.out_treedef
+            self.out_avals = cached_fn.out_avals
             self.c_sig = cached_fn.signature
-            self.jaxed_function = None
-
-            self.compiled_function.shared_object.open()
+            self.cache_entry = cached_fn
+            self.jaxed_function = cached_fn.jaxed_function
 
         return requires_promotion
 
+    @debug_logger
+    def capture_and_lower(self, args, **kwargs):
+        """Capture the program for the supplied arguments and generate its MLIR module, replacing
+        the active state of the compiler.
+
+        Args:
+            args (Iterable): arguments to use for program capture
+        """
+        self.workspace = self._get_workspace()
+        self.jaxed_function = None
+
+        self.jaxpr, self.out_type, self.out_treedef, self.c_sig = self.capture(args, **kwargs)
+        self.out_avals = self.jaxpr.out_avals
+
+        self.mlir_module = self.generate_ir()
+
     # Processing Stages #
 
     @instrument
@@ -745,6 +1103,7 @@ class QJIT(CatalystCallable):
             pass_pipeline = params.get("pass_pipeline", default_pass_pipeline)
             params["pass_pipeline"] = pass_pipeline
             params["debug_info"] = dbg
+            params["shot_threads"] = self.compile_options.shot_threads
 
             return QFunc.__call__(
                 qnode,
@@ -778,6 +1137,9 @@ class QJIT(CatalystCallable):
         # Inject Runtime Library-specific functions (e.g. setup/teardown).
         inject_functions(mlir_module, ctx, self.compile_options.seed)
 
+        if self.compile_options.donate_argnums:
+            set_donated_arguments(mlir_module, ctx, self._get_donated_arguments(mlir_module))
+
         return mlir_module
 
     @instrument(size_from=1, has_finegrained=True)
@@ -789,6 +1151,20 @@ class QJIT(CatalystCallable):
             Tuple[CompiledFunction, str]: the compilation result and LLVMIR
         """
 
+        return self.get_compile_job()()
+
+    @debug_logger
+    def get_compile_job(self):
+        """Prepare the compilation of the current MLIR module to LLVMIR and shared library code.
+
+        The returned job runs the compiler driver and linker without accessing the state of the QJIT
+        object, so that it may execute on another thread while other functions are being traced.
+
+        Returns:
+            Callable[[], Tuple[CompiledFunction, str]]: a job producing the compilation result and
+            LLVMIR
+        """
+
         # WARNING: assumption is that the first function is the entry point to the compiled program.
         entry_point_func = self.mlir_module.body.operations[0]
         restype = entry_point_func.type.results
@@ -805,40 +1181,110 @@ class QJIT(CatalystCallable):
         # `replace` method, so we need to get a regular Python string out of it.
         func_name = str(self.mlir_module.body.operations[0].name).replace('"', "")
         if self.overwrite_ir:
-            shared_object, llvm_ir = self.compiler.run_from_ir(
-                self.overwrite_ir,
-                str(self.mlir_module.operation.attributes["sym_name"]).replace('"', ""),
-                self.workspace,
-            )
+            ir = self.overwrite_ir
+            module_name = str(self.mlir_module.operation.attributes["sym_name"]).replace('"', "")
         else:
-            shared_object, llvm_ir = self.compiler.run(self.mlir_module, self.workspace)
+            ir, module_name = self.compiler.get_module_ir(self.mlir_module)
 
-        compiled_fn = CompiledFunction(
-            shared_object, func_name, restype, self.out_type, self.compile_options
-        )
+        compiler = self.compiler
+        workspace = self.workspace
+        out_type = self.out_type
+        compile_options = self.compile_options
+
+        def compile_job():
+            shared_object, llvm_ir = compiler.run_from_ir(ir, module_name, workspace)
+            compiled_fn = CompiledFunction(
+                shared_object, func_name, restype, out_type, compile_options
+            )
+            return compiled_fn, llvm_ir
 
-        return compiled_fn, llvm_ir
+        return compile_job
 
     @instrument(has_finegrained=True)
     @debug_logger
-    def run(self, args, kwargs):
+    def run(self, args, kwargs, cache_entry=None):
         """Invoke a previously compiled function with the supplied arguments.
 
         Args:
             args (Iterable): the positional arguments to the compiled function
             kwargs: the keyword arguments to the compiled function
+            cache_entry (Optional[CacheEntry]): the compiled function to invoke, which defaults to
+                the active one
 
         Returns:
             Any: results of the execution arranged into the original function's output PyTrees
         """
-
-        results = self.compiled_function(*args, **kwargs)
+        if cache_entry is None:
+            results = self.compiled_function(*args, **kwargs)
+            out_treedef = self.out_treedef
+        else:
+            results = cache_entry.compiled_fn(*args, **kwargs)
+            out_treedef = cache_entry.out_treedef
 
         # TODO: Move this to the compiled function object.
-        return tree_unflatten(self.out_treedef, results)
+        return tree_unflatten(out_treedef, results)
+
+    @debug_logger
+    def get_runner(self, args, kwargs):
+        """Compile the function for the supplied arguments, and return a callable which invokes
+        the compiled function on arguments of the same signature.
+
+        Unlike calling the QJIT object, the returned callable does not update the state of the QJIT
+        object, which makes it safe to use from several threads concurrently.
+
+        Args:
+            args (Iterable): the positional arguments to use for compilation
+            kwargs: the keyword arguments to use for compilation and execution
+
+        Returns:
+            Callable: a function mapping positional arguments to the flat list of results
+            PyTreeDef: the PyTree definition of the results
+            SharedObjectManager: the shared object of the compiled function, acquired on behalf of
+            the caller, which must release it once the callable is no longer used
+        """
+        with self._lock:
+            requires_promotion = self.jit_compile(args, **kwargs)
+            compiled_function = self.compiled_function
+            out_treedef = self.out_treedef
+            c_sig = self.c_sig
+            # Keep the shared object loaded even if the compiled function is evicted from the cache
+            # while the callable is still in use.
+            shared_object = compiled_function.shared_object
+            shared_object.acquire()
+
+        static_argnums = self.compile_options.static_argnums
+
+        def runner(*args):
+            if requires_promotion:
+                dynamic_args = filter_static_args(args, static_argnums)
+                args = promote_arguments(c_sig, dynamic_args)
+            return compiled_function(*args, **kwargs)
+
+        return runner, out_treedef, shared_object
 
     # Helper Methods #
 
+    def _get_donated_arguments(self, mlir_module):
+        """Flag which arguments of the entry function of the module are donated. The flattened
+        dynamic positional arguments come first, followed by the keyword arguments, which cannot be
+        donated."""
+        donate_argnums = self.compile_options.donate_argnums
+        static_argnums = self.compile_options.static_argnums
+        num_positional = len(self.c_sig) + len(static_argnums)
+        if max(donate_argnums) >= num_positional:
+            raise CompileError(
+                f"Donated argument index {max(donate_argnums)} is out of range for a function "
+                f"with {num_positional} positional arguments."
+            )
+
+        dynamic_argnums = [i for i in range(num_positional) if i not in static_argnums]
+        donated = []
+        for argnum, arg_sig in zip(dynamic_argnums, self.c_sig):
+            donated += [argnum in donate_argnums] * len(tree_flatten(arg_sig)[0])
+
+        num_entry_args = len(mlir_module.body.operations[0].arguments)
+        return donated + [False] * (num_entry_args - len(donated))
+
     def _validate_configuration(self):
         """Run validations on the supplied options and parameters."""
         if not hasattr(self.original_function, "__name__"):
@@ -863,9 +1309,11 @@ class JAX_QJIT:
 
     The primary mechanism through which this is effected is by wrapping the invocation of the QJIT
     object inside a JAX ``pure_callback``. Additionally, a custom JVP is defined in order to support
-    JAX-based differentiation, which is itself a ``pure_callback`` around a second QJIT object which
-    invokes :func:`~.grad` on the original function. Using this class thus incurs additional
-    compilation time.
+    JAX-based differentiation. The JVP is a linear function of the tangents implemented as a
+    ``pure_callback`` around a second QJIT object which invokes :func:`~.jvp` on the original
+    function, and whose transpose is a ``pure_callback`` around a QJIT object which invokes
+    :func:`~.vjp`. Using this class thus incurs additional compilation time, which is deferred until
+    the respective derivative is first evaluated.
 
     Args:
         qjit_function (QJIT): the compiled quantum function object to wrap
@@ -875,92 +1323,197 @@ class JAX_QJIT:
     def __init__(self, qjit_function):
         @jax.custom_jvp
         def jaxed_function(*args, **kwargs):
-            return self.wrap_callback(qjit_function, *args, **kwargs)
+            return self.wrap_callback(*args, **kwargs)
 
         self.qjit_function = qjit_function
         self.derivative_functions = {}
+        # Batched versions of the function, ordered from least to most recently used.
+        self.batched_functions = OrderedDict()
+        self._batched_lock = threading.Lock()
         self.jaxed_function = jaxed_function
         jaxed_function.defjvp(self.compute_jvp, symbolic_zeros=True)
 
-    @staticmethod
+        # The derivatives are compiled lazily, by which time the wrapped QJIT may have been
+        # recompiled for a different signature. Keep the signature this wrapper was created for.
+        self.c_sig = qjit_function.c_sig
+        self.out_avals = qjit_function.out_avals
+        self.out_treedef = qjit_function.out_treedef
+        # The functions compiled for JAX receive the buffers of callback arguments owned by JAX.
+        self.compile_options = dataclasses.replace(
+            qjit_function.compile_options, donate_argnums=None
+        )
+
     @debug_logger
-    def wrap_callback(qjit_function, *args, **kwargs):
-        """Wrap a QJIT function inside a jax host callback."""
+    def wrap_callback(self, *args, **kwargs):
+        """Wrap the QJIT function inside a jax host callback. When the callback is vectorized with
+        ``jax.vmap``, it receives the whole batch, which is executed by a single call to a batched
+        version of the QJIT function."""
+        # Keyword arguments are not part of the compiled signature, and cannot be batched.
+        vmap_method = "sequential" if kwargs else "broadcast_all"
         data = jax.pure_callback(
-            qjit_function, qjit_function.jaxpr.out_avals, *args, vmap_method="sequential", **kwargs
+            self.batched_callback, self.out_avals, *args, vmap_method=vmap_method, **kwargs
         )
 
         # Unflatten the return value w.r.t. the original PyTree definition if available
-        assert qjit_function.out_treedef is not None, "PyTree shape must not be none."
-        return tree_unflatten(qjit_function.out_treedef, data)
+        assert self.out_treedef is not None, "PyTree shape must not be none."
+        return tree_unflatten(self.out_treedef, data)
 
     @debug_logger
-    def get_derivative_qjit(self, argnums):
-        """Compile a function computing the derivative of the wrapped QJIT for the given argnums."""
+    def batched_callback(self, *args, **kwargs):
+        """Call the QJIT function on arguments which may carry leading batch dimensions, in which
+        case the batch is flattened and executed by a batched version of the QJIT function."""
+        args_flat, args_tree = tree_flatten(args)
+        arrays = [
+            (arg, aval)
+            for arg, aval in zip(args_flat, tree_flatten(self.c_sig)[0])
+            if hasattr(aval, "shape")
+        ]
+
+        batch_ndim = np.ndim(arrays[0][0]) - len(arrays[0][1].shape) if arrays else 0
+        if batch_ndim == 0:
+            return tree_flatten(self.qjit_function(*args, **kwargs))[0]
+
+        batch_shape = np.shape(arrays[0][0])[:batch_ndim]
+        batch_size = math.prod(batch_shape)
+        args_flat = [
+            np.reshape(arg, (batch_size, *np.shape(arg)[batch_ndim:])) for arg in args_flat
+        ]
+        args = tree_unflatten(args_tree, args_flat)
+
+        # The batched function must not be evicted by another call before its shared object has
+        # been acquired by the runner.
+        with self._batched_lock:
+            batched_qjit = self.get_batched_qjit(batch_size)
+            runner, _, shared_object = batched_qjit.get_runner(args, {})
+
+        try:
+            results = runner(*args)
+        finally:
+            shared_object.release()
+
+        return [np.reshape(res, (*batch_shape, *np.shape(res)[1:])) for res in results]
 
-        argnum_key = "".join(str(idx) for idx in argnums)
-        if argnum_key in self.derivative_functions:
-            return self.derivative_functions[argnum_key]
+    @debug_logger
+    def get_batched_qjit(self, batch_size):
+        """Compile a function mapping the wrapped QJIT over ``batch_size`` arguments, stacked along
+        their leading axis, with :func:`~.vmap`.
 
-        # Here we define the signature for the new QJIT object explicitly, rather than relying on
-        # functools.wrap, in order to guarantee compilation is triggered on instantiation.
-        # The signature of the original QJIT object is guaranteed to be defined by now, located
-        # in QJIT.c_sig, however we don't update the original function with these annotations.
-        annotations = {}
-        updated_params = []
-        signature = inspect.signature(self.qjit_function)
-        for idx, (arg_name, param) in enumerate(signature.parameters.items()):
-            annotations[arg_name] = self.qjit_function.c_sig[idx]
-            updated_params.append(param.replace(annotation=annotations[arg_name]))
+        Like the versions of a QJIT, at most ``max_cached_versions`` batch sizes are kept, and the
+        least recently used one is evicted beyond that, closing its shared objects."""
+
+        if batch_size in self.batched_functions:
+            self.batched_functions.move_to_end(batch_size)
+            return self.batched_functions[batch_size]
+
+        def batch_aval(aval):
+            return jax.core.ShapedArray((batch_size, *aval.shape), aval.dtype)
+
+        params = [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=jax.tree_util.tree_map(batch_aval, self.c_sig[idx]),
+            )
+            for idx, name in enumerate(inspect.signature(self.qjit_function).parameters)
+        ]
+
+        def batched_wrapper(*args):
+            return catalyst.vmap(self.qjit_function)(*args)
 
-        def deriv_wrapper(*args, **kwargs):
-            return catalyst.jacobian(self.qjit_function, argnums=argnums)(*args, **kwargs)
+        batched_wrapper.__name__ = f"batched_{self.qjit_function.__name__}"
+        batched_wrapper.__annotations__ = {param.name: param.annotation for param in params}
+        batched_wrapper.__signature__ = inspect.Signature(params)
 
-        deriv_wrapper.__name__ = "deriv_" + self.qjit_function.__name__
-        deriv_wrapper.__annotations__ = annotations
-        deriv_wrapper.__signature__ = signature.replace(parameters=updated_params)
+        batched_qjit = QJIT(batched_wrapper, self.compile_options)
+        self.batched_functions[batch_size] = batched_qjit
 
-        self.derivative_functions[argnum_key] = QJIT(
-            deriv_wrapper, self.qjit_function.compile_options
+        while len(self.batched_functions) > self.compile_options.max_cached_versions:
+            _, evicted = self.batched_functions.popitem(last=False)
+            evicted.fn_cache.clear()
+
+        return batched_qjit
+
+    @debug_logger
+    def wrap_derivative_callback(self, kind, argnums, result_shape_dtypes, *args):
+        """Wrap the derivative QJIT function of the given kind inside a jax host callback. The
+        derivative is only compiled once the callback is first executed."""
+
+        def callback(*args):
+            return tree_flatten(self.get_derivative_qjit(kind, argnums)(*args))[0]
+
+        return jax.pure_callback(callback, result_shape_dtypes, *args, vmap_method="sequential")
+
+    @debug_logger
+    def get_derivative_qjit(self, kind, argnums):
+        """Compile a function computing the JVP (``kind="jvp"``) or VJP (``kind="vjp"``) of the
+        wrapped QJIT for the given argnums. The function takes the arguments of the wrapped QJIT,
+        followed by the tangents of the differentiable arguments or the cotangents of the results,
+        respectively."""
+
+        key = (kind, tuple(argnums))
+        if key in self.derivative_functions:
+            return self.derivative_functions[key]
+
+        # Here we define the signature for the new QJIT object explicitly, rather than relying on
+        # functools.wrap, in order to guarantee compilation is triggered on instantiation.
+        signature = inspect.signature(self.qjit_function)
+        arg_names = list(signature.parameters)
+        params = [(name, self.c_sig[idx]) for idx, name in enumerate(arg_names)]
+        if kind == "jvp":
+            params += [(f"{arg_names[idx]}_tangent", self.c_sig[idx]) for idx in argnums]
+        else:
+            params += [(f"cotangent_{idx}", aval) for idx, aval in enumerate(self.out_avals)]
+        num_args = len(arg_names)
+
+        def deriv_wrapper(*args):
+            primals, vectors = args[:num_args], args[num_args:]
+            deriv_fn = catalyst.jvp if kind == "jvp" else catalyst.vjp
+            return deriv_fn(self.qjit_function, primals, vectors, argnums=argnums)[1]
+
+        deriv_wrapper.__name__ = f"{kind}_{self.qjit_function.__name__}"
+        deriv_wrapper.__annotations__ = dict(params)
+        deriv_wrapper.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=aval)
+                for name, aval in params
+            ]
         )
-        return self.derivative_functions[argnum_key]
+
+        self.derivative_functions[key] = QJIT(deriv_wrapper, self.compile_options)
+        return self.derivative_functions[key]
 
     @debug_logger
     def compute_jvp(self, primals, tangents):
         """Compute the set of results and JVPs for a QJIT function."""
-        # Assume we have primals of shape `[a,b]` and results of shape `[c,d]`. Derivatives [2]
-        # would get the shape `[c,d,a,b]` and tangents [1] would have the same shape as primals.
-        # Now, In this function we apply tensordot using the pattern `[c,d,a,b]*[a,b] -> [c,d]`.
+        # The JVPs are computed by a linear function of the tangents, with the VJP as its transpose.
+        # Forward-mode differentiation thus evaluates one JVP and reverse-mode differentiation one
+        # VJP of the QJIT function, rather than its full Jacobian.
 
-        # Optimization: Do not compute Jacobians for arguments which do not participate in
+        # Optimization: Do not compute derivatives for arguments which do not participate in
         #               differentiation.
         argnums = []
         for idx, tangent in enumerate(tangents):
             if not isinstance(tangent, jax.custom_derivatives.SymbolicZero):
                 argnums.append(idx)
 
-        results = self.wrap_callback(self.qjit_function, *primals)
-        results_data, _results_shape = tree_flatten(results)
-        derivatives = self.wrap_callback(self.get_derivative_qjit(argnums), *primals)
-        derivatives_data, _derivatives_shape = tree_flatten(derivatives)
-
-        jvps = [jnp.zeros_like(results_data[res_idx]) for res_idx in range(len(results_data))]
-        for diff_arg_idx, arg_idx in enumerate(argnums):
-            tangent = tangents[arg_idx]  # [1]
-            taxis = list(range(tangent.ndim))
-            for res_idx in range(len(results_data)):
-                deriv_idx = diff_arg_idx + res_idx * len(argnums)
-                deriv = derivatives_data[deriv_idx]  # [2]
-                daxis = list(range(deriv.ndim - tangent.ndim, deriv.ndim))
-                jvp = jnp.tensordot(deriv, tangent, axes=(daxis, taxis))
-                jvps[res_idx] = jvps[res_idx] + jvp
-
-        # jvps must match the type of primals
-        # due to pytrees, primals are a tuple
-        primal_type = type(primals)
-        jvps = primal_type(jvps)
-        if len(jvps) == 1:
-            jvps = jvps[0]
+        results = self.wrap_callback(*primals)
+
+        def jvp(primals, tangents):
+            data = self.wrap_derivative_callback(
+                "jvp", argnums, self.out_avals, *primals, *tangents
+            )
+            return tree_unflatten(self.out_treedef, data)
+
+        def vjp(primals, cotangents):
+            arg_avals = [self.c_sig[idx] for idx in argnums]
+            cotangents, _ = tree_flatten(cotangents)
+            return tuple(
+                self.wrap_derivative_callback("vjp", argnums, arg_avals, *primals, *cotangents)
+            )
+
+        jvps = jax.custom_derivatives.linear_call(
+            jvp, vjp, tuple(primals), tuple(tangents[idx] for idx in argnums)
+        )
 
         return results, jvps
 
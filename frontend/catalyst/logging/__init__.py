@@ -14,7 +14,31 @@
 
 """
 Wrapper for PennyLane logging module.
+
+Functions are only wrapped with the PennyLane logging decorators if debug logging is enabled for
+their module at the time they are defined, so that functions on hot paths, such as those called
+for every traced gate, do not pay for the logging wrappers when logging is disabled. Logging thus
+needs to be enabled, e.g. with ``qml.logging.enable_logging()``, before Catalyst is imported.
 """
-from pennylane.logging import debug_logger, debug_logger_init
+import logging
+
+from pennylane.logging import debug_logger as _debug_logger
+from pennylane.logging import debug_logger_init as _debug_logger_init
 
 __all__ = ("debug_logger", "debug_logger_init")
+
+
+def _is_debug_enabled(func) -> bool:
+    """Whether debug logging is enabled for the module defining ``func``."""
+    return logging.getLogger(getattr(func, "__module__", __name__)).isEnabledFor(logging.DEBUG)
+
+
+def debug_logger(func):
+    """Log the calls to ``func`` if debug logging is enabled, otherwise return it unchanged."""
+    return _debug_logger(func) if _is_debug_enabled(func) else func
+
+
+def debug_logger_init(func):
+    """Log the calls to the ``__init__`` method ``func`` if debug logging is enabled, otherwise
+    return it unchanged."""
+    return _debug_logger_init(func) if _is_debug_enabled(func) else func
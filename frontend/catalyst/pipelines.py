@@ -96,6 +96,8 @@ class CompileOptions:
             Default is ``None``.
         static_argnames (Optional[Union[str, Iterable[str]]]): names of static arguments.
             Default is ``None``.
+        donate_argnums (Optional[Union[int, Iterable[int]]]): indices of arguments whose buffers
+            are donated to the compiled function. Default is ``None``.
         abstracted_axes (Optional[Any]): store the abstracted_axes value. Defaults to ``None``.
         disable_assertions (Optional[bool]): disables all assertions. Default is ``False``.
         seed (Optional[int]) : the seed for random operations in a qjit call.
@@ -106,6 +108,20 @@ class CompileOptions:
             Default is None.
         pass_plugins (Optional[Iterable[Path]]): List of paths to pass plugins.
         dialect_plugins (Optional[Iterable[Path]]): List of paths to dialect plugins.
+        cache_dir (Optional[str]): Directory of the persistent compilation cache. If ``None``, the
+            ``CATALYST_CACHE_DIR`` environment variable is used instead, if set.
+        persistent_session (Optional[bool]): flag indicating whether to keep the runtime execution
+            context and devices alive between calls of the compiled function. Default is ``False``.
+        shot_threads (Optional[int]): number of threads executing the shots of QNodes with
+            ``mcm_method="one-shot"`` in parallel. Default is ``None``, for sequential execution.
+        in_process (Optional[bool]): flag indicating whether to run the compiler driver inside the
+            Python process rather than as a separate executable. Default is ``False``.
+        output_format (Optional[str]): array type of the results of compiled functions, either
+            ``"jax"`` for JAX arrays or ``"numpy"`` for NumPy arrays. Default is ``"jax"``.
+        opt_level (Optional[int]): optimization level of the compilation, from 0 to 3, trading the
+            performance of the compiled program for compilation time. Default is ``2``.
+        max_cached_versions (Optional[int]): maximum number of compiled versions kept in memory
+            per argument PyTree structure and static arguments. Default is ``8``.
     """
 
     verbose: Optional[bool] = False
@@ -118,6 +134,7 @@ class CompileOptions:
     async_qnodes: Optional[bool] = False
     static_argnums: Optional[Union[int, Iterable[int]]] = None
     static_argnames: Optional[Union[str, Iterable[str]]] = None
+    donate_argnums: Optional[Union[int, Iterable[int]]] = None
     abstracted_axes: Optional[Union[Iterable[Iterable[str]], Dict[int, str]]] = None
     lower_to_llvm: Optional[bool] = True
     checkpoint_stage: Optional[str] = ""
@@ -126,6 +143,13 @@ class CompileOptions:
     circuit_transform_pipeline: Optional[dict[str, dict[str, str]]] = None
     pass_plugins: Optional[Set[Path]] = None
     dialect_plugins: Optional[Set[Path]] = None
+    cache_dir: Optional[str] = None
+    persistent_session: Optional[bool] = False
+    shot_threads: Optional[int] = None
+    in_process: Optional[bool] = False
+    output_format: Optional[str] = "jax"
+    opt_level: Optional[int] = 2
+    max_cached_versions: Optional[int] = 8
 
     def __post_init__(self):
         # Convert keep_intermediate to Enum
@@ -141,6 +165,32 @@ class CompileOptions:
                 """
             )
 
+        if self.shot_threads is not None:
+            if not isinstance(self.shot_threads, int) or self.shot_threads < 1:
+                raise ValueError(
+                    "Invalid 'shot_threads'; it must be a positive integer, "
+                    f"but got {self.shot_threads}"
+                )
+            if self.async_qnodes:
+                raise CompileError("Parallel shots are not supported with asynchronous QNodes.")
+
+        if self.output_format not in ("jax", "numpy"):
+            raise ValueError(
+                "Invalid 'output_format'; it must be 'jax' or 'numpy', "
+                f"but got {self.output_format}"
+            )
+
+        if not isinstance(self.opt_level, int) or not 0 <= self.opt_level <= 3:
+            raise ValueError(
+                f"Invalid 'opt_level'; it must be 0, 1, 2 or 3, but got {self.opt_level}"
+            )
+
+        if not isinstance(self.max_cached_versions, int) or self.max_cached_versions < 1:
+            raise ValueError(
+                "Invalid 'max_cached_versions'; it must be a positive integer, "
+                f"but got {self.max_cached_versions}"
+            )
+
         # Check that seed is 32-bit unsigned int
         if (self.seed is not None) and (self.seed < 0 or self.seed > 2**32 - 1):
             raise ValueError(
@@ -158,6 +208,14 @@ class CompileOptions:
         elif isinstance(static_argnums, Iterable):
             self.static_argnums = tuple(static_argnums)
 
+        donate_argnums = self.donate_argnums
+        if donate_argnums is None:
+            self.donate_argnums = ()
+        elif isinstance(donate_argnums, int):
+            self.donate_argnums = (donate_argnums,)
+        elif isinstance(donate_argnums, Iterable):
+            self.donate_argnums = tuple(donate_argnums)
+
         if self.pass_plugins is None:
             self.pass_plugins = set()
         else:
@@ -219,8 +277,11 @@ def get_enforce_runtime_invariants_stage(_options: CompileOptions) -> List[str]:
     return enforce_runtime_invariants
 
 
-def get_hlo_lowering_stage(_options: CompileOptions) -> List[str]:
+def get_hlo_lowering_stage(options: CompileOptions) -> List[str]:
     """Returns the list of passes to lower StableHLO to upstream MLIR dialects."""
+    # Common subexpression elimination and detensorization only improve the compiled program.
+    optimize = options.opt_level > 0
+
     hlo_lowering = [
         "canonicalize",
         "func.func(chlo-legalize-to-hlo)",
@@ -233,12 +294,12 @@ def get_hlo_lowering_stage(_options: CompileOptions) -> List[str]:
         "canonicalize",
         "scatter-lowering",
         "hlo-custom-call-lowering",
-        "cse",
-        "func.func(linalg-detensorize{aggressive-mode})",
-        "detensorize-scf",
+        "cse" if optimize else None,
+        "func.func(linalg-detensorize{aggressive-mode})" if optimize else None,
+        "detensorize-scf" if optimize else None,
         "canonicalize",
     ]
-    return hlo_lowering
+    return list(filter(partial(is_not, None), hlo_lowering))
 
 
 def get_quantum_compilation_stage(options: CompileOptions) -> List[str]:
@@ -266,6 +327,9 @@ def get_bufferization_stage(options: CompileOptions) -> List[str]:
     if options.async_qnodes:
         bufferization_options += " copy-before-write"
 
+    # Moving allocations out of loops and onto the stack only improves the compiled program.
+    optimize = options.opt_level > 0
+
     bufferization = [
         "inline",
         "convert-tensor-to-linalg",  # tensor.pad
@@ -278,9 +342,9 @@ def get_bufferization_stage(options: CompileOptions) -> List[str]:
         "canonicalize",  # Remove dead memrefToTensorOp's
         "gradient-postprocess",
         # introduced during gradient-bufferize of callbacks
-        "func.func(buffer-hoisting)",
-        "func.func(buffer-loop-hoisting)",
-        "func.func(promote-buffers-to-stack)",
+        "func.func(buffer-hoisting)" if optimize else None,
+        "func.func(buffer-loop-hoisting)" if optimize else None,
+        "func.func(promote-buffers-to-stack)" if optimize else None,
         # TODO: migrate to new buffer deallocation "buffer-deallocation-pipeline"
         "func.func(buffer-deallocation)",
         "convert-arraylist-to-memref",
@@ -291,17 +355,24 @@ def get_bufferization_stage(options: CompileOptions) -> List[str]:
         "cp-global-memref",
     ]
 
-    return bufferization
+    return list(filter(partial(is_not, None), bufferization))
 
 
 def get_convert_to_llvm_stage(options: CompileOptions) -> List[str]:
     """Returns the list of passes that lowers MLIR upstream dialects to LLVM Dialect"""
 
+    parallel_loops = options.shot_threads is not None
+
     convert_to_llvm = [
         "qnode-to-async-lowering" if options.async_qnodes else None,
         "async-func-to-async-runtime" if options.async_qnodes else None,
-        "async-to-async-runtime" if options.async_qnodes else None,
-        "convert-async-to-llvm" if options.async_qnodes else None,
+        # Parallel loops are outlined into tasks of the MLIR async runtime.
+        "scf-forall-to-parallel" if parallel_loops else None,
+        (f"async-parallel-for{{num-workers={options.shot_threads}}}" if parallel_loops else None),
+        "async-to-async-runtime" if options.async_qnodes or parallel_loops else None,
+        "async-runtime-ref-counting" if parallel_loops else None,
+        "async-runtime-ref-counting-opt" if parallel_loops else None,
+        "convert-async-to-llvm" if options.async_qnodes or parallel_loops else None,
         "expand-realloc",
         "convert-gradient-to-llvm",
         "memrefcpy-to-linalgcpy",
@@ -24,6 +24,7 @@ from typing import Callable, Sequence
 
 import jax.numpy as jnp
 import pennylane as qml
+from jax.api_util import debug_info as jdb
 from jax.core import eval_jaxpr
 from jax.tree_util import tree_flatten, tree_unflatten
 from pennylane import exceptions
@@ -37,8 +38,15 @@ from pennylane.transforms.dynamic_one_shot import (
 import catalyst
 from catalyst.api_extensions import MidCircuitMeasure
 from catalyst.device import QJITDevice
-from catalyst.jax_extras import deduce_avals, get_implicit_and_explicit_flat_args, unzip2
-from catalyst.jax_primitives import quantum_kernel_p
+from catalyst.jax_extras import (
+    ClosedJaxpr,
+    convert_constvars_jaxpr,
+    deduce_avals,
+    get_implicit_and_explicit_flat_args,
+    make_jaxpr2,
+    unzip2,
+)
+from catalyst.jax_primitives import parallel_for_p, quantum_kernel_p
 from catalyst.jax_tracer import Function, trace_quantum_function
 from catalyst.logging import debug_logger
 from catalyst.passes.pass_api import dictionary_to_list_of_passes
@@ -123,6 +131,7 @@ class QFunc:
         pass_pipeline = dictionary_to_list_of_passes(pass_pipeline)
 
         # Mid-circuit measurement configuration/execution
+        shot_threads = kwargs.pop("shot_threads", None)
         dynamic_one_shot_called = getattr(self, "_dynamic_one_shot_called", False)
         if not dynamic_one_shot_called:
             mcm_config = copy(
@@ -138,7 +147,9 @@ class QFunc:
                 mcm_config = replace(
                     mcm_config, postselect_mode=mcm_config.postselect_mode or "hw-like"
                 )
-                return Function(dynamic_one_shot(self, mcm_config=mcm_config))(*args, **kwargs)
+                return Function(
+                    dynamic_one_shot(self, mcm_config=mcm_config, shot_threads=shot_threads)
+                )(*args, **kwargs)
 
         new_device = copy(self.device)
         new_device._shots = self._shots  # pylint: disable=protected-access
@@ -184,6 +195,9 @@ def dynamic_one_shot(qnode, **kwargs):
 
     Args:
         qnode (QNode): a quantum circuit which will run ``num_shots`` times
+        shot_threads (int): If provided, the shots are executed by a parallel loop on up to
+            ``shot_threads`` threads, rather than by a sequential loop. This requires a static
+            number of shots; the shots are executed sequentially otherwise.
 
     Returns:
         qnode (QNode):
@@ -222,6 +236,7 @@ def dynamic_one_shot(qnode, **kwargs):
     cpy_tape = None
     aux_tapes = None
     mcm_config = kwargs.pop("mcm_config", None)
+    shot_threads = kwargs.pop("shot_threads", None)
 
     def transform_to_single_shot(qnode):
         if not qnode._shots:
@@ -280,8 +295,11 @@ def dynamic_one_shot(qnode, **kwargs):
         def wrap_single_shot_qnode(*_):
             return single_shot_qnode(*args, **kwargs)
 
-        arg_vmap = jnp.empty((total_shots,), dtype=float)
-        results = catalyst.vmap(wrap_single_shot_qnode)(arg_vmap)
+        if shot_threads is not None and isinstance(total_shots, int):
+            results = _parallel_map(wrap_single_shot_qnode, total_shots)
+        else:
+            arg_vmap = jnp.empty((total_shots,), dtype=float)
+            results = catalyst.vmap(wrap_single_shot_qnode)(arg_vmap)
         if isinstance(results[0], tuple) and len(results) == 1:
             results = results[0]
         has_mcm = any(isinstance(op, MidCircuitMeasure) for op in cpy_tape.operations)
@@ -305,3 +323,19 @@ def dynamic_one_shot(qnode, **kwargs):
         return out
 
     return one_shot_wrapper
+
+
+def _parallel_map(fn, num_iterations):
+    """Map ``fn`` over the iteration indices ``[0, num_iterations)`` with a parallel loop, stacking
+    the results of all iterations along a new leading axis.
+
+    Each iteration draws its random numbers from an independent stream derived from the seed of
+    the program, so that the results are reproducible regardless of how the iterations are
+    distributed between threads.
+    """
+    jaxpr, _, out_tree = make_jaxpr2(fn, debug_info=jdb("parallel_for", fn, (0,), {}))(jnp.array(0))
+    body_jaxpr = ClosedJaxpr(convert_constvars_jaxpr(jaxpr.jaxpr), ())
+    results = parallel_for_p.bind(
+        *jaxpr.consts, body_jaxpr=body_jaxpr, num_iterations=num_iterations
+    )
+    return tree_unflatten(out_tree, results)
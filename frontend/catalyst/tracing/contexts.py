@@ -17,6 +17,7 @@ This module provides context classes to manage and query Catalyst's and JAX's tr
 """
 
 import logging
+import threading
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
@@ -138,11 +139,11 @@ class EvaluationContext:
     """Utility context managing class keeping track of various modes of Catalyst executions.
 
     It is used to determine whether the program is currently tracing or not and if so, tracking the
-    tracing contexts. Contexts can be nested.
+    tracing contexts. Contexts can be nested. The modes and plugins are tracked per thread, such
+    that programs may be traced on one thread while compiled functions are called on another.
     """
 
-    _mode_stack: List[EvaluationMode] = []
-    _mlir_plugins: Set[Path] = set()
+    _thread_state = threading.local()
 
     @debug_logger_init
     def __init__(self, mode: EvaluationMode):
@@ -153,37 +154,57 @@ class EvaluationContext:
         self.mode = mode
         self._ctx = None
 
+    @classmethod
+    def _get_mode_stack(cls) -> List[EvaluationMode]:
+        """Return the stack of evaluation modes of the calling thread."""
+        try:
+            return cls._thread_state.mode_stack
+        except AttributeError:
+            cls._thread_state.mode_stack = []
+            return cls._thread_state.mode_stack
+
+    @classmethod
+    def _get_mlir_plugins(cls) -> Set[Path]:
+        """Return the MLIR plugins encountered by the calling thread."""
+        try:
+            return cls._thread_state.mlir_plugins
+        except AttributeError:
+            cls._thread_state.mlir_plugins = set()
+            return cls._thread_state.mlir_plugins
+
     @classmethod
     def add_plugin(cls, plugin: Path):
         """Add an MLIR plugin to the set of MLIR plugins encountered in the
         program"""
-        cls._mlir_plugins.add(plugin)
+        cls._get_mlir_plugins().add(plugin)
 
     @classmethod
     def get_plugins(cls):
         """Get and reset all plugins encountered during the trace of the
         program"""
-        retval = cls._mlir_plugins
-        cls._mlir_plugins = set()
+        retval = cls._get_mlir_plugins()
+        cls._thread_state.mlir_plugins = set()
         return retval
 
     @classmethod
     @contextmanager
     def _create_tracing_context(cls, mode):
-        cls._mode_stack.append(mode)
+        mode_stack = cls._get_mode_stack()
+        mode_stack.append(mode)
         try:
             yield
         finally:
-            cls._mode_stack.pop()
+            mode_stack.pop()
 
     @classmethod
     @contextmanager
     def _create_interpretation_context(cls):
-        cls._mode_stack.append(EvaluationMode.INTERPRETATION)
+        mode_stack = cls._get_mode_stack()
+        mode_stack.append(EvaluationMode.INTERPRETATION)
         try:
             yield None
         finally:
-            cls._mode_stack.pop()
+            mode_stack.pop()
 
     @classmethod
     @contextmanager
@@ -226,9 +247,10 @@ class EvaluationContext:
     @classmethod
     def get_evaluation_mode(cls) -> EvaluationMode:
         """Return the name of the evaluation mode, paired with tracing context if applicable"""
-        if not EvaluationContext._mode_stack:
+        mode_stack = cls._get_mode_stack()
+        if not mode_stack:
             return EvaluationMode.INTERPRETATION
-        return cls._mode_stack[-1]
+        return mode_stack[-1]
 
     @classmethod
     def get_mode(cls):
@@ -0,0 +1,190 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent, content-addressed storage for compiled shared objects.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# Default upper bound on the total size of all entries in a cache directory (1 GiB).
+DEFAULT_MAX_SIZE = 2**30
+
+# Staging directories older than this (in seconds) were left behind by a crashed writer.
+STALE_STAGING_AGE = 24 * 60 * 60
+
+MANIFEST = "manifest.json"
+LOCKFILE = ".lock"
+
+
+class DiskCache:
+    """A compilation cache on the filesystem which can be shared between processes.
+
+    Entries are stored under the hash of everything that determines the compilation result, and
+    are never modified once written. Writers assemble an entry in a private staging directory and
+    publish it with an atomic rename, so readers only ever observe complete entries and need no
+    locking. Eviction removes the least recently used entries once the total size of the cache
+    exceeds ``max_size``; it is serialized between processes with an advisory file lock.
+
+    Args:
+        root (str | pathlib.Path): the cache directory, created if it does not exist
+        max_size (int): upper bound in bytes on the total size of all cache entries
+    """
+
+    def __init__(self, root, max_size=DEFAULT_MAX_SIZE):
+        self.root = pathlib.Path(root).expanduser()
+        self.max_size = max_size
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Compute a cache key from the provided parts.
+
+        Each part is either ``bytes`` or converted to its string representation. Parts are length
+        prefixed, so that the boundaries between them affect the key.
+
+        Returns:
+            str: the hexadecimal digest identifying a cache entry
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def entry_path(self, key) -> pathlib.Path:
+        """Directory holding the entry for a given key."""
+        return self.root / key[:2] / key
+
+    def load(self, key, destination_dir) -> Optional[str]:
+        """Copy the shared object stored under ``key`` into ``destination_dir``.
+
+        The entry is copied rather than loaded in place so that it may be evicted at any time
+        without affecting processes that are using it.
+
+        Args:
+            key (str): the cache key
+            destination_dir (str): directory to copy the shared object into
+
+        Returns:
+            str | None: path to the copied shared object, or ``None`` on a cache miss
+        """
+        entry = self.entry_path(key)
+        try:
+            with open(entry / MANIFEST, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            filename = manifest["filename"]
+            destination = os.path.join(str(destination_dir), filename)
+            shutil.copyfile(entry / filename, destination)
+            # The modification time of the manifest records the last use of the entry.
+            os.utime(entry / MANIFEST)
+        except (OSError, ValueError, KeyError):
+            # Missing, concurrently evicted, or corrupted entries are all cache misses.
+            return None
+
+        return destination
+
+    def store(self, key, shared_object, **metadata):
+        """Store a shared object under ``key`` and evict old entries if required.
+
+        If another process published an entry for the same key in the meantime, the existing entry
+        is kept.
+
+        Args:
+            key (str): the cache key
+            shared_object (str): path to the shared object to store
+            **metadata: additional JSON-serializable information recorded in the entry manifest
+        """
+        entry = self.entry_path(key)
+        if entry.exists():
+            return
+
+        entry.parent.mkdir(exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.root)
+        try:
+            filename = os.path.basename(shared_object)
+            shutil.copyfile(shared_object, os.path.join(staging, filename))
+            with open(os.path.join(staging, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump({"filename": filename, "created": time.time(), **metadata}, f)
+            os.rename(staging, entry)
+        except OSError:
+            # Losing the race against another writer (or a full disk) is not an error.
+            pass
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits within ``max_size``."""
+        with self._lock():
+            entries = []
+            total_size = 0
+            for entry in self.root.glob("??/*"):
+                try:
+                    last_used = (entry / MANIFEST).stat().st_mtime
+                    size = sum(f.stat().st_size for f in entry.iterdir())
+                except OSError:
+                    continue
+                entries.append((last_used, size, entry))
+                total_size += size
+
+            entries.sort(key=lambda e: e[0])
+            for _, size, entry in entries:
+                if total_size <= self.max_size:
+                    break
+                self._remove(entry)
+                total_size -= size
+
+            now = time.time()
+            for staging in self.root.glob(".staging-*"):
+                try:
+                    if now - staging.stat().st_mtime > STALE_STAGING_AGE:
+                        shutil.rmtree(staging, ignore_errors=True)
+                except OSError:
+                    continue
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock():
+            for entry in self.root.glob("??/*"):
+                self._remove(entry)
+
+    def _remove(self, entry):
+        """Unpublish an entry with an atomic rename before deleting its contents."""
+        trash = self.root / f".staging-{entry.name}-{os.getpid()}"
+        try:
+            os.rename(entry, trash)
+        except OSError:
+            return
+        shutil.rmtree(trash, ignore_errors=True)
+
+    @contextmanager
+    def _lock(self):
+        """Hold an exclusive lock on the cache directory across processes."""
+        with open(self.root / LOCKFILE, "a", encoding="utf-8") as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lockfile, fcntl.LOCK_UN)
@@ -63,3 +63,66 @@ class TensorExtractOp(ir.OpView):
                 ip=ip,
             )
         )
+
+
+class TensorEmptyOp(ir.OpView):
+    OPERATION_NAME = "tensor.empty"
+
+    _ODS_REGIONS = (0, True)
+
+    def __init__(self, result, *, loc=None, ip=None):
+        super().__init__(
+            self.build_generic(
+                attributes={},
+                results=[result],
+                operands=[],
+                successors=None,
+                regions=None,
+                loc=loc,
+                ip=ip,
+            )
+        )
+
+
+class ParallelInsertSliceOp(ir.OpView):
+    OPERATION_NAME = "tensor.parallel_insert_slice"
+
+    _ODS_OPERAND_SEGMENTS = [1, 1, -1, -1, -1]
+    _ODS_REGIONS = (0, True)
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        source,
+        dest,
+        offsets,
+        static_offsets,
+        static_sizes,
+        static_strides,
+        *,
+        loc=None,
+        ip=None,
+    ):
+        operands = [
+            get_op_result_or_value(source),
+            get_op_result_or_value(dest),
+            get_op_results_or_values(offsets),
+            [],
+            [],
+        ]
+        attributes = {
+            "static_offsets": ir.DenseI64ArrayAttr.get(static_offsets),
+            "static_sizes": ir.DenseI64ArrayAttr.get(static_sizes),
+            "static_strides": ir.DenseI64ArrayAttr.get(static_strides),
+        }
+        super().__init__(
+            self.build_generic(
+                attributes=attributes,
+                results=[],
+                operands=operands,
+                successors=None,
+                regions=None,
+                loc=loc,
+                ip=ip,
+            )
+        )
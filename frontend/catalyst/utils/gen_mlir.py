@@ -75,3 +75,25 @@ def inject_functions(module, ctx, seed):
 
     mlir_qfunc = module.body.operations[0]
     assert isinstance(mlir_qfunc, FuncOp)
+
+
+def set_donated_arguments(module, ctx, donated):
+    """
+    This function marks which arguments of the entry function of the input module are donated.
+    One-shot bufferization may write to the buffers of donated arguments, for instance to compute
+    results in place, whereas the buffers of other arguments are left unmodified.
+    """
+    mlir_qfunc = module.body.operations[0]
+    assert isinstance(mlir_qfunc, FuncOp)
+
+    old_arg_attrs = mlir_qfunc.arg_attrs
+    arg_attrs = []
+    for idx, is_donated in enumerate(donated):
+        entries = {}
+        if old_arg_attrs is not None:
+            old_entries = ir.DictAttr(old_arg_attrs[idx])
+            entries = {old_entries[i].name: old_entries[i].attr for i in range(len(old_entries))}
+        entries["bufferization.writable"] = ir.BoolAttr.get(is_donated, context=ctx)
+        arg_attrs.append(ir.DictAttr.get(entries, context=ctx))
+
+    mlir_qfunc.arg_attrs = ir.ArrayAttr.get(arg_attrs, context=ctx)
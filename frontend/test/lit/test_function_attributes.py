@@ -15,6 +15,7 @@
 # RUN: %PYTHON %s | FileCheck %s
 
 import pennylane as qml
+from jax.core import ShapedArray
 
 from catalyst import qjit
 
@@ -38,3 +39,13 @@ def workload(x: float):
 
 
 print(workload.mlir)
+
+
+@qjit(target="mlir", donate_argnums=1)
+# Only donated arguments may be written to by the compiled program.
+# CHECK-DAG: func.func public @jit_update(%arg0: tensor<f64> {bufferization.writable = false}, %arg1: tensor<3xf64> {bufferization.writable = true}) -> tensor<3xf64> attributes {llvm.emit_c_interface} {
+def update(x: float, params: ShapedArray([3], float)):
+    return params * x
+
+
+print(update.mlir)
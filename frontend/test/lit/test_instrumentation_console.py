@@ -75,6 +75,8 @@ with instrumentation(circuit.__name__, filename=None, detailed=False):
 # CHECK-NEXT: [DIAGNOSTICS] Running device_release
 # CHECK-SAME:   walltime: {{[0-9\.]+}} ms{{\s*}} cputime: {{[0-9\.]+}} ms
 # CHECK:      [DIAGNOSTICS] > Total run
+# CHECK:      [DIAGNOSTICS] Slowest passes of circuit:
+# CHECK-NEXT: [DIAGNOSTICS] {{.+}} selftime: {{[0-9\.]+}} ms
 # COM: As the output below is generated by the Catalyst CLI, checking the correct order may cause flaky results.
 # CHECK: [DIAGNOSTICS] Running parseMLIRSource
 # CHECK-SAME:   walltime: {{[0-9\.]+}} ms{{\s*}} cputime: {{[0-9\.]+}} ms{{\s*}} programsize: {{[0-9]+}} lines
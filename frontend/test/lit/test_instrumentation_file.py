@@ -113,6 +113,16 @@ with open(filename, mode="r", encoding="UTF-8") as f:
 # CHECK-NEXT:             walltime: {{[0-9\.]+}}
 # CHECK-NEXT:             cputime: {{[0-9\.]+}}
 # CHECK-NEXT:             programsize: {{[0-9\]+}}
+# CHECK:              - pass_profile:
+# CHECK-NEXT:             - stage: "Parser"
+# CHECK-NEXT:               name: "parseMLIRSource"
+# CHECK-NEXT:               runs: 1
+# CHECK-NEXT:               walltime: {{[0-9\.]+}}
+# CHECK-NEXT:               cputime: {{[0-9\.]+}}
+# CHECK-NEXT:               selftime: {{[0-9\.]+}}
+# CHECK-NEXT:               size: {{[1-9][0-9]*}}
+# CHECK:                    name: "compileObjectFile"
+# CHECK:              - linkObjectFile:
 # CHECK:        - run:
 # CHECK-NEXT:       walltime:
 # CHECK-NEXT:       cputime:
@@ -129,6 +139,12 @@ with open(filename, mode="r", encoding="UTF-8") as f:
 # CHECK-NEXT:         - device_release:
 # CHECK-NEXT:             walltime: {{[0-9\.]+}}
 # CHECK-NEXT:             cputime: {{[0-9\.]+}}
+# CHECK-NEXT: slowest_passes:
+# CHECK-NEXT:   - name: "{{.+}}"
+# CHECK-NEXT:     stage: "{{.+}}"
+# CHECK-NEXT:     module:
+# CHECK-NEXT:     selftime: {{[0-9\.]+}}
+# CHECK-NEXT:     walltime: {{[0-9\.]+}}
 
 with instrumentation(circuit.__name__, filename=filename, detailed=True):
     qjit(circuit)(weights)
@@ -29,7 +29,7 @@ import numpy as np
 import pennylane as qml
 import pytest
 
-from catalyst import qjit
+from catalyst import for_loop, grad, qjit
 from catalyst.compiler import CompileOptions, Compiler, LinkerDriver, _options_to_cli_flags
 from catalyst.debug import instrumentation
 from catalyst.pipelines import KeepIntermediateLevel
@@ -93,6 +93,52 @@ class TestCompilerOptions:
         capture = capture_result.out + capture_result.err
         assert "[DIAGNOSTICS]" in capture
 
+    def test_instrumentation_without_intermediate_files(self, capsys, backend):
+        """Test that instrumentation measures the size of the compiled program without keeping
+        intermediate files or altering the compile options."""
+
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit():
+            return qml.state()
+
+        workflow = qjit(circuit)
+        options = workflow.compile_options
+        with instrumentation(circuit.__name__, filename=None, detailed=False):
+            workflow()
+
+        assert workflow.compile_options is options
+        assert not workflow.compile_options.keep_intermediate
+        workspace = pathlib.Path(str(workflow.workspace))
+        assert not [*workspace.glob("*.mlir"), *workspace.glob("*.ll")]
+
+        capture = capsys.readouterr().err
+        compile_line = next(line for line in capture.splitlines() if "Running compile" in line)
+        assert int(compile_line.split("programsize:")[1].split()[0]) > 0
+
+    @pytest.mark.parametrize("in_process", [False, True])
+    def test_compilation_pass_profile(self, in_process, backend):
+        """Test that detailed instrumentation collects the time spent in each compiler pass."""
+
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with instrumentation(circuit.__name__, filename=None, detailed=True) as session:
+            qjit(circuit, in_process=in_process)(0.1)
+
+        profile = session.pass_profile
+        stages = {entry["stage"] for entry in profile}
+        names = {entry["name"] for entry in profile}
+        assert {"Parser", "HLOLoweringPass", "BufferizationPass", "LLVM", "Linker"} <= stages
+        assert {"parseMLIRSource", "canonicalize", "compileObjectFile", "linkObjectFile"} <= names
+        assert all(entry["walltime"] >= entry["selftime"] >= 0 for entry in profile)
+        assert all(entry["module"] == "circuit" for entry in profile if entry["stage"] != "Linker")
+
+        slowest = session.slowest_passes(3)
+        assert len(slowest) == 3
+        assert slowest[0]["selftime"] == max(entry["selftime"] for entry in profile)
+
     @pytest.mark.parametrize(
         "input_value, expected_level",
         [
@@ -139,6 +185,58 @@ class TestCompilerOptions:
         assert "--keep-intermediate" in flags
         assert "--save-ir-after-each=pass" in flags
 
+    @pytest.mark.parametrize("invalid_input", [4, -1, "O2", 2.0, None])
+    def test_opt_level_invalid_inputs(self, invalid_input):
+        """Test that invalid optimization levels raise appropriate errors."""
+        with pytest.raises(ValueError, match="Invalid 'opt_level'"):
+            CompileOptions(opt_level=invalid_input)
+
+    @pytest.mark.parametrize("invalid_input", [0, -1, "8", 2.0, None])
+    def test_max_cached_versions_invalid_inputs(self, invalid_input):
+        """Test that invalid bounds of the compilation cache raise appropriate errors."""
+        with pytest.raises(ValueError, match="Invalid 'max_cached_versions'"):
+            CompileOptions(max_cached_versions=invalid_input)
+
+    def test_options_to_cli_flags_opt_level(self):
+        """Test that the optimization level is only passed to the CLI if it is not the default."""
+        assert not any("--opt-level" in flag for flag in _options_to_cli_flags(CompileOptions()))
+        assert ("--opt-level", 0) in _options_to_cli_flags(CompileOptions(opt_level=0))
+
+    def test_opt_level_pipelines(self):
+        """Test that the lowest optimization level skips the optional MLIR optimizations, while the
+        other levels use the default pipelines."""
+        stages = dict(CompileOptions().get_stages())
+        light_stages = dict(CompileOptions(opt_level=0).get_stages())
+
+        assert stages == dict(CompileOptions(opt_level=3).get_stages())
+        assert stages.keys() == light_stages.keys()
+        for name, passes in light_stages.items():
+            assert set(passes) <= set(stages[name])
+        assert "cse" not in light_stages["HLOLoweringPass"]
+        assert "detensorize-scf" not in light_stages["HLOLoweringPass"]
+        assert "func.func(promote-buffers-to-stack)" not in light_stages["BufferizationPass"]
+
+    @pytest.mark.parametrize("opt_level", [0, 1, 2, 3])
+    def test_opt_level(self, opt_level, backend):
+        """Test that programs compiled at any optimization level produce the same results."""
+
+        def circuit(x):
+            @for_loop(0, 4, 1)
+            def layer(i):
+                qml.RX(x * i, wires=i % 2)
+                qml.CNOT(wires=[0, 1])
+
+            layer()
+            return qml.expval(qml.PauliZ(0))
+
+        qnode = qml.qnode(qml.device(backend, wires=2))(circuit)
+
+        # Programs computing gradients go through Enzyme, whose pipeline depends on the level.
+        for fn in (qnode, grad(qnode)):
+            expected = qjit(fn)(0.7)
+            observed = qjit(fn, opt_level=opt_level)(0.7)
+            assert np.allclose(observed, expected)
+
 
 class TestCompilerWarnings:
     """Test compiler's warning messages."""
@@ -311,6 +409,27 @@ class TestCompilerState:
             workflow.compiler.get_output_of("None-existing-pipeline", workflow.workspace)
         workflow.workspace.cleanup()
 
+    @pytest.mark.parametrize("keep_intermediate", [False, True])
+    def test_module_ir_format(self, keep_intermediate, backend):
+        """Test that modules are handed to the compiler as bytecode, unless intermediate files
+        are kept."""
+
+        @qjit(target="mlir", keep_intermediate=keep_intermediate)
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow():
+            qml.PauliX(wires=0)
+            return qml.state()
+
+        ir, _ = workflow.compiler.get_module_ir(workflow.mlir_module)
+        if keep_intermediate:
+            assert isinstance(ir, str) and "quantum" in ir
+        else:
+            assert isinstance(ir, bytes) and ir.startswith(b"ML\xefR")
+
+        compiled_function, _ = workflow.compile()
+        assert np.allclose(compiled_function()[0], [0, 1])
+        workflow.workspace.cleanup()
+
     def test_compiler_driver_with_output_name(self):
         """Test with non-default output name."""
         with tempfile.TemporaryDirectory() as workspace:
@@ -368,6 +487,68 @@ class TestCompilerState:
         assert stack_trace_pattern in e.value.args[0]
 
 
+class TestInProcessCompilation:
+    """Test compilation with the compiler driver running in the Python process."""
+
+    def test_in_process(self, backend, monkeypatch):
+        """Test that in-process compilation produces the same program as the CLI."""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.probs()
+
+        expected = qjit(qml.qnode(qml.device(backend, wires=2))(circuit))(0.7)
+
+        def fail(*_args, **_kwargs):
+            assert False, "unexpected use of the CLI"
+
+        monkeypatch.setattr(Compiler, "run_driver", fail)
+        observed = qjit(qml.qnode(qml.device(backend, wires=2))(circuit), in_process=True)(0.7)
+
+        assert np.allclose(observed, expected)
+
+    def test_in_process_keep_intermediate(self, backend):
+        """Test that intermediate results are available with in-process compilation."""
+
+        @qjit(keep_intermediate=True, in_process=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow():
+            qml.PauliX(wires=0)
+            return qml.state()
+
+        workflow()
+        assert workflow.qir
+        assert workflow.compiler.get_output_of("QuantumCompilationPass", workflow.workspace)
+        workflow.workspace.cleanup()
+
+    def test_in_process_pipeline_error(self):
+        """Test that compilation errors are raised with in-process compilation."""
+
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def circuit():
+            return qml.state()
+
+        test_pipelines = [("PipelineA", ["canonicalize"]), ("PipelineB", ["test"])]
+        with pytest.raises(CompileError, match="Failed to lower MLIR module"):
+            qjit(circuit, pipelines=test_pipelines, in_process=True)()
+
+    def test_in_process_instrumentation(self, capsys, backend):
+        """Test that the driver and linker steps are reported in a detailed instrumentation."""
+
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit():
+            return qml.state()
+
+        with instrumentation(circuit.__name__, filename=None, detailed=True):
+            qjit(circuit, in_process=True)()
+
+        capture = capsys.readouterr().err
+        assert "printMLIRModule" in capture
+        assert "runCompilerDriver" in capture
+        assert "linkObjectFile" in capture
+
+
 class TestCustomCall:
     """Test compilation of `lapack_dsyevd` via lowering to `stablehlo.custom_call`."""
 
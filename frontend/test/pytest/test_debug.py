@@ -9,6 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 import pathlib
 import re
@@ -30,6 +31,8 @@ from catalyst.debug import (
     get_compilation_stage,
     replace_ir,
 )
+from catalyst.debug.instruments import LatencyHistogram, LatencyHistograms
+from catalyst.logging import debug_logger
 from catalyst.pipelines import CompileOptions
 from catalyst.utils.exceptions import CompileError
 
@@ -230,6 +233,105 @@ class TestDebugPrint:
         assert expected == out.strip()
 
 
+class TestDebugLogger:
+    """Test suite for the logging decorators."""
+
+    @staticmethod
+    def make_function(module):
+        """Make a function defined in the given module."""
+
+        def f(x):
+            return x + 1
+
+        f.__module__ = module
+        return f
+
+    def test_disabled(self):
+        """Test that functions are left unwrapped if debug logging is disabled."""
+
+        logger = logging.getLogger("catalyst.test_debug_disabled")
+        logger.setLevel(logging.WARNING)
+        f = self.make_function(logger.name)
+
+        assert debug_logger(f) is f
+
+    def test_enabled(self, caplog):
+        """Test that function calls are logged if debug logging is enabled."""
+
+        logger = logging.getLogger("catalyst.test_debug_enabled")
+        logger.setLevel(logging.DEBUG)
+        f = debug_logger(self.make_function(logger.name))
+
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            assert f(1) == 2
+        assert any("f(" in record.getMessage() for record in caplog.records)
+
+
+class TestLatencyHistograms:
+    """Test suite for the latency histograms of the instrumented stages."""
+
+    @pytest.fixture(autouse=True)
+    def histograms(self):
+        """Enable the histograms for a test, and restore their state afterwards."""
+        enabled = LatencyHistograms.enabled
+        debug.latency_histograms(reset=True)
+        debug.enable_latency_histograms()
+        yield
+        debug.enable_latency_histograms(enabled)
+        debug.latency_histograms(reset=True)
+
+    @pytest.mark.parametrize("latency", [0, 1, 3, 4, 7, 8, 1000, 12345, 2**40 + 1, 2**63 - 1])
+    def test_buckets(self, latency):
+        """Test that each latency falls into the bucket whose bounds contain it."""
+
+        index = LatencyHistogram.bucket_index(latency)
+        lower, upper = LatencyHistogram.bucket_bounds(index)
+        assert lower <= latency < upper
+        assert upper <= 1.25 * lower or upper - lower == 1
+        assert index < LatencyHistogram.num_buckets
+
+    def test_quantiles(self):
+        """Test that the quantiles are upper bounds within the resolution of the buckets."""
+
+        histogram = LatencyHistogram()
+        latencies = np.random.default_rng(42).integers(10**4, 10**6, size=1000)
+        for latency in latencies:
+            histogram.record(int(latency))
+
+        result = histogram.export()
+        assert result["count"] == 1000
+        assert result["min"] == min(latencies) / 1e6
+        assert result["max"] == max(latencies) / 1e6
+        assert sum(count for _, count in result["buckets"]) == 1000
+        for q in [0.5, 0.9, 0.99]:
+            exact = np.quantile(latencies, q, method="inverted_cdf") / 1e6
+            assert exact <= result[f"p{int(q * 100)}"] <= 1.25 * exact
+
+    def test_stages(self):
+        """Test that the latency of every call of a compiled function is recorded."""
+
+        @qjit
+        def f(x):
+            return x + 1
+
+        for x in range(10):
+            f(x)
+
+        histograms = debug.latency_histograms(reset=True)
+        assert histograms["compile"]["count"] == 1
+        assert histograms["run"]["count"] == 10
+        assert histograms["run"]["sum"] >= 10 * histograms["run"]["min"]
+        assert debug.latency_histograms()["run"]["count"] == 0
+
+    def test_disabled(self):
+        """Test that no latency is recorded when the histograms are disabled."""
+
+        debug.enable_latency_histograms(False)
+        qjit(lambda x: x + 1)(1)
+
+        assert all(histogram["count"] == 0 for histogram in debug.latency_histograms().values())
+
+
 class TestPrintStage:
     """Test that compilation pipeline results can be printed."""
 
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test for the device API."""
+import os
 import platform
+import shutil
 
 import pennylane as qml
 import pytest
@@ -99,6 +101,7 @@ def test_qjit_device_measurements(shots, mocker):
         assert finite_shot_measurements.issubset(expected_measurements)
         assert state_measurements.intersection(expected_measurements) == set()
 
+    qjit_device._get_cached_qjit_device_capabilities.cache_clear()
     spy = mocker.spy(qjit_device, "get_qjit_device_capabilities")
 
     @qjit
@@ -112,6 +115,50 @@ def test_qjit_device_measurements(shots, mocker):
     assert spy.spy_return.measurement_processes == expected_measurements
 
 
+def test_qjit_device_capabilities_cache(mocker):
+    """Test that the capabilities of QJIT devices are derived once per device config file and
+    shots mode."""
+
+    qjit_device._get_cached_qjit_device_capabilities.cache_clear()
+    first = QJITDevice(qml.device("lightning.qubit", wires=2))
+
+    spy = mocker.spy(qjit_device, "get_qjit_device_capabilities")
+    second = QJITDevice(qml.device("lightning.qubit", wires=3))
+    assert spy.call_count == 0
+    assert second.capabilities is first.capabilities
+
+    with_shots = QJITDevice(qml.device("lightning.qubit", wires=2, shots=100))
+    assert spy.call_count == 1
+    assert with_shots.capabilities is not first.capabilities
+    assert "SampleMP" in with_shots.capabilities.measurement_processes
+
+
+def test_device_capabilities_reloaded(tmp_path, mocker):
+    """Test that device config files are parsed again once modified."""
+
+    config_file = tmp_path / "device.toml"
+    shutil.copy(qml.device("lightning.qubit", wires=2).config_filepath, config_file)
+
+    class CustomDevice(NullQubit):
+        """Null device with a custom config file."""
+
+        config_filepath = str(config_file)
+
+    spy = mocker.spy(qjit_device.DeviceCapabilities, "from_toml_file")
+    capabilities = get_device_capabilities(CustomDevice(wires=2))
+    assert get_device_capabilities(CustomDevice(wires=2)) == capabilities
+    assert spy.call_count == 1
+
+    # Results can be modified without affecting the next calls.
+    capabilities.measurement_processes.pop("ExpectationMP")
+    assert "ExpectationMP" in get_device_capabilities(CustomDevice(wires=2)).measurement_processes
+
+    mtime = os.stat(config_file).st_mtime_ns
+    os.utime(config_file, ns=(mtime + 10**9, mtime + 10**9))
+    get_device_capabilities(CustomDevice(wires=2))
+    assert spy.call_count == 2
+
+
 def test_simple_circuit():
     """Test that a circuit with the new device API is compiling to MLIR."""
     dev = NullQubit(wires=2, shots=2048)
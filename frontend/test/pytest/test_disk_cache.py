@@ -0,0 +1,157 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the persistent compilation cache.
+"""
+
+import os
+import time
+
+import pennylane as qml
+import pytest
+
+from catalyst import qjit
+from catalyst.compiler import CompileOptions, Compiler, LinkerDriver
+from catalyst.utils.disk_cache import DiskCache
+
+# pylint: disable=missing-function-docstring
+
+
+def write_object(directory, name, size):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    return path
+
+
+class TestDiskCache:
+    """Unit tests for the DiskCache class."""
+
+    def test_key_is_deterministic(self):
+        assert DiskCache.make_key("a", 1, b"b") == DiskCache.make_key("a", 1, b"b")
+        assert DiskCache.make_key("a", 1) != DiskCache.make_key("a", 2)
+
+    def test_key_respects_boundaries(self):
+        assert DiskCache.make_key("ab", "c") != DiskCache.make_key("a", "bc")
+
+    def test_miss(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache")
+        assert cache.load("0" * 64, tmp_path) is None
+
+    def test_store_and_load(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache")
+        obj = write_object(tmp_path, "f.so", 16)
+        key = DiskCache.make_key("f")
+
+        cache.store(key, obj, module_name="f")
+
+        destination = tmp_path / "workspace"
+        destination.mkdir()
+        loaded = cache.load(key, destination)
+        assert loaded == os.path.join(str(destination), "f.so")
+        assert os.path.getsize(loaded) == 16
+
+    def test_store_keeps_existing_entry(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache")
+        key = DiskCache.make_key("f")
+
+        cache.store(key, write_object(tmp_path, "f.so", 16))
+        cache.store(key, write_object(tmp_path, "f.so", 32))
+
+        assert os.path.getsize(cache.load(key, tmp_path)) == 16
+
+    def test_lru_eviction(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache", max_size=10_000)
+        keys = [DiskCache.make_key(i) for i in range(3)]
+
+        cache.store(keys[0], write_object(tmp_path, "a.so", 4000))
+        cache.store(keys[1], write_object(tmp_path, "b.so", 4000))
+        # Make the first entry the most recently used one.
+        past = time.time() - 100
+        os.utime(cache.entry_path(keys[1]) / "manifest.json", (past, past))
+        assert cache.load(keys[0], tmp_path) is not None
+
+        cache.store(keys[2], write_object(tmp_path, "c.so", 4000))
+
+        assert cache.load(keys[0], tmp_path) is not None
+        assert cache.load(keys[1], tmp_path) is None
+        assert cache.load(keys[2], tmp_path) is not None
+
+    def test_clear(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache")
+        key = DiskCache.make_key("f")
+        cache.store(key, write_object(tmp_path, "f.so", 16))
+
+        cache.clear()
+
+        assert cache.load(key, tmp_path) is None
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache")
+        key = DiskCache.make_key("f")
+        cache.store(key, write_object(tmp_path, "f.so", 16))
+
+        with open(cache.entry_path(key) / "manifest.json", "w", encoding="utf-8") as f:
+            f.write("{")
+
+        assert cache.load(key, tmp_path) is None
+
+
+class TestCompilerDiskCache:
+    """Test the integration of the persistent cache with the compiler."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("CATALYST_CACHE_DIR", raising=False)
+        assert Compiler(CompileOptions()).get_disk_cache() is None
+
+    def test_environment_variable(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CATALYST_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("CATALYST_CACHE_MAX_SIZE", "1234")
+        cache = Compiler(CompileOptions()).get_disk_cache()
+        assert cache.root == tmp_path
+        assert cache.max_size == 1234
+
+    def test_bypassed_with_keep_intermediate(self, tmp_path):
+        options = CompileOptions(cache_dir=str(tmp_path), keep_intermediate=True)
+        assert Compiler(options).get_disk_cache() is None
+
+    def test_key_depends_on_options(self):
+        ir = "module {}"
+        key = Compiler(CompileOptions()).get_disk_cache_key(ir, "f")
+        assert key == Compiler(CompileOptions(verbose=True)).get_disk_cache_key(ir, "f")
+        assert key != Compiler(CompileOptions()).get_disk_cache_key(ir, "g")
+        assert key != Compiler(CompileOptions()).get_disk_cache_key(ir + " ", "f")
+        assert key != Compiler(CompileOptions(disable_assertions=True)).get_disk_cache_key(ir, "f")
+        assert key != Compiler(CompileOptions(pass_plugins=["p.so"])).get_disk_cache_key(ir, "f")
+
+    def test_reuse_across_qjit_objects(self, tmp_path, mocker, backend):
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(LinkerDriver, "run")
+
+        first = qjit(qml.qnode(qml.device(backend, wires=1))(circuit), cache_dir=str(tmp_path))
+        expected = first(0.5)
+        assert spy.call_count == 1
+
+        # A fresh QJIT object stands in for a new process, which has an empty in-memory cache.
+        second = qjit(qml.qnode(qml.device(backend, wires=1))(circuit), cache_dir=str(tmp_path))
+        assert second(0.5) == pytest.approx(expected)
+        assert spy.call_count == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-x", __file__])
@@ -22,7 +22,7 @@ import pennylane as qml
 import pytest
 
 from catalyst import for_loop, measure, qjit
-from catalyst.jit import JAX_QJIT
+from catalyst.jit import JAX_QJIT, QJIT
 
 
 class TestJAXJIT:
@@ -179,9 +179,82 @@ class TestJAXJIT:
         assert result2 == False
 
 
+class TestJAXVmap:
+    """Test QJIT compatibility with JAX vectorization."""
+
+    def test_batched_call(self, backend):
+        """Test that jax.vmap executes the whole batch with a batched qjit function."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x: jax.core.ShapedArray((2,), dtype=float), y: float):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1] * y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1)), qml.probs(wires=0)
+
+        x, y = jnp.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]), 0.7
+        result = jax.vmap(circuit, in_axes=(0, None))(x, y)
+        reference = jax.vmap(circuit.user_function, in_axes=(0, None))(x, y)
+
+        assert jnp.allclose(result[0], reference[0])
+        assert jnp.allclose(result[1], reference[1])
+        assert list(circuit.jaxed_function.batched_functions) == [3]
+
+    def test_nested_vmap(self, backend):
+        """Test that nested batch dimensions are executed with a single batched qjit function."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x: float):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = jnp.linspace(0, 1, 6).reshape(2, 3)
+        result = jax.jit(jax.vmap(jax.vmap(circuit)))(x)
+
+        assert result.shape == (2, 3)
+        assert jnp.allclose(result, jnp.cos(x))
+        assert list(circuit.jaxed_function.batched_functions) == [6]
+
+    def test_batch_sizes_are_bounded(self, backend):
+        """Test that the batched qjit functions of the least recently used batch sizes are
+        evicted once more than ``max_cached_versions`` are compiled."""
+
+        @qjit(max_cached_versions=2)
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x: float):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        for size in (1, 2, 1, 3):
+            x = jnp.linspace(0, 1, size)
+            assert jnp.allclose(jax.vmap(circuit)(x), jnp.cos(x))
+
+        assert list(circuit.jaxed_function.batched_functions) == [1, 3]
+
+
 class TestJAXAD:
     """Test QJIT compatibility with JAX differentiation."""
 
+    def test_alternating_dtypes(self):
+        """Test that differentiating a cached version of a function, which is not the most
+        recently traced one, uses the result types of that version."""
+
+        @qjit
+        def f(x):
+            return jnp.sin(x) * x
+
+        x32, x64 = jnp.float32(0.5), jnp.float64(0.5)
+        assert f(x32).dtype == jnp.float32
+        assert f(x64).dtype == jnp.float64
+
+        expected = jnp.cos(0.5) * 0.5 + jnp.sin(0.5)
+        for x in (x32, x64, x32):
+            result = jax.grad(f)(x)
+            assert result.dtype == x.dtype
+            assert jnp.allclose(result, expected, rtol=1e-5)
+
     def test_simple_circuit(self, backend):
         """Test a basic use case of jax.grad on top of qjit."""
 
@@ -374,7 +447,7 @@ class TestJAXAD:
             assert jnp.allclose(a, b, rtol=1e-6, atol=1e-6)
 
     def test_efficient_Jacobian(self, backend):
-        """Test a jax.grad function does not compute Jacobians for arguments not in argnums."""
+        """Test a jax.grad function does not compute derivatives for arguments not in argnums."""
 
         @qjit
         @qml.qnode(qml.device(backend, wires=2))
@@ -389,9 +462,91 @@ class TestJAXAD:
 
         cost_fn(0.1, 0.2)
 
-        assert len(circuit.jaxed_function.derivative_functions) == 1
-        assert "0" in circuit.jaxed_function.derivative_functions
-        assert len(circuit.jaxed_function.derivative_functions["0"].jaxpr.out_avals) == 1
+        # Reverse-mode differentiation only compiles the VJP, for the differentiable arguments.
+        assert list(circuit.jaxed_function.derivative_functions) == [("vjp", (0,))]
+        vjp_qjit = circuit.jaxed_function.derivative_functions[("vjp", (0,))]
+        assert len(vjp_qjit.jaxpr.out_avals) == 1
+
+    def test_derivatives_survive_recompilation(self, backend):
+        """Test that derivatives compiled for a signature are restored along with the function after
+        it has been recompiled for another signature."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(jnp.sum(x), wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        cost_fn = jax.grad(lambda x: jnp.sum(circuit(x)))
+
+        cost_fn(jnp.array([0.1, 0.2]))
+        vjp_qjit = circuit.jaxed_function.get_derivative_qjit("vjp", [0])
+
+        cost_fn(jnp.array([0.1, 0.2, 0.3]))
+        assert circuit.jaxed_function.get_derivative_qjit("vjp", [0]) is not vjp_qjit
+
+        result = cost_fn(jnp.array([0.3, 0.4]))
+        assert circuit.jaxed_function.get_derivative_qjit("vjp", [0]) is vjp_qjit
+        assert jnp.allclose(result, -jnp.sin(0.7))
+
+    def test_precompile_derivatives(self, backend, monkeypatch):
+        """Test that derivatives can be compiled ahead of their first evaluation."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x, y):
+            qml.RX(x * y, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit.precompile_derivatives(0.1, 0.2, argnums=[0, 1], modes=("forward", "reverse"))
+
+        derivatives = circuit.jaxed_function.derivative_functions
+        assert set(derivatives) == {("jvp", (0, 1)), ("vjp", (0, 1))}
+
+        def fail(*_):
+            assert False, "derivatives should not be recompiled"
+
+        monkeypatch.setattr(QJIT, "compile", fail)
+        result = jax.grad(circuit, argnums=(0, 1))(0.5, 0.6)
+        assert jnp.allclose(result[0], -0.6 * jnp.sin(0.3))
+        assert jnp.allclose(result[1], -0.5 * jnp.sin(0.3))
+
+    def test_precompile_derivatives_invalid_mode(self, backend):
+        """Test that an unknown differentiation mode is rejected."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="Differentiation modes must be"):
+            circuit.precompile_derivatives(0.1, modes=("sideways",))
+
+    def test_forward_mode(self, backend):
+        """Test forward-mode differentiation with jax.jvp and jax.jacfwd on top of qjit."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x: jax.core.ShapedArray((3,), dtype=float), y: float):
+            qml.RX(jnp.pi * x[0], wires=0)
+            qml.RY(x[1] ** 2, wires=0)
+            qml.RX(y * x[2], wires=0)
+            return qml.probs(wires=0)
+
+        x, y = jnp.array([0.1, 0.2, 0.3]), 0.4
+        tangent = jnp.array([0.5, -0.1, 1.0])
+
+        result = jax.jvp(lambda x: circuit(x, y), (x,), (tangent,))
+        reference = jax.jvp(lambda x: circuit.user_function(x, y), (x,), (tangent,))
+        assert jnp.allclose(result[0], reference[0])
+        assert jnp.allclose(result[1], reference[1])
+
+        result = jax.jacfwd(circuit)(x, y)
+        reference = jax.jacfwd(circuit.user_function)(x, y)
+        assert jnp.allclose(result, reference)
+
+        assert list(circuit.jaxed_function.derivative_functions) == [("jvp", (0,))]
 
     def test_jit_and_grad(self, backend):
         """Test that argnums determination works correctly when combining jax.jit with jax.grad.
@@ -433,9 +588,9 @@ class TestJAXAD:
         # Patch the quantum gradient wrapper to verify the internal argnums
         get_derivative_qjit = JAX_QJIT.get_derivative_qjit
 
-        def get_derivative_qjit_wrapper(self, argnums):
+        def get_derivative_qjit_wrapper(self, kind, argnums):
             assert argnums == [0, 2]
-            return get_derivative_qjit(self, argnums)
+            return get_derivative_qjit(self, kind, argnums)
 
         monkeypatch.setattr(JAX_QJIT, "get_derivative_qjit", get_derivative_qjit_wrapper)
 
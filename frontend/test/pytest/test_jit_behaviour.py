@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import random
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
 from timeit import default_timer as timer
 
@@ -24,7 +27,7 @@ import pytest
 from jax import numpy as jnp
 from numpy import pi
 
-from catalyst import for_loop, grad, measure, qjit
+from catalyst import for_loop, grad, measure, precompile, qjit
 from catalyst.jax_primitives import _scalar_abstractify
 from catalyst.tracing.type_signatures import (
     TypeCompatibility,
@@ -462,6 +465,476 @@ class TestCaching:
         # Duplicate function generation results in a "_0" suffix
         assert not "func.func public @f_0(" in g.mlir
 
+    def test_multiple_versions_are_cached(self, mocker):
+        """Test that alternating between argument types does not trigger recompilation."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        spy = mocker.spy(f.compiler, "run")
+
+        for _ in range(3):
+            assert f(jnp.float32(1.5)).dtype == jnp.float32
+            assert f(jnp.float64(1.5)).dtype == jnp.float64
+            assert f(jnp.ones(3)).shape == (3,)
+
+        assert spy.call_count == 3
+        assert len(next(iter(f.fn_cache.cache.values()))) == 3
+
+    def test_exact_version_preferred_over_promotion(self, mocker):
+        """Test that a version matching the argument types is chosen over one requiring
+        promotion, and that the narrowest promotion target is chosen otherwise."""
+
+        @qjit
+        def f(x):
+            return x
+
+        f(jnp.float64(1.0))
+        f(jnp.float32(1.0))
+        spy = mocker.spy(f.compiler, "run")
+
+        assert f(jnp.float32(1.0)).dtype == jnp.float32
+        assert f(jnp.float64(1.0)).dtype == jnp.float64
+        assert f(jnp.float16(1.0)).dtype == jnp.float32
+        assert spy.call_count == 0
+
+    def test_version_eviction(self, mocker):
+        """Test that the least recently used version is evicted once the bound is exceeded."""
+
+        @qjit(max_cached_versions=2)
+        def f(x):
+            return x
+
+        assert f.fn_cache.max_versions == 2
+        f(jnp.ones(1))
+        f(jnp.ones(2))
+        f(jnp.ones(1))  # mark the first version as most recently used
+        f(jnp.ones(3))
+
+        spy = mocker.spy(f.compiler, "run")
+        f(jnp.ones(1))
+        f(jnp.ones(3))
+        assert spy.call_count == 0
+
+        f(jnp.ones(2))
+        assert spy.call_count == 1
+
+    def test_calling_stub_is_reused(self):
+        """Test that repeated calls reuse the argument descriptors of the compiled function."""
+
+        @qjit
+        def f(x, y):
+            return jnp.array([x + y[0], jnp.sum(y)])
+
+        assert np.allclose(f(1.0, np.array([1.0, 2.0])), [2.0, 3.0])
+        stubs = f.compiled_function.calling_stubs
+        arg_value = next(iter(stubs.values())).arg_value
+
+        # Non-contiguous arrays are described through their strides.
+        y = np.arange(6.0)[::2]
+        assert np.allclose(f(2.0, y), [2.0, 6.0])
+        assert np.allclose(f(3.0, np.array([4.0, 5.0])), [7.0, 9.0])
+        assert len(stubs) == 1
+        assert next(iter(stubs.values())).arg_value is arg_value
+
+
+class TestPersistentSession:
+    """Test the persistent runtime session."""
+
+    def test_results_match(self, backend):
+        """Test that a persistent session produces the same results as separate sessions."""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            m = measure(0)
+            qml.RY(x, wires=1)
+            return m, qml.sample(wires=[0, 1])
+
+        device = qml.device(backend, wires=2, shots=20)
+        expected = qjit(qml.qnode(device)(circuit), seed=37)
+        persistent = qjit(qml.qnode(device)(circuit), seed=37, persistent_session=True)
+
+        for x in (0.1, 0.7, 1.3):
+            for actual, reference in zip(persistent(x), expected(x)):
+                assert np.array_equal(actual, reference)
+
+    def test_close(self, backend):
+        """Test that the session is closed together with the shared object."""
+
+        @qjit(persistent_session=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.allclose(circuit(0.5), np.cos(0.5))
+        assert np.allclose(circuit(0.5), np.cos(0.5))
+
+        shared_object = circuit.compiled_function.shared_object
+        shared_object.close()
+        shared_object.close()
+        assert shared_object.shared_object is None
+
+
+class TestOutputFormat:
+    """Test the array type of the results of compiled functions."""
+
+    @pytest.mark.parametrize(
+        "output_format, array_type", [("jax", jax.Array), ("numpy", np.ndarray)]
+    )
+    def test_array_type(self, backend, output_format, array_type):
+        """Test that results are returned as arrays of the requested type."""
+
+        @qjit(output_format=output_format)
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.state(), qml.expval(qml.PauliZ(1))
+
+        state, expval = circuit(0.5)
+
+        assert isinstance(state, array_type)
+        assert isinstance(expval, array_type)
+        assert np.allclose(state, [np.cos(0.25), 0, 0, -1j * np.sin(0.25)])
+        assert np.allclose(expval, np.cos(0.5))
+
+    def test_numpy_owns_buffer(self, backend):
+        """Test that NumPy results own the buffers allocated by the compiled function, which are
+        aligned such that JAX can wrap them without a copy."""
+
+        @qjit(output_format="numpy")
+        @qml.qnode(qml.device(backend, wires=4))
+        def circuit():
+            return qml.state()
+
+        state = circuit()
+
+        assert state.ctypes.data % 64 == 0
+        assert jax.device_put(state).unsafe_buffer_pointer() == state.ctypes.data
+
+    def test_invalid_output_format(self):
+        """Test that an unknown output format is rejected."""
+
+        with pytest.raises(ValueError, match="Invalid 'output_format'"):
+            qjit(lambda x: x, output_format="torch")
+
+
+class TestArgumentMarshalling:
+    """Test the conversion of arguments to the buffers passed to compiled functions."""
+
+    def test_jax_array_not_copied(self):
+        """Test that the data of large JAX arrays in host memory is passed without a copy."""
+
+        @qjit
+        def f(x):
+            return jnp.sum(x)
+
+        x = jnp.arange(1 << 14, dtype=jnp.float64)
+        assert np.allclose(f(x), np.sum(np.arange(1 << 14)))
+
+        compiled_function = f.compiled_function
+        _, buffers = compiled_function.args_to_memref_descs(compiled_function.restype, (x,))
+        assert buffers[0].ctypes.data == x.unsafe_buffer_pointer()
+
+    def test_unaligned_argument(self):
+        """Test that arguments whose elements are not aligned are copied before the call."""
+
+        @qjit
+        def f(x):
+            return 2 * x
+
+        packed = np.zeros(8, dtype=[("a", np.float64), ("b", np.int32)])
+        packed["a"] = np.arange(8)
+        x = packed["a"]
+        assert x.strides == (12,)
+
+        assert np.allclose(f(x), 2 * np.arange(8))
+
+
+class TestDonatedArguments:
+    """Test the reuse of the buffers of donated arguments by compiled functions."""
+
+    def test_result_in_donated_buffer(self):
+        """Test that a result updating a donated argument is computed in its buffer."""
+
+        @qjit(donate_argnums=0, output_format="numpy")
+        def f(x, y):
+            return jax.lax.dynamic_update_slice(x, y, (0,))
+
+        x = np.arange(8.0)
+        result = f(x, np.array([5.0]))
+
+        assert np.allclose(result, [5, 1, 2, 3, 4, 5, 6, 7])
+        assert np.shares_memory(result, x)
+
+    def test_arguments_not_donated(self):
+        """Test that neither arguments which are not donated nor donated JAX arrays are written."""
+
+        @qjit(donate_argnums=1)
+        def f(x, y):
+            return jax.lax.dynamic_update_slice(x, y[:1], (0,)), y.at[0].set(x[0])
+
+        x = np.arange(8.0)
+        y = jnp.array([5.0, 6.0])
+        result = f(x, y)
+
+        assert np.allclose(result[0], [5, 1, 2, 3, 4, 5, 6, 7])
+        assert np.allclose(result[1], [0, 6])
+        assert np.allclose(x, np.arange(8.0))
+        assert np.allclose(y, [5, 6])
+
+    def test_static_argument_donated(self):
+        """Test that static arguments cannot be donated."""
+
+        with pytest.raises(CompileError, match="Static arguments cannot be donated"):
+            qjit(lambda x, n: x * n, static_argnums=1, donate_argnums=1)
+
+    def test_donated_argument_out_of_range(self):
+        """Test that donating a missing argument is rejected."""
+
+        @qjit(donate_argnums=2)
+        def f(x):
+            return x
+
+        with pytest.raises(CompileError, match="out of range"):
+            f(1.0)
+
+
+class TestAsyncCalls:
+    """Test the asynchronous invocation of compiled functions."""
+
+    def test_submit(self, backend):
+        """Test that submitted calls produce the same results as synchronous calls."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return {"z": qml.expval(qml.PauliZ(1)), "probs": qml.probs()}
+
+        xs = np.linspace(0, np.pi, 16)
+        futures = [circuit.submit(x) for x in xs]
+        assert all(isinstance(future, Future) for future in futures)
+
+        for x, future in zip(xs, futures):
+            result, expected = future.result(), circuit(x)
+            assert np.allclose(result["z"], expected["z"])
+            assert np.allclose(result["probs"], expected["probs"])
+
+    def test_call_async(self, backend):
+        """Test that several calls can be awaited concurrently from an event loop."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        async def evaluate(xs):
+            return await asyncio.gather(*(circuit.call_async(x) for x in xs))
+
+        xs = np.linspace(0, np.pi, 8)
+        assert np.allclose(asyncio.run(evaluate(xs)), np.cos(xs))
+
+    def test_submit_compiles_on_worker(self):
+        """Test that submitted calls compile on a worker thread rather than blocking the caller,
+        and that compilation errors are raised by the future."""
+
+        @qjit
+        def f(x):
+            return x + 1
+
+        threads = []
+        jit_compile = f.jit_compile
+
+        def spy(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return jit_compile(*args, **kwargs)
+
+        f.jit_compile = spy
+        assert f.submit(1.0).result() == 2.0
+        assert threads and threading.current_thread() not in threads
+
+        @qjit(donate_argnums=1)
+        def g(x):
+            return x + 1
+
+        future = g.submit(1.0)
+        with pytest.raises(CompileError, match="out of range"):
+            future.result()
+
+    def test_submit_traced(self):
+        """Test that asynchronous calls cannot be traced."""
+
+        @qjit
+        def f(x):
+            return x + 1
+
+        @qjit
+        def g(x):
+            return f.submit(x)
+
+        with pytest.raises(CompileError, match="cannot be traced"):
+            g(1.0)
+
+    def test_close_in_flight(self, backend):
+        """Test that closing a shared object is deferred while it is in use."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit(0.5)
+        shared_object = circuit.compiled_function.shared_object
+
+        shared_object.acquire()
+        shared_object.close()
+        assert shared_object.shared_object is not None
+        assert np.allclose(circuit.compiled_function(0.5), np.cos(0.5))
+
+        shared_object.release()
+        assert shared_object.shared_object is None
+
+
+class TestConcurrentCalls:
+    """Stress test the synchronous invocation of compiled functions from several threads."""
+
+    def test_same_signature(self, backend):
+        """Test that concurrent calls of the same compiled function produce correct results."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        xs = np.linspace(0, np.pi, 256)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(circuit, xs))
+
+        assert np.allclose(results, np.cos(xs))
+
+    def test_different_signatures(self):
+        """Test that concurrent calls compiling and evicting versions of a function do not affect
+        the executions of other threads."""
+
+        @qjit
+        def f(x):
+            return jnp.sum(x) * 2
+
+        f.fn_cache.max_versions = 2
+        sizes = [size for _ in range(8) for size in range(1, 7)]
+
+        def call(size):
+            return f(jnp.ones(size)), size
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for result, size in executor.map(call, sizes):
+                assert np.allclose(result, 2 * size)
+
+    def test_call_while_tracing(self):
+        """Test that calls from other threads are executed while a function is being traced."""
+
+        @qjit
+        def f(x):
+            return x + 1
+
+        f(1.0)
+        results = []
+
+        @qjit
+        def g(x):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(f, 1.0).result())
+            return x
+
+        g(1.0)
+        assert len(results) == 1 and not isinstance(results[0], jax.core.Tracer)
+        assert np.allclose(results[0], 2.0)
+
+
+class TestPrecompile:
+    """Test the concurrent compilation of several functions."""
+
+    def test_precompile(self, backend, monkeypatch):
+        """Test that precompiled functions and specializations are not compiled again."""
+
+        @qml.qnode(qml.device(backend, wires=2))
+        def layered(x, layers):
+            for _ in range(layers):
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        circuit = qjit(layered, static_argnums=1)
+        reference = qjit(layered, static_argnums=1)
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        precompile(
+            [
+                *((circuit, (0.1, layers)) for layers in range(1, 4)),
+                (f, (jax.core.ShapedArray((3,), jnp.float64),)),
+            ],
+            max_workers=4,
+        )
+
+        def fail():
+            assert False, "unexpected compilation"
+
+        monkeypatch.setattr(circuit, "compile", fail)
+        monkeypatch.setattr(f, "compile", fail)
+
+        for layers in range(1, 4):
+            assert np.allclose(circuit(0.5, layers), reference(0.5, layers))
+        assert np.allclose(f(jnp.ones(3)), 2 * np.ones(3))
+
+    def test_precompile_duplicates(self, mocker):
+        """Test that a signature requested several times in a batch is compiled once."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        spy = mocker.spy(f, "capture_and_lower")
+        precompile([(f, (1.0,)), (f, (2.0,)), (f, (jnp.ones(2),)), (f, (3.0,))], max_workers=2)
+        assert spy.call_count == 2
+        assert sum(len(versions) for versions in f.fn_cache.cache.values()) == 2
+
+    def test_precompile_concurrent_calls(self):
+        """Test that precompiling a function while it is called from other threads neither
+        corrupts its active state nor the results of the calls."""
+
+        @qjit
+        def f(x):
+            return jnp.sum(x) * 2
+
+        def call(size):
+            return f(jnp.ones(size)), size
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = executor.map(call, [size for _ in range(4) for size in range(1, 5)])
+            precompile([(f, (jnp.ones(size),)) for size in range(3, 7)], max_workers=2)
+            for result, size in results:
+                assert result == 2 * size
+
+        for size in range(1, 7):
+            assert f(jnp.ones(size)) == 2 * size
+
+    def test_precompile_invalid(self):
+        """Test that only qjit-compiled functions can be precompiled."""
+
+        with pytest.raises(TypeError, match="Expected a qjit-compiled function"):
+            precompile([(lambda x: x, (1.0,))])
+
 
 class TestShots:
     # Shots influences on the sample instruction
@@ -454,6 +454,30 @@ class TestDynamicOneShotIntegration:
         else:
             assert qml.math.allclose(res, expected)
 
+    @pytest.mark.parametrize("shot_threads", [1, 4])
+    def test_mcm_method_one_shot_parallel_shots(self, backend, shot_threads):
+        """Test that shots executed in parallel produce the same statistics as sequential ones."""
+        dev = qml.device(backend, wires=2, shots=2000)
+
+        @qml.qnode(dev, mcm_method="one-shot")
+        def circuit(x):
+            qml.RY(x, wires=0)
+            m0 = measure(0)
+
+            @cond(m0)
+            def ansatz():
+                qml.PauliX(wires=1)
+
+            ansatz()
+            return qml.expval(qml.PauliZ(1)), qml.sample(m0)
+
+        param = jnp.pi / 3
+        expval, samples = qjit(circuit, shot_threads=shot_threads)(param)
+
+        assert samples.shape == (2000,)
+        assert np.allclose(expval, 1 - 2 * np.mean(samples))
+        assert np.allclose(expval, np.cos(param), atol=0.1)
+
     @pytest.mark.parametrize("shots", [1, 10])
     def test_dynamic_one_shot_only_called_once(self, backend, shots, mocker):
         """Test that when using mcm_method="one-shot", dynamic_one_shot does not get
@@ -34,7 +34,12 @@ from catalyst.api_extensions.control_flow import (
 )
 from catalyst.api_extensions.quantum_operators import HybridAdjoint, adjoint
 from catalyst.compiler import get_lib_path
-from catalyst.device.decomposition import catalyst_decompose, decompose_ops_to_unitary
+from catalyst.device import QJITDevice
+from catalyst.device.decomposition import (
+    catalyst_decompose,
+    decompose_ops_to_unitary,
+    decomposition_cache,
+)
 from catalyst.jax_tracer import HybridOpRegion
 from catalyst.tracing.contexts import EvaluationContext, EvaluationMode
 
@@ -170,6 +175,107 @@ class TestDecomposition:
             qjit(f, target="jaxpr")
 
 
+class TestDecompositionCache:
+    """Test the reuse of operator decompositions across operator instances."""
+
+    @staticmethod
+    def decompose(ops, capabilities, grad_method=None):
+        """Decompose a list of operations for the given capabilities."""
+        tape = QuantumScript(ops, [qml.expval(qml.PauliZ(0))])
+        (tape,), _ = catalyst_decompose(
+            tape, ctx=None, capabilities=capabilities, grad_method=grad_method
+        )
+        return tape.operations
+
+    def test_repeated_operators(self):
+        """Test that instances of an operator share their decomposition, relabelled to their
+        wires."""
+        capabilities = QJITDevice(qml.device("lightning.qubit", wires=8)).capabilities
+        decomposition_cache.clear()
+
+        expected = self.decompose([qml.QFT(wires=range(4))], capabilities)
+        assert decomposition_cache.cache_info().misses == 1
+
+        ops = [qml.QFT(wires=range(4)), qml.QFT(wires=range(4)), qml.QFT(wires=[4, 5, 6, 7])]
+        decomposed = self.decompose(ops, capabilities)
+        info = decomposition_cache.cache_info()
+        assert info.hits == 3 and info.misses == 1 and info.currsize == 1
+
+        wire_map = dict(zip(range(4), range(4, 8)))
+        expected = expected + expected + [qml.map_wires(op, wire_map) for op in expected]
+        assert len(decomposed) == len(expected)
+        assert all(qml.equal(op, expected_op) for op, expected_op in zip(decomposed, expected))
+
+    def test_hyperparameters_are_part_of_the_key(self):
+        """Test that operators with different hyperparameters are decomposed separately."""
+        capabilities = QJITDevice(qml.device("lightning.qubit", wires=8)).capabilities
+        decomposition_cache.clear()
+
+        ops = [
+            qml.GroverOperator(wires=range(4), work_wires=[4]),
+            qml.GroverOperator(wires=range(4), work_wires=[5]),
+            qml.GroverOperator(wires=range(4), work_wires=[4]),
+        ]
+        self.decompose(ops, capabilities)
+        info = decomposition_cache.cache_info()
+        assert info.hits >= 1 and info.currsize >= 2
+
+    def test_operators_with_parameters_are_not_cached(self):
+        """Test that operators with parameters, which may be traced, are always decomposed."""
+        capabilities = QJITDevice(qml.device("lightning.qubit", wires=2)).capabilities
+        decomposition_cache.clear()
+
+        decomposed = self.decompose([qml.U3(0.1, 0.2, 0.3, wires=0)] * 2, capabilities)
+        assert decomposed
+        assert decomposition_cache.cache_info() == (0, 0, decomposition_cache.maxsize, 0)
+
+    def test_capture(self):
+        """Test the decomposition cache while capturing a program."""
+        decomposition_cache.clear()
+
+        @qjit(target="mlir")
+        @qml.qnode(qml.device("lightning.qubit", wires=4))
+        def circuit():
+            for _ in range(10):
+                qml.QFT(wires=range(4))
+            return qml.probs()
+
+        assert "QFT" not in circuit.mlir
+        assert decomposition_cache.cache_info().hits == 9
+
+    def test_hybrid_ops_are_not_cached(self):
+        """Test that decompositions containing hybrid operations, whose regions are traced for the
+        wires of a single instance, are not shared with other instances."""
+
+        class LoopedX(qml.operation.Operation):
+            """An operator decomposing to a loop of PauliX gates."""
+
+            num_wires = 1
+            num_params = 0
+
+            @staticmethod
+            def compute_decomposition(wires):  # pylint: disable=arguments-differ
+                @for_loop(0, 3, 1)
+                def loop(_i):
+                    qml.X(wires[0])
+
+                with qml.queuing.AnnotatedQueue() as q:
+                    loop()
+                return q.queue
+
+        decomposition_cache.clear()
+
+        @qjit
+        @qml.qnode(qml.device("lightning.qubit", wires=2))
+        def circuit():
+            LoopedX(wires=0)
+            LoopedX(wires=1)
+            return qml.probs()
+
+        assert np.allclose(circuit(), [0, 0, 0, 1])
+        assert decomposition_cache.cache_info().currsize == 0
+
+
 # tapes and regions for generating HybridOps
 tape1 = QuantumScript([qml.X(0), qml.Hadamard(1)])
 tape2 = QuantumScript([qml.RY(1.23, 1), qml.Y(0), qml.Hadamard(2)])
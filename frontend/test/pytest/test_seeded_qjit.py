@@ -31,6 +31,29 @@ def test_seeded_async():
         _()
 
 
+def test_shot_threads_async():
+    """Test that parallel shots and async cannot be simultaneously used"""
+    with pytest.raises(CompileError, match="Parallel shots are not supported"):
+
+        @qjit(async_qnodes=True, shot_threads=4)
+        def _():
+            return
+
+        _()
+
+
+@pytest.mark.parametrize("shot_threads", [0, 2.5])
+def test_shot_threads_invalid(shot_threads):
+    """Test that a number of shot threads which is not a positive integer raises an error"""
+    with pytest.raises(ValueError, match="Invalid 'shot_threads'"):
+
+        @qjit(shot_threads=shot_threads)
+        def _():
+            return
+
+        _()
+
+
 @pytest.mark.parametrize("seed", [-1, 2**32])
 def test_seed_out_of_range(seed):
     """Test that a seed that is not a unsigned 32-bit int raises an error"""
@@ -289,5 +312,68 @@ def test_seeded_var(seed, shots, backend):
         assert np.allclose(results0, results2)
 
 
+@pytest.mark.parametrize("seed", [42, 0])
+def test_seeded_parallel_shots(seed, backend):
+    """Test that seeded one-shot executions produce the same results regardless of the number of
+    threads executing the shots"""
+
+    dev = qml.device(backend, wires=1, shots=100)
+
+    def workflow(shot_threads):
+        @qjit(seed=seed, shot_threads=shot_threads)
+        @qml.qnode(dev, mcm_method="one-shot")
+        def circuit():
+            qml.Hadamard(0)
+            m = measure(0)
+
+            @cond(m)
+            def cfun0():
+                qml.Hadamard(0)
+
+            cfun0()
+            return qml.sample(m), qml.sample(wires=0)
+
+        return circuit
+
+    results = [workflow(shot_threads)() for shot_threads in (1, 2, 4)]
+    for _ in range(3):
+        results.append(workflow(4)())
+
+    for result in results[1:]:
+        assert np.array_equal(result[0], results[0][0])
+        assert np.array_equal(result[1], results[0][1])
+
+
+@pytest.mark.parametrize("seed", [42, 0])
+def test_seeded_sample_after_parallel_shots(seed, backend):
+    """Test that the samples drawn after a parallel one-shot execution do not depend on the number
+    of threads executing the shots"""
+
+    dev = qml.device(backend, wires=1, shots=100)
+
+    def workflow(shot_threads):
+        @qml.qnode(dev, mcm_method="one-shot")
+        def mcm_circuit():
+            qml.Hadamard(0)
+            m = measure(0)
+            return qml.sample(m)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(0)
+            return qml.sample(wires=0)
+
+        @qjit(seed=seed, shot_threads=shot_threads)
+        def fn():
+            return mcm_circuit(), circuit()
+
+        return fn
+
+    results = [workflow(shot_threads)() for shot_threads in (1, 4)]
+
+    assert np.array_equal(results[0][0], results[1][0])
+    assert np.array_equal(results[0][1], results[1][1])
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])
@@ -14,9 +14,12 @@
 
 """Unit tests for Catalyst's tracing module."""
 
+from types import SimpleNamespace
+
 import jax
 import pytest
 
+from catalyst.jax_extras import sort_eqns
 from catalyst.jax_tracer import lower_jaxpr_to_mlir
 
 
@@ -32,5 +35,41 @@ def test_jaxpr_lowering_without_dynshapes():
     assert "@jit_test_fn() -> tensor<i64>" in str(result)
 
 
+def make_eqn(primitive, invars, outvars):
+    """Make a stand-in for a JAXPR equation, with variables identified by their count."""
+    return SimpleNamespace(
+        primitive=primitive,
+        invars=[SimpleNamespace(count=v) for v in invars],
+        outvars=[SimpleNamespace(count=v) for v in outvars],
+    )
+
+
+def test_sort_eqns_forced_order():
+    """Test that equations are ordered after their inputs and after preceding forced-order
+    equations, but not before following ones."""
+
+    eqns = [
+        make_eqn("b", [0], [1]),  # depends on the last equation
+        make_eqn("m", [], [2]),
+        make_eqn("a", [], [3]),
+        make_eqn("m", [], [4]),
+        make_eqn("a", [], [0]),
+    ]
+    order = [eqns.index(e) for e in sort_eqns(eqns, {"m"})]
+
+    assert order.index(1) < order.index(2) < order.index(3) < order.index(4)
+    assert order.index(4) < order.index(0)
+
+
+def test_sort_eqns_many_forced_order():
+    """Test that ordering many forced-order equations keeps their relative order."""
+
+    num_eqns = 20000
+    eqns = [make_eqn("m" if i % 2 else "a", [i - 1] if i else [], [i]) for i in range(num_eqns)]
+    eqns.reverse()
+
+    assert sort_eqns(eqns, {"m"}) == eqns[::-1]
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])
@@ -816,3 +816,78 @@ class TestVectorizeMap:
             return x**2
 
         assert f.mlir is None
+
+
+class TestParallelVectorizeMap:
+    """Test the parallel execution mode of catalyst.vmap."""
+
+    @pytest.mark.parametrize("num_threads", [1, 3, 16])
+    def test_parallel_circuit(self, backend, num_threads):
+        """Test that a qjit-compiled circuit mapped over a pool of threads matches jax.vmap."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x, y):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1] * y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1)), qml.probs(wires=[0, 1])
+
+        x = jnp.linspace(0, 1, 20).reshape(10, 2)
+        y = jnp.pi / 3
+
+        expected = jax.vmap(circuit, in_axes=(0, None))(x, y)
+        result = vmap(circuit, in_axes=(0, None), num_threads=num_threads)(x, y)
+
+        assert jnp.allclose(result[0], expected[0])
+        assert jnp.allclose(result[1], expected[1])
+
+    def test_parallel_out_axes(self):
+        """Test in_axes and out_axes in the parallel mode."""
+
+        @qjit
+        def f(x):
+            return {"a": x * 2, "b": jnp.stack([x, x])}
+
+        x = jnp.arange(12.0).reshape(3, 4)
+        result = vmap(f, in_axes=1, out_axes={"a": 0, "b": 1}, num_threads=2)(x)
+        expected = jax.vmap(f, in_axes=1, out_axes={"a": 0, "b": 1})(x)
+
+        assert result["a"].shape == expected["a"].shape == (4, 3)
+        assert result["b"].shape == expected["b"].shape == (2, 4, 3)
+        assert jnp.allclose(result["a"], expected["a"])
+        assert jnp.allclose(result["b"], expected["b"])
+
+    def test_parallel_python_function(self):
+        """Test that functions which are not qjit-compiled can be mapped in parallel."""
+
+        result = vmap(lambda x: x**2, num_threads=4)(jnp.arange(5.0))
+        assert jnp.allclose(result, jnp.arange(5.0) ** 2)
+
+    def test_parallel_exception(self):
+        """Test that exceptions raised by a worker are propagated."""
+
+        def f(x):
+            if x > 2:
+                raise RuntimeError("worker failure")
+            return x
+
+        with pytest.raises(RuntimeError, match="worker failure"):
+            vmap(f, num_threads=2)(jnp.arange(5.0))
+
+    @pytest.mark.parametrize("num_threads", [0, -1, 1.5])
+    def test_invalid_num_threads(self, num_threads):
+        """Test the validation of num_threads."""
+
+        with pytest.raises(ValueError, match="Invalid 'num_threads'"):
+            vmap(lambda x: x, num_threads=num_threads)
+
+    def test_parallel_inside_qjit(self):
+        """Test that the parallel mode is rejected inside qjit."""
+
+        @qjit
+        def f(x):
+            return vmap(lambda y: y * 2, num_threads=2)(x)
+
+        with pytest.raises(ValueError, match="not supported inside a qjit function"):
+            f(jnp.ones(3))
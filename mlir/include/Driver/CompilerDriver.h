@@ -74,6 +74,10 @@ struct CompilerOptions {
     Action loweringAction;
     /// If true, the compiler will dump the pass pipeline that will be run.
     bool dumpPassPipeline;
+    /// The optimization level of the LLVM passes and code generation, from 0 to 3.
+    unsigned optLevel = 2;
+    /// If true, the time spent in each pass is collected into the pass profile of the output.
+    bool profilePasses = false;
 
     /// Get the destination of the object file at the end of compilation.
     std::string getObjectFile() const
@@ -89,6 +93,8 @@ struct CompilerOutput {
     std::string outIR;
     std::string diagnosticMessages;
     PipelineOutputs pipelineOutputs;
+    /// The time spent in each pass and the size of the program after it, in JSON format.
+    std::string passProfile;
     size_t pipelineCounter = 0;
     /// if the compiler reach the pass specified by startAfterPass.
     bool isCheckpointFound;
@@ -110,12 +116,16 @@ mlir::LogicalResult QuantumDriverMain(const catalyst::driver::CompilerOptions &o
                                       mlir::DialectRegistry &registry);
 
 int QuantumDriverMainFromCL(int argc, char **argv);
+
+/// Entry point to the compiler for in-process use, compiling the textual IR in `source` without
+/// reading or writing any files other than the object file and the requested intermediate files.
 int QuantumDriverMainFromArgs(const std::string &source, const std::string &workspace,
-                              const std::string &moduleName, bool keepIntermediate,
-                              bool asyncQNodes, bool verbose, bool lowerToLLVM,
+                              const std::string &moduleName,
+                              catalyst::driver::SaveTemps keepIntermediate, bool asyncQNodes,
+                              bool verbose, bool lowerToLLVM,
                               const std::vector<catalyst::driver::Pipeline> &passPipelines,
-                              const std::string &checkpointStage,
-                              catalyst::driver::CompilerOutput &output);
+                              const std::string &checkpointStage, unsigned optLevel,
+                              bool profilePasses, catalyst::driver::CompilerOutput &output);
 
 namespace llvm {
 
@@ -19,6 +19,7 @@
 #include <iostream>
 #include <list>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
 #include <string_view>
@@ -35,6 +36,7 @@
 #include "mlir/Support/FileUtilities.h"
 #include "mlir/Target/LLVMIR/Export.h"
 #include "stablehlo/dialect/Register.h"
+#include "llvm/ADT/ScopeExit.h"
 #include "llvm/Analysis/CGSCCPassManager.h"
 #include "llvm/Analysis/LoopAnalysisManager.h"
 #include "llvm/IR/LegacyPassManager.h"
@@ -76,6 +78,7 @@
 #include "Quantum/Transforms/Passes.h"
 
 #include "Enzyme.h"
+#include "PassProfiler.hpp"
 #include "Timer.hpp"
 
 using namespace mlir;
@@ -256,8 +259,8 @@ struct CatalystPassInstrumentation : public PassInstrumentation {
 } // namespace
 
 namespace {
-/// Parse an MLIR module given in textual ASM representation. Any errors during parsing will be
-/// output to diagnosticStream.
+/// Parse an MLIR module given in textual ASM or bytecode representation. Any errors during
+/// parsing will be output to diagnosticStream.
 OwningOpRef<ModuleOp> parseMLIRSource(MLIRContext *ctx, const llvm::SourceMgr &sourceMgr)
 {
     FallbackAsmResourceMap fallbackResourceMap;
@@ -266,6 +269,14 @@ OwningOpRef<ModuleOp> parseMLIRSource(MLIRContext *ctx, const llvm::SourceMgr &s
     return parseSourceFile<ModuleOp>(sourceMgr, parserConfig);
 }
 
+/// Count the operations nested in an operation, including itself.
+int64_t countOperations(Operation *op)
+{
+    int64_t count = 0;
+    op->walk([&](Operation *) { count++; });
+    return count;
+}
+
 /// From the MLIR module it checks if gradients operations are in the program.
 bool containsGradients(mlir::ModuleOp moduleOp)
 {
@@ -322,6 +333,13 @@ bool shouldRunStage(const CompilerOptions &options, CompilerOutput &output,
     return true;
 }
 
+/// Whether the module contains coroutines which need to be split, e.g. from parallel loops lowered
+/// through the async dialect.
+bool containsCoroutines(const llvm::Module &module)
+{
+    return llvm::any_of(module, [](const llvm::Function &F) { return F.isPresplitCoroutine(); });
+}
+
 LogicalResult runCoroLLVMPasses(const CompilerOptions &options,
                                 std::shared_ptr<llvm::Module> llvmModule, CompilerOutput &output)
 {
@@ -365,10 +383,26 @@ LogicalResult runCoroLLVMPasses(const CompilerOptions &options,
     return success();
 }
 
+/// Get the level of the LLVM optimization pipelines. These only run on modules with gradients
+/// below level 3, and Enzyme relies on the promotion of stack variables to registers for its
+/// activity analysis, so that levels 0 and 1 both correspond to O1.
+llvm::OptimizationLevel getLLVMOptimizationLevel(const CompilerOptions &options)
+{
+    switch (options.optLevel) {
+    case 0:
+    case 1:
+        return llvm::OptimizationLevel::O1;
+    case 2:
+        return llvm::OptimizationLevel::O2;
+    default:
+        return llvm::OptimizationLevel::O3;
+    }
+}
+
 LogicalResult runO2LLVMPasses(const CompilerOptions &options,
                               std::shared_ptr<llvm::Module> llvmModule, CompilerOutput &output)
 {
-    // opt -O2
+    // opt -O2, or the level given by the optimization level of the options.
     // As seen here:
     // https://llvm.org/docs/NewPassManager.html#just-tell-me-how-to-run-the-default-optimization-pipeline-with-the-new-pass-manager
     if (!shouldRunStage(options, output, "O2Opt")) {
@@ -400,8 +434,9 @@ LogicalResult runO2LLVMPasses(const CompilerOptions &options,
     PB.crossRegisterProxies(LAM, FAM, CGAM, MAM);
 
     // Create the pass manager.
-    // This one corresponds to a typical -O2 optimization pipeline.
-    llvm::ModulePassManager MPM = PB.buildPerModuleDefaultPipeline(llvm::OptimizationLevel::O2);
+    // This one corresponds to a typical -O2 optimization pipeline by default.
+    llvm::ModulePassManager MPM =
+        PB.buildPerModuleDefaultPipeline(getLLVMOptimizationLevel(options));
 
     // Optimize the IR!
     MPM.run(*llvmModule.get(), MAM);
@@ -447,9 +482,9 @@ LogicalResult runEnzymePasses(const CompilerOptions &options,
     augmentPassBuilder(PB);
 
     // Create the pass manager.
-    // This one corresponds to a typical -O2 optimization pipeline.
+    // This one corresponds to a typical -O2 optimization pipeline by default.
     llvm::ModulePassManager MPM = PB.buildModuleOptimizationPipeline(
-        llvm::OptimizationLevel::O2, llvm::ThinOrFullLTOPhase::None);
+        getLLVMOptimizationLevel(options), llvm::ThinOrFullLTOPhase::None);
 
     // Optimize the IR!
     MPM.run(*llvmModule.get(), MAM);
@@ -473,7 +508,8 @@ std::string readInputFile(const std::string &filename)
         buffer << std::string(begin, end);
         return buffer.str();
     }
-    std::ifstream file(filename);
+    // The input may be MLIR bytecode, which must be read verbatim.
+    std::ifstream file(filename, std::ios::binary);
     if (!file.is_open()) {
         return "";
     }
@@ -484,17 +520,24 @@ std::string readInputFile(const std::string &filename)
 
 LogicalResult preparePassManager(PassManager &pm, const CompilerOptions &options,
                                  CompilerOutput &output, catalyst::utils::Timer &timer,
-                                 TimingScope &timing)
+                                 TimingScope &timing, catalyst::utils::PassProfiler *profiler)
 {
     auto beforePassCallback = [&](Pass *pass, Operation *op) {
         if (options.verbosity >= Verbosity::Debug && !timer.is_active()) {
             timer.start();
         }
+        if (profiler) {
+            profiler->start(pass, pass->getName());
+        }
     };
 
     // For each pipeline-terminating pass, print the IR into the corresponding dump file and
     // into a diagnostic output buffer. Note that one pass can terminate multiple pipelines.
     auto afterPassCallback = [&](Pass *pass, Operation *op) {
+        if (profiler) {
+            profiler->stop(countOperations(op));
+        }
+
         auto pipelineName = pass->getName();
         if (options.verbosity >= Verbosity::Debug) {
             timer.dump(pipelineName.str(), /*add_endl */ false);
@@ -515,6 +558,10 @@ LogicalResult preparePassManager(PassManager &pm, const CompilerOptions &options
 
     // For each failed pass, print the owner pipeline name into a diagnostic stream.
     auto afterPassFailedCallback = [&](Pass *pass, Operation *op) {
+        if (profiler) {
+            profiler->stop(countOperations(op));
+        }
+
         options.diagnosticStream << "While processing '" << pass->getName().str() << "' pass ";
         std::string tmp;
         llvm::raw_string_ostream s{tmp};
@@ -580,7 +627,8 @@ LogicalResult runPipeline(PassManager &pm, const CompilerOptions &options, Compi
 }
 
 LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, ModuleOp moduleOp,
-                          CompilerOutput &output, TimingScope &timing)
+                          CompilerOutput &output, TimingScope &timing,
+                          catalyst::utils::PassProfiler *profiler)
 
 {
     if (options.keepIntermediate && (options.checkpointStage.empty() || output.isCheckpointFound)) {
@@ -594,7 +642,7 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
     catalyst::utils::Timer timer{};
 
     auto pm = PassManager::on<ModuleOp>(ctx, PassManager::Nesting::Implicit);
-    if (failed(preparePassManager(pm, options, output, timer, timing))) {
+    if (failed(preparePassManager(pm, options, output, timer, timing, profiler))) {
         llvm::errs() << "Failed to setup pass manager\n";
         return failure();
     }
@@ -613,6 +661,9 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
             pm.dump();
             llvm::errs() << "\n";
         }
+        if (profiler) {
+            profiler->setStage("mlir");
+        }
         return pm.run(moduleOp);
     }
 
@@ -620,6 +671,9 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
     std::vector<Pipeline> UserPipeline =
         clHasManualPipeline ? options.pipelinesCfg : getDefaultPipeline();
     for (auto &pipeline : UserPipeline) {
+        if (profiler) {
+            profiler->setStage(pipeline.getName());
+        }
         if (failed(catalyst::utils::Timer::timer(runPipeline, pipeline.getName(),
                                                  /* add_endl */ false, pm, options, output,
                                                  pipeline, clHasManualPipeline, moduleOp))) {
@@ -647,11 +701,64 @@ LogicalResult verifyInputType(const CompilerOptions &options, InputType inType)
     return success();
 }
 
+/// Register the passes and pipelines available to the driver. This must happen at most once per
+/// process, which also makes the LLVM target initialization safe for concurrent compilations.
+void registerDriverPasses()
+{
+    static std::once_flag registered;
+    std::call_once(registered, []() {
+        registerAllPasses();
+        registerAllCatalystPasses();
+        registerAllCatalystPipelines();
+        mhlo::registerAllMhloPasses();
+
+        llvm::InitializeAllTargetInfos();
+        llvm::InitializeAllTargets();
+        llvm::InitializeAllTargetMCs();
+        llvm::InitializeAllAsmParsers();
+        llvm::InitializeAllAsmPrinters();
+    });
+}
+
+void registerDriverDialects(DialectRegistry &registry)
+{
+    registerAllCatalystDialects(registry);
+    registerLLVMTranslations(registry);
+
+    // Register bufferization interfaces
+    catalyst::registerBufferizableOpInterfaceExternalModels(registry);
+    catalyst::gradient::registerBufferizableOpInterfaceExternalModels(registry);
+    catalyst::quantum::registerBufferizableOpInterfaceExternalModels(registry);
+}
+
 LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &output,
                                 DialectRegistry &registry)
 {
     using timer = catalyst::utils::Timer;
 
+    // The profile of the passes is returned even if the compilation fails.
+    std::optional<catalyst::utils::PassProfiler> profiler;
+    if (options.profilePasses) {
+        profiler.emplace(options.moduleName);
+    }
+    auto saveProfile = llvm::make_scope_exit([&] {
+        if (profiler) {
+            output.passProfile = profiler->toJSON();
+        }
+    });
+
+    // Measure a step of the driver outside of the MLIR pass manager, if passes are profiled.
+    auto profile = [&](llvm::StringRef stage, llvm::StringRef name, auto func, auto size) {
+        if (!profiler) {
+            return func();
+        }
+        profiler->setStage(stage);
+        return profiler->measure(name, func, size);
+    };
+    auto instructionCount = [&](const auto &) {
+        return static_cast<int64_t>(llvmModule->getInstructionCount());
+    };
+
     MLIRContext ctx(registry);
     ctx.printOpOnDiagnostic(true);
     ctx.printStackTraceOnDiagnostic(options.verbosity >= Verbosity::Debug);
@@ -680,8 +787,15 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
     TimingScope timing = tm.getRootScope();
 
     TimingScope parserTiming = timing.nest("Parser");
-    OwningOpRef<ModuleOp> mlirModule =
-        timer::timer(parseMLIRSource, "parseMLIRSource", /* add_endl */ false, &ctx, *sourceMgr);
+    OwningOpRef<ModuleOp> mlirModule = profile(
+        "Parser", "parseMLIRSource",
+        [&] {
+            return timer::timer(parseMLIRSource, "parseMLIRSource", /* add_endl */ false, &ctx,
+                                *sourceMgr);
+        },
+        [](const OwningOpRef<ModuleOp> &moduleOp) {
+            return moduleOp ? countOperations(moduleOp.get()) : 0;
+        });
 
     enum InputType inType = InputType::OTHER;
     if (mlirModule) {
@@ -723,7 +837,8 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
         // stages of compilation are executed independently via the Catalyst CLI.
         // Ideally, It should be added to the IR via an attribute.
         enzymeRun = containsGradients(*mlirModule);
-        if (failed(runLowering(options, &ctx, *mlirModule, output, optTiming))) {
+        if (failed(runLowering(options, &ctx, *mlirModule, output, optTiming,
+                               profiler ? &*profiler : nullptr))) {
             CO_MSG(options, Verbosity::Urgent, "Failed to lower MLIR module\n");
             return failure();
         }
@@ -736,10 +851,16 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
 
     if (runTranslate && (inType == InputType::MLIR)) {
         TimingScope translateTiming = timing.nest("Translate");
-        llvmModule =
-            timer::timer(translateModuleToLLVMIR, "translateModuleToLLVMIR",
-                         /* add_endl */ false, *mlirModule, llvmContext, "LLVMDialectModule",
-                         /* disableVerification */ true);
+        llvmModule = profile(
+            "LLVM", "translateModuleToLLVMIR",
+            [&] {
+                return timer::timer(translateModuleToLLVMIR, "translateModuleToLLVMIR",
+                                    /* add_endl */ false, *mlirModule, llvmContext,
+                                    "LLVMDialectModule", /* disableVerification */ true);
+            },
+            [](const std::unique_ptr<llvm::Module> &module) {
+                return module ? static_cast<int64_t>(module->getInstructionCount()) : 0;
+            });
         if (!llvmModule) {
             CO_MSG(options, Verbosity::Urgent, "Failed to translate LLVM module\n");
             return failure();
@@ -766,12 +887,7 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
         TimingScope llcTiming = timing.nest("llc");
         // Set data layout before LLVM passes or the default one is used.
         llvm::Triple targetTriple(llvm::sys::getDefaultTargetTriple());
-
-        llvm::InitializeAllTargetInfos();
-        llvm::InitializeAllTargets();
-        llvm::InitializeAllTargetMCs();
-        llvm::InitializeAllAsmParsers();
-        llvm::InitializeAllAsmPrinters();
+        registerDriverPasses();
 
         std::string err;
         auto target = llvm::TargetRegistry::lookupTarget(targetTriple, err);
@@ -780,32 +896,52 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
         const char *features = "";
         auto targetMachine =
             target->createTargetMachine(targetTriple, cpu, features, opt, llvm::Reloc::Model::PIC_);
-        targetMachine->setOptLevel(llvm::CodeGenOptLevel::None);
+        targetMachine->setOptLevel(options.optLevel >= 3 ? llvm::CodeGenOptLevel::Aggressive
+                                                         : llvm::CodeGenOptLevel::None);
         llvmModule->setDataLayout(targetMachine->createDataLayout());
         llvmModule->setTargetTriple(targetTriple);
 
-        if (options.asyncQnodes) {
+        if (options.asyncQnodes || containsCoroutines(*llvmModule)) {
             TimingScope coroLLVMPassesTiming = llcTiming.nest("LLVM coroutine passes");
-            if (failed(timer::timer(runCoroLLVMPasses, "runCoroLLVMPasses", /* add_endl */ false,
-                                    options, llvmModule, output))) {
+            if (failed(profile(
+                    "LLVM", "CoroOpt",
+                    [&] {
+                        return timer::timer(runCoroLLVMPasses, "runCoroLLVMPasses",
+                                            /* add_endl */ false, options, llvmModule, output);
+                    },
+                    instructionCount))) {
                 return failure();
             }
             coroLLVMPassesTiming.stop();
             catalyst::utils::LinesCount::Module(*llvmModule.get());
         }
 
-        if (enzymeRun) {
+        // At the highest optimization level, all modules go through the LLVM optimization
+        // pipeline, otherwise only the modules which need it for Enzyme.
+        if (enzymeRun || options.optLevel >= 3) {
             TimingScope o2PassesTiming = llcTiming.nest("LLVM O2 passes");
-            if (failed(timer::timer(runO2LLVMPasses, "runO2LLVMPasses", /* add_endl */ false,
-                                    options, llvmModule, output))) {
+            if (failed(profile(
+                    "LLVM", "O2Opt",
+                    [&] {
+                        return timer::timer(runO2LLVMPasses, "runO2LLVMPasses",
+                                            /* add_endl */ false, options, llvmModule, output);
+                    },
+                    instructionCount))) {
                 return failure();
             }
             o2PassesTiming.stop();
             catalyst::utils::LinesCount::Module(*llvmModule.get());
+        }
 
+        if (enzymeRun) {
             TimingScope enzymePassesTiming = llcTiming.nest("Enzyme passes");
-            if (failed(timer::timer(runEnzymePasses, "runEnzymePasses", /* add_endl */ false,
-                                    options, llvmModule, output))) {
+            if (failed(profile(
+                    "LLVM", "Enzyme",
+                    [&] {
+                        return timer::timer(runEnzymePasses, "runEnzymePasses",
+                                            /* add_endl */ false, options, llvmModule, output);
+                    },
+                    instructionCount))) {
                 return failure();
             }
             enzymePassesTiming.stop();
@@ -828,8 +964,14 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
             outIRStream << *llvmModule;
         }
 
-        if (failed(timer::timer(compileObjectFile, "compileObjFile", /* add_endl */ true, options,
-                                llvmModule, targetMachine, options.getObjectFile()))) {
+        if (failed(profile(
+                "LLVM", "compileObjectFile",
+                [&] {
+                    return timer::timer(compileObjectFile, "compileObjFile", /* add_endl */ true,
+                                        options, llvmModule, targetMachine,
+                                        options.getObjectFile());
+                },
+                instructionCount))) {
             return failure();
         }
         outputTiming.stop();
@@ -912,6 +1054,45 @@ std::vector<Pipeline> parsePipelines(const cl::list<std::string> &catalystPipeli
     return allPipelines;
 }
 
+int QuantumDriverMainFromArgs(const std::string &source, const std::string &workspace,
+                              const std::string &moduleName, SaveTemps keepIntermediate,
+                              bool asyncQNodes, bool verbose, bool lowerToLLVM,
+                              const std::vector<Pipeline> &passPipelines,
+                              const std::string &checkpointStage, unsigned optLevel,
+                              bool profilePasses, CompilerOutput &output)
+{
+    DialectRegistry registry;
+    registerDriverPasses();
+    registerDriverDialects(registry);
+
+    // Intermediate textual IR is only written to disk when requested.
+    if (output.outputFilename.empty()) {
+        using path = std::filesystem::path;
+        output.outputFilename = path(workspace) / path(moduleName + ".ll");
+    }
+    llvm::raw_string_ostream errStream{output.diagnosticMessages};
+
+    CompilerOptions options{.source = source,
+                            .workspace = workspace,
+                            .moduleName = moduleName,
+                            .diagnosticStream = errStream,
+                            .keepIntermediate = keepIntermediate,
+                            .asyncQnodes = asyncQNodes,
+                            .verbosity = verbose ? Verbosity::All : Verbosity::Urgent,
+                            .pipelinesCfg = passPipelines,
+                            .checkpointStage = checkpointStage,
+                            .loweringAction = lowerToLLVM ? Action::All : Action::OPT,
+                            .dumpPassPipeline = false,
+                            .optLevel = optLevel,
+                            .profilePasses = profilePasses};
+
+    mlir::LogicalResult result = QuantumDriverMain(options, output, registry);
+
+    errStream.flush();
+
+    return mlir::failed(result) ? 1 : 0;
+}
+
 int QuantumDriverMainFromCL(int argc, char **argv)
 {
     // Command-line options
@@ -956,20 +1137,17 @@ int QuantumDriverMainFromCL(int argc, char **argv)
     cl::opt<bool> DumpPassPipeline("dump-catalyst-pipeline",
                                    cl::desc("Print the pipeline that will be run"), cl::init(false),
                                    cl::cat(CatalystCat));
+    cl::opt<unsigned> OptLevel("opt-level",
+                               cl::desc("Optimization level of the LLVM passes (0 to 3)"),
+                               cl::init(2), cl::cat(CatalystCat));
+    cl::opt<std::string> PassProfile(
+        "pass-profile", cl::desc("Write the time spent in each pass to a JSON file"),
+        cl::init(""), cl::cat(CatalystCat));
 
     // Create dialect registry
     DialectRegistry registry;
-    registerAllPasses();
-    registerAllCatalystPasses();
-    registerAllCatalystPipelines();
-    mhlo::registerAllMhloPasses();
-    registerAllCatalystDialects(registry);
-    registerLLVMTranslations(registry);
-
-    // Register bufferization interfaces
-    catalyst::registerBufferizableOpInterfaceExternalModels(registry);
-    catalyst::gradient::registerBufferizableOpInterfaceExternalModels(registry);
-    catalyst::quantum::registerBufferizableOpInterfaceExternalModels(registry);
+    registerDriverPasses();
+    registerDriverDialects(registry);
 
     // Register and parse command line options.
     std::string inputFilename, outputFilename;
@@ -983,6 +1161,11 @@ int QuantumDriverMainFromCL(int argc, char **argv)
     llvm::InitLLVM y(argc, argv);
     MlirOptMainConfig config = MlirOptMainConfig::createFromCLOptions();
 
+    if (OptLevel > 3) {
+        llvm::errs() << "Error: Invalid optimization level: " << OptLevel << "\n";
+        return 1;
+    }
+
     // Read the input IR file
     std::string source = readInputFile(inputFilename);
     if (source.empty()) {
@@ -1005,12 +1188,24 @@ int QuantumDriverMainFromCL(int argc, char **argv)
                             .pipelinesCfg = parsePipelines(CatalystPipeline),
                             .checkpointStage = CheckpointStage,
                             .loweringAction = LoweringAction,
-                            .dumpPassPipeline = DumpPassPipeline};
+                            .dumpPassPipeline = DumpPassPipeline,
+                            .optLevel = OptLevel,
+                            .profilePasses = !PassProfile.empty()};
 
     mlir::LogicalResult result = QuantumDriverMain(options, *output, registry);
 
     errStream.flush();
 
+    if (!PassProfile.empty()) {
+        std::error_code errCode;
+        llvm::raw_fd_ostream profileFile(PassProfile, errCode);
+        if (errCode) {
+            llvm::errs() << "Error: Unable to write pass profile: " << errCode.message() << "\n";
+            return 1;
+        }
+        profileFile << output->passProfile;
+    }
+
     if (mlir::failed(result)) {
         llvm::errs() << "Compilation failed:\n" << output->diagnosticMessages << "\n";
         return 1;
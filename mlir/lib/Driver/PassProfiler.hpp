@@ -0,0 +1,146 @@
+// Copyright 2025 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <chrono>
+#include <ctime>
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "llvm/ADT/StringRef.h"
+#include "llvm/Support/JSON.h"
+#include "llvm/Support/raw_ostream.h"
+
+namespace catalyst::utils {
+
+/**
+ * PassProfiler: A utility class to collect the time spent in each pass of the compiler, and the
+ * size of the program after it.
+ *
+ * Unlike the `Timer`, which prints the timings of the driver as they are measured, the profiler
+ * aggregates them into a report that is returned to the frontend in JSON format. Passes are
+ * identified by their stage (the pipeline they belong to) and an opaque key, e.g. the address of
+ * an MLIR pass, so that the runs of a nested pass over multiple functions are accumulated into a
+ * single entry. Measurements can be nested, in which case the time of the inner measurements is
+ * excluded from the self time of the outer one.
+ */
+class PassProfiler {
+  private:
+    struct Entry {
+        std::string stage;
+        std::string name;
+        size_t runs = 0;
+        // All times are in milliseconds.
+        double wallTime = 0;
+        double cpuTime = 0;
+        double selfTime = 0;
+        // Number of operations (MLIR) or instructions (LLVM IR) after the pass
+        int64_t size = 0;
+    };
+
+    struct Frame {
+        size_t entry;
+        std::chrono::steady_clock::time_point startWallTime;
+        std::clock_t startCpuTime;
+        double childTime = 0;
+    };
+
+    std::string moduleName;
+    std::string stage;
+    std::vector<Entry> entries;
+    std::map<std::pair<std::string, const void *>, size_t> index;
+    std::vector<Frame> frames;
+
+  public:
+    explicit PassProfiler(llvm::StringRef moduleName) : moduleName(moduleName.str()) {}
+
+    /// Set the stage of the passes measured from now on.
+    void setStage(llvm::StringRef stageName) { stage = stageName.str(); }
+
+    /// Start measuring a pass, identified by `key` in the current stage.
+    void start(const void *key, llvm::StringRef name)
+    {
+        auto [it, inserted] = index.try_emplace({stage, key}, entries.size());
+        if (inserted) {
+            entries.push_back(Entry{.stage = stage, .name = name.str()});
+        }
+        frames.push_back(Frame{.entry = it->second,
+                               .startWallTime = std::chrono::steady_clock::now(),
+                               .startCpuTime = std::clock()});
+    }
+
+    /// Stop measuring the innermost pass, with the size of the program after it.
+    void stop(int64_t size)
+    {
+        if (frames.empty()) {
+            return;
+        }
+        const std::clock_t stopCpuTime = std::clock();
+        const auto stopWallTime = std::chrono::steady_clock::now();
+
+        Frame frame = frames.back();
+        frames.pop_back();
+        const double wallTime =
+            std::chrono::duration<double, std::milli>(stopWallTime - frame.startWallTime).count();
+
+        Entry &entry = entries[frame.entry];
+        entry.runs++;
+        entry.wallTime += wallTime;
+        entry.cpuTime += 1000.0 * (stopCpuTime - frame.startCpuTime) / CLOCKS_PER_SEC;
+        entry.selfTime += wallTime - frame.childTime;
+        // Nested passes run on several operations, whose sizes add up.
+        entry.size = entry.runs == 1 ? size : entry.size + size;
+
+        if (!frames.empty()) {
+            frames.back().childTime += wallTime;
+        }
+    }
+
+    /// Measure a step of the driver outside of the pass managers, e.g. an LLVM pipeline. The
+    /// `size` callback is invoked on the result of the step.
+    template <typename Function, typename SizeFunction>
+    auto measure(llvm::StringRef name, Function func, SizeFunction size)
+    {
+        start(name.data(), name);
+        auto result = func();
+        stop(size(result));
+        return result;
+    }
+
+    /// Get the report in JSON format.
+    [[nodiscard]] std::string toJSON() const
+    {
+        llvm::json::Array passes;
+        for (const auto &entry : entries) {
+            passes.push_back(llvm::json::Object{{"stage", entry.stage},
+                                                {"name", entry.name},
+                                                {"runs", static_cast<int64_t>(entry.runs)},
+                                                {"walltime", entry.wallTime},
+                                                {"cputime", entry.cpuTime},
+                                                {"selftime", entry.selfTime},
+                                                {"size", entry.size}});
+        }
+
+        std::string json;
+        llvm::raw_string_ostream stream{json};
+        stream << llvm::json::Value(
+            llvm::json::Object{{"module", moduleName}, {"passes", std::move(passes)}});
+        return json;
+    }
+};
+
+} // namespace catalyst::utils
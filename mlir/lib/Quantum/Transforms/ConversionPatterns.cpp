@@ -273,6 +273,52 @@ struct NumQubitsOpPattern : public OpConversionPattern<NumQubitsOp> {
     }
 };
 
+struct PRNGKeyOpPattern : public OpConversionPattern<PRNGKeyOp> {
+    using OpConversionPattern::OpConversionPattern;
+
+    LogicalResult matchAndRewrite(PRNGKeyOp op, PRNGKeyOpAdaptor adaptor,
+                                  ConversionPatternRewriter &rewriter) const override
+    {
+        MLIRContext *ctx = this->getContext();
+
+        StringRef qirName = "__catalyst__rt__prng_key";
+
+        Type qirSignature = LLVM::LLVMFunctionType::get(IntegerType::get(ctx, 64), {});
+
+        LLVM::LLVMFuncOp fnDecl =
+            catalyst::ensureFunctionDeclaration(rewriter, op, qirName, qirSignature);
+
+        rewriter.replaceOpWithNewOp<LLVM::CallOp>(op, fnDecl, ValueRange{});
+
+        return success();
+    }
+};
+
+struct PRNGStreamOpPattern : public OpConversionPattern<PRNGStreamOp> {
+    using OpConversionPattern::OpConversionPattern;
+
+    LogicalResult matchAndRewrite(PRNGStreamOp op, PRNGStreamOpAdaptor adaptor,
+                                  ConversionPatternRewriter &rewriter) const override
+    {
+        MLIRContext *ctx = this->getContext();
+
+        StringRef qirName = "__catalyst__rt__prng_stream";
+
+        Type int64Type = IntegerType::get(ctx, 64);
+        Type qirSignature = LLVM::LLVMFunctionType::get(LLVM::LLVMVoidType::get(ctx),
+                                                        {/* key = */ int64Type,
+                                                         /* stream = */ int64Type});
+
+        LLVM::LLVMFuncOp fnDecl =
+            catalyst::ensureFunctionDeclaration(rewriter, op, qirName, qirSignature);
+
+        SmallVector<Value> operands = {adaptor.getKey(), adaptor.getStream()};
+        rewriter.replaceOpWithNewOp<LLVM::CallOp>(op, fnDecl, operands);
+
+        return success();
+    }
+};
+
 ///////////////////////
 // Memory Management //
 ///////////////////////
@@ -1025,6 +1071,8 @@ void populateQIRConversionPatterns(TypeConverter &typeConverter, RewritePatternS
     patterns.add<DeviceInitOpPattern>(typeConverter, patterns.getContext());
     patterns.add<DeviceReleaseOpPattern>(typeConverter, patterns.getContext());
     patterns.add<NumQubitsOpPattern>(typeConverter, patterns.getContext());
+    patterns.add<PRNGKeyOpPattern>(typeConverter, patterns.getContext());
+    patterns.add<PRNGStreamOpPattern>(typeConverter, patterns.getContext());
     patterns.add<AllocOpPattern>(typeConverter, patterns.getContext());
     patterns.add<DeallocOpPattern>(typeConverter, patterns.getContext());
     patterns.add<ExtractOpPattern>(typeConverter, patterns.getContext());
@@ -0,0 +1,102 @@
+// Copyright 2025 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <memory>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/optional.h>
+#include <nanobind/stl/pair.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/unique_ptr.h>
+#include <nanobind/stl/vector.h>
+
+#include "Driver/CompilerDriver.h"
+
+namespace nb = nanobind;
+
+using namespace catalyst::driver;
+
+using PipelineSpec = std::pair<std::string, std::vector<std::string>>;
+
+std::unique_ptr<CompilerOutput>
+runCompilerDriver(const nb::bytes &source, const std::string &workspace,
+                  const std::string &moduleName, int keepIntermediate, bool asyncQnodes,
+                  bool verbose, bool lowerToLLVM, const std::vector<PipelineSpec> &pipelines,
+                  const std::string &checkpointStage, unsigned optLevel, bool profilePasses)
+{
+    std::vector<Pipeline> passPipelines;
+    for (const auto &[name, passes] : pipelines) {
+        Pipeline pipeline;
+        pipeline.setName(name);
+        pipeline.setPasses(llvm::SmallVector<std::string>(passes.begin(), passes.end()));
+        passPipelines.push_back(std::move(pipeline));
+    }
+
+    SaveTemps saveTemps = keepIntermediate >= 2   ? SaveTemps::AfterPass
+                          : keepIntermediate == 1 ? SaveTemps::AfterPipeline
+                                                  : SaveTemps::None;
+
+    // The source is either MLIR bytecode or textual IR, which the driver tells apart.
+    std::string sourceStr(source.c_str(), source.size());
+
+    auto output = std::make_unique<CompilerOutput>();
+    int retval;
+    {
+        // Compilations do not share any state, other than the once-initialized pass registry.
+        nb::gil_scoped_release release;
+        retval = QuantumDriverMainFromArgs(sourceStr, workspace, moduleName, saveTemps, asyncQnodes,
+                                           verbose, lowerToLLVM, passPipelines, checkpointStage,
+                                           optLevel, profilePasses, *output);
+    }
+
+    if (retval != 0) {
+        throw std::runtime_error("Compilation failed:\n" + output->diagnosticMessages);
+    }
+    return output;
+}
+
+std::optional<std::string> getPipelineOutput(const CompilerOutput &output,
+                                             const std::string &name)
+{
+    auto it = output.pipelineOutputs.find(name);
+    if (it == output.pipelineOutputs.end()) {
+        return std::nullopt;
+    }
+    return it->second;
+}
+
+NB_MODULE(compiler_driver, m)
+{
+    m.doc() = "Catalyst compiler driver library";
+
+    nb::class_<CompilerOutput>(m, "CompilerOutput")
+        .def("get_pipeline_output", &getPipelineOutput, nb::arg("name"))
+        .def("get_output_ir", [](const CompilerOutput &output) { return output.outIR; })
+        .def("get_pass_profile", [](const CompilerOutput &output) { return output.passProfile; })
+        .def("get_diagnostic_messages",
+             [](const CompilerOutput &output) { return output.diagnosticMessages; });
+
+    m.def("run_compiler_driver", &runCompilerDriver,
+          "Compile the MLIR bytecode or textual IR of a module to an object file in the workspace.",
+          nb::arg("source"), nb::arg("workspace"), nb::arg("module_name"),
+          nb::arg("keep_intermediate") = 0, nb::arg("async_qnodes") = false,
+          nb::arg("verbose") = false, nb::arg("lower_to_llvm") = true,
+          nb::arg("pipelines") = std::vector<PipelineSpec>(), nb::arg("checkpoint_stage") = "",
+          nb::arg("opt_level") = 2, nb::arg("profile_passes") = false);
+}
@@ -108,6 +108,20 @@ func.func @num_qubits() {
 
 // -----
 
+// CHECK-DAG: llvm.func @__catalyst__rt__prng_key() -> i64
+// CHECK-DAG: llvm.func @__catalyst__rt__prng_stream(i64, i64)
+
+// CHECK-LABEL: @prng_stream
+func.func @prng_stream(%stream : i64) {
+    // CHECK: [[key:%.+]] = llvm.call @__catalyst__rt__prng_key() : () -> i64
+    %key = quantum.prng_key : i64
+    // CHECK: llvm.call @__catalyst__rt__prng_stream([[key]], %arg0) : (i64, i64) -> ()
+    quantum.prng_stream %key, %stream
+    return
+}
+
+// -----
+
 ///////////////////////
 // Memory Management //
 ///////////////////////
@@ -0,0 +1,33 @@
+// Copyright 2025 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// RUN: catalyst --tool=opt %s --catalyst-pipeline="pipe1(canonicalize;func.func(cse))" --pass-profile=%t.json -o %t.mlir
+// RUN: FileCheck %s < %t.json
+
+func.func @foo(%arg0: f64) -> f64 {
+    %0 = arith.addf %arg0, %arg0 : f64
+    %1 = arith.addf %arg0, %arg0 : f64
+    %2 = arith.mulf %0, %1 : f64
+    return %2 : f64
+}
+
+// CHECK: "module":"catalyst_module"
+// CHECK-SAME: "passes":[
+// CHECK-SAME: "name":"parseMLIRSource"
+// CHECK-SAME: "stage":"Parser"
+// CHECK-SAME: "name":"Canonicalizer"
+// CHECK-SAME: "runs":1
+// CHECK-SAME: "stage":"pipe1"
+// CHECK-SAME: "name":"CSE"
+// CHECK-SAME: "stage":"pipe1"
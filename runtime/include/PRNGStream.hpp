@@ -0,0 +1,199 @@
+// Copyright 2025 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+
+namespace Catalyst::Runtime {
+
+/**
+ * A counter-based random number stream implementing the Philox4x32-10 generator of
+ * Salmon et al., "Parallel Random Numbers: As Easy as 1, 2, 3" (SC'11).
+ *
+ * Each number of the stream is a function of a 64-bit key, a 64-bit stream index and its
+ * position in the stream. Streams with the same key and different indices are independent,
+ * and can therefore be assigned to threads, batch elements or blocks of shots to generate
+ * reproducible results regardless of how the work is scheduled. Unlike a Mersenne Twister,
+ * creating a stream and jumping ahead in it (`discard`) take constant time, and the state of
+ * a stream fits in a few words.
+ *
+ * The class satisfies the requirements of a uniform random bit generator, so that it can be
+ * used with the distributions of the standard library.
+ */
+class PRNGStream final {
+  public:
+    using result_type = uint32_t;
+
+  private:
+    static constexpr size_t block_size = 4;
+    static constexpr size_t rounds = 10;
+
+    uint64_t key;
+    uint64_t stream;
+    // Index of the next block to generate
+    uint64_t counter{0};
+    // Last generated block, of which the first `index` numbers have been consumed
+    std::array<uint32_t, block_size> block{};
+    size_t index{block_size};
+
+    void nextBlock()
+    {
+        block = generateBlock(key, stream, counter++);
+        index = 0;
+    }
+
+  public:
+    explicit PRNGStream(uint64_t key, uint64_t stream = 0) : key(key), stream(stream) {}
+
+    /**
+     * @brief Compute the block of numbers at the given position of a stream, i.e. the
+     * Philox4x32-10 function of a 128-bit counter made of the block index and the stream index.
+     */
+    static auto generateBlock(uint64_t key, uint64_t stream, uint64_t counter)
+        -> std::array<uint32_t, block_size>
+    {
+        constexpr uint64_t M0 = 0xD2511F53;
+        constexpr uint64_t M1 = 0xCD9E8D57;
+        constexpr uint32_t W0 = 0x9E3779B9;
+        constexpr uint32_t W1 = 0xBB67AE85;
+
+        std::array<uint32_t, block_size> ctr{
+            static_cast<uint32_t>(counter), static_cast<uint32_t>(counter >> 32),
+            static_cast<uint32_t>(stream), static_cast<uint32_t>(stream >> 32)};
+        uint32_t k0 = static_cast<uint32_t>(key);
+        uint32_t k1 = static_cast<uint32_t>(key >> 32);
+
+        for (size_t round = 0; round < rounds; round++) {
+            const uint64_t p0 = M0 * ctr[0];
+            const uint64_t p1 = M1 * ctr[2];
+            ctr = {static_cast<uint32_t>(p1 >> 32) ^ ctr[1] ^ k0, static_cast<uint32_t>(p1),
+                   static_cast<uint32_t>(p0 >> 32) ^ ctr[3] ^ k1, static_cast<uint32_t>(p0)};
+            k0 += W0;
+            k1 += W1;
+        }
+        return ctr;
+    }
+
+    static constexpr auto min() -> result_type { return std::numeric_limits<result_type>::min(); }
+    static constexpr auto max() -> result_type { return std::numeric_limits<result_type>::max(); }
+
+    [[nodiscard]] auto getKey() const -> uint64_t { return key; }
+    [[nodiscard]] auto getStream() const -> uint64_t { return stream; }
+
+    /**
+     * @brief Get the stream with the given index and the same key, starting at its beginning.
+     */
+    [[nodiscard]] auto substream(uint64_t index) const -> PRNGStream
+    {
+        return PRNGStream(key, index);
+    }
+
+    auto operator()() -> result_type
+    {
+        if (index == block_size) {
+            nextBlock();
+        }
+        return block[index++];
+    }
+
+    /**
+     * @brief Advance the stream by `n` numbers in constant time, e.g. to the first number of a
+     * block of shots.
+     */
+    void discard(uint64_t n)
+    {
+        const uint64_t buffered = block_size - index;
+        if (n <= buffered) {
+            index += n;
+            return;
+        }
+
+        n -= buffered;
+        counter += n / block_size;
+        index = block_size;
+        if (n % block_size != 0) {
+            nextBlock();
+            index = n % block_size;
+        }
+    }
+
+    /**
+     * @brief Fill a buffer with the next `n` numbers of the stream.
+     *
+     * The buffer receives the same numbers as `n` successive calls, and whole blocks are
+     * written in place.
+     */
+    void fill(result_type *out, size_t n)
+    {
+        while (n > 0 && index < block_size) {
+            *out++ = block[index++];
+            n--;
+        }
+        for (; n >= block_size; n -= block_size, out += block_size) {
+            const auto next = generateBlock(key, stream, counter++);
+            for (size_t i = 0; i < block_size; i++) {
+                out[i] = next[i];
+            }
+        }
+        for (; n > 0; n--) {
+            *out++ = (*this)();
+        }
+    }
+
+    /**
+     * @brief Fill a buffer with `n` uniformly distributed doubles in [0, 1), each built from 53
+     * random bits of two successive numbers of the stream.
+     */
+    void fillUniform(double *out, size_t n)
+    {
+        constexpr double scale = 1.0 / static_cast<double>(uint64_t{1} << 53);
+        auto toUniform = [scale](uint64_t hi, uint64_t lo) {
+            return static_cast<double>(((hi >> 5) << 26) | (lo >> 6)) * scale;
+        };
+
+        // Pairs of numbers are aligned on blocks, as in the loop over whole blocks below.
+        for (; n > 0 && index < block_size; n--) {
+            const uint64_t hi = (*this)();
+            *out++ = toUniform(hi, (*this)());
+        }
+        for (; n >= block_size / 2; n -= block_size / 2) {
+            const auto next = generateBlock(key, stream, counter++);
+            *out++ = toUniform(next[0], next[1]);
+            *out++ = toUniform(next[2], next[3]);
+        }
+        for (; n > 0; n--) {
+            const uint64_t hi = (*this)();
+            *out++ = toUniform(hi, (*this)());
+        }
+    }
+
+    /**
+     * @brief Fill a range with the next numbers of the stream.
+     *
+     * This makes the stream usable as the seed sequence of a standard engine, e.g. to seed the
+     * whole state of a Mersenne Twister in the time of a few hundred blocks.
+     */
+    template <typename Iterator> void generate(Iterator begin, Iterator end)
+    {
+        for (; begin != end; ++begin) {
+            *begin = (*this)();
+        }
+    }
+};
+
+} // namespace Catalyst::Runtime
@@ -183,7 +183,10 @@ struct QuantumDevice {
      * of a device provided with the same PRNG instance do not produce identical results when run
      * in succession.
      * Note that the provided PRNG instance is not thread-locked, and devices wishing to use it
-     * across internal threads will need to provide their own thread-safety.
+     * across internal threads will need to provide their own thread-safety. Alternatively,
+     * such devices can draw a key from the provided instance and derive an independent
+     * `PRNGStream` for each thread or block of shots, which keeps the results reproducible
+     * regardless of the scheduling of the threads.
      *
      * @param gen Pointer to a Catalyst-managed Mersenne Twister instance.
      */
@@ -28,6 +28,8 @@ void __catalyst__rt__initialize(uint32_t *);
 void __catalyst__rt__device_init(int8_t *, int8_t *, int8_t *, int64_t, bool);
 void __catalyst__rt__device_release();
 void __catalyst__rt__finalize();
+int64_t __catalyst__rt__prng_key();
+void __catalyst__rt__prng_stream(int64_t, int64_t);
 void __catalyst__rt__toggle_recorder(bool);
 void __catalyst__rt__print_state();
 void __catalyst__rt__print_tensor(OpaqueMemRefT *, bool);
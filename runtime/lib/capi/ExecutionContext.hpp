@@ -20,14 +20,16 @@
 #include <functional>
 #include <memory>
 #include <mutex>
+#include <optional>
 #include <random>
 #include <string>
 #include <string_view>
+#include <thread>
 #include <tuple>
 #include <unordered_map>
-#include <unordered_set>
 
 #include "Exception.hpp"
+#include "PRNGStream.hpp"
 #include "QuantumDevice.hpp"
 #include "Types.h"
 
@@ -39,7 +41,8 @@ class MemoryManager // NOLINT(cppcoreguidelines-special-member-functions,
                     // hicpp-special-member-functions)
     final {
   private:
-    std::unordered_set<void *> _impl;
+    // Allocations and the threads which made them
+    std::unordered_map<void *, std::thread::id> _impl;
     std::mutex mu; // To guard the memory manager
 
   public:
@@ -49,7 +52,7 @@ class MemoryManager // NOLINT(cppcoreguidelines-special-member-functions,
     {
         // Lock the mutex to protect _impl free
         std::lock_guard<std::mutex> lock(mu);
-        for (auto *allocation : _impl) {
+        for (auto &[allocation, _] : _impl) {
             free(allocation); // NOLINT(cppcoreguidelines-no-malloc, hicpp-no-malloc)
         }
     }
@@ -58,7 +61,7 @@ class MemoryManager // NOLINT(cppcoreguidelines-special-member-functions,
     {
         // Lock the mutex to protect _impl update
         std::lock_guard<std::mutex> lock(mu);
-        _impl.insert(ptr);
+        _impl.emplace(ptr, std::this_thread::get_id());
     }
     void erase(void *ptr)
     {
@@ -72,6 +75,23 @@ class MemoryManager // NOLINT(cppcoreguidelines-special-member-functions,
         std::lock_guard<std::mutex> lock(mu);
         return _impl.contains(ptr);
     }
+
+    /**
+     * @brief Free the allocations made by the calling thread, leaving those of
+     * concurrent executions on other threads untouched.
+     */
+    void releaseThreadAllocations()
+    {
+        // Lock the mutex to protect _impl update
+        std::lock_guard<std::mutex> lock(mu);
+        std::erase_if(_impl, [id = std::this_thread::get_id()](const auto &entry) {
+            if (entry.second != id) {
+                return false;
+            }
+            free(entry.first); // NOLINT(cppcoreguidelines-no-malloc, hicpp-no-malloc)
+            return true;
+        });
+    }
 };
 
 class SharedLibraryManager final {
@@ -282,23 +302,24 @@ class ExecutionContext final {
     std::vector<std::shared_ptr<RTDevice>> device_pool;
     std::mutex pool_mu; // To protect device_pool
 
-    bool initial_tape_recorder_status{false};
+    // Tape recorder status, which is per thread as it is toggled by the executing program
+    inline static thread_local bool initial_tape_recorder_status{false};
 
     // ExecutionContext pointers
     std::unique_ptr<MemoryManager> memory_man_ptr{nullptr};
 
-    // PRNG
-    uint32_t *seed;
-    std::mt19937 gen;
+    // PRNG, which is per thread so that concurrent executions do not share a generator
+    inline static thread_local bool seeded{false};
+    inline static thread_local std::mt19937 gen;
+    // Counter-based stream of the calling thread, created on first use for unseeded executions
+    inline static thread_local std::optional<PRNGStream> stream;
 
   public:
-    explicit ExecutionContext(uint32_t *seed = nullptr) : seed(seed)
+    explicit ExecutionContext(uint32_t *seed = nullptr)
     {
         memory_man_ptr = std::make_unique<MemoryManager>();
-
-        if (this->seed != nullptr) {
-            this->gen = std::mt19937(*seed);
-        }
+        initial_tape_recorder_status = false;
+        reseed(seed);
     }
 
     ~ExecutionContext() = default;
@@ -307,9 +328,12 @@ class ExecutionContext final {
     ExecutionContext(ExecutionContext &&other) = delete;
     ExecutionContext &operator=(ExecutionContext &&other) = delete;
 
-    void setDeviceRecorderStatus(bool status) noexcept { initial_tape_recorder_status = status; }
+    static void setDeviceRecorderStatus(bool status) noexcept
+    {
+        initial_tape_recorder_status = status;
+    }
 
-    [[nodiscard]] auto getDeviceRecorderStatus() const -> bool
+    [[nodiscard]] static auto getDeviceRecorderStatus() -> bool
     {
         return initial_tape_recorder_status;
     }
@@ -321,7 +345,7 @@ class ExecutionContext final {
 
     [[nodiscard]] auto getOrCreateDevice(std::string_view rtd_lib, std::string_view rtd_name,
                                          std::string_view rtd_kwargs, bool auto_qubit_management)
-        -> const std::shared_ptr<RTDevice> &
+        -> std::shared_ptr<RTDevice>
     {
         std::lock_guard<std::mutex> lock(pool_mu);
 
@@ -333,6 +357,8 @@ class ExecutionContext final {
             if (device_pool[i]->getDeviceStatus() == RTDeviceStatus::Inactive &&
                 *device_pool[i] == *device) {
                 device_pool[i]->setDeviceStatus(RTDeviceStatus::Active);
+                // The device may have been used by another thread, or with another seed.
+                device_pool[i]->getQuantumDevicePtr()->SetDevicePRNG(seeded ? &gen : nullptr);
                 return device_pool[i];
             }
         }
@@ -341,27 +367,22 @@ class ExecutionContext final {
 
         // Add a new device
         device->setDeviceStatus(RTDeviceStatus::Active);
-        if (this->seed != nullptr) {
-            device->getQuantumDevicePtr()->SetDevicePRNG(&(this->gen));
-        }
-        else {
-            device->getQuantumDevicePtr()->SetDevicePRNG(nullptr);
-        }
+        device->getQuantumDevicePtr()->SetDevicePRNG(seeded ? &gen : nullptr);
         device_pool.push_back(device);
 
-        return device_pool[key];
+        return device;
     }
 
     [[nodiscard]] auto
     getOrCreateDevice(const std::string &rtd_lib, const std::string &rtd_name = {},
                       const std::string &rtd_kwargs = {}, bool auto_qubit_management = false)
-        -> const std::shared_ptr<RTDevice> &
+        -> std::shared_ptr<RTDevice>
     {
         return getOrCreateDevice(std::string_view{rtd_lib}, std::string_view{rtd_name},
                                  std::string_view{rtd_kwargs}, auto_qubit_management);
     }
 
-    [[nodiscard]] auto getDevice(size_t device_key) -> const std::shared_ptr<RTDevice> &
+    [[nodiscard]] auto getDevice(size_t device_key) -> std::shared_ptr<RTDevice>
     {
         std::lock_guard<std::mutex> lock(pool_mu);
         RT_FAIL_IF(device_key >= device_pool.size(), "Invalid device_key");
@@ -373,5 +394,96 @@ class ExecutionContext final {
         std::lock_guard<std::mutex> lock(pool_mu);
         RTD_PTR->setDeviceStatus(RTDeviceStatus::Inactive);
     }
+
+    /**
+     * @brief Reseed the PRNG of the calling thread for a new execution.
+     *
+     * Devices pick up the generator of the thread which activates them.
+     *
+     * @param seed The new seed, or `nullptr` to disable seeding.
+     */
+    static void reseed(uint32_t *seed)
+    {
+        seeded = seed != nullptr;
+        if (seeded) {
+            gen = std::mt19937(*seed);
+            stream.emplace(*seed);
+        }
+        else {
+            stream.reset();
+        }
+    }
+
+    /**
+     * @brief Draw a key from the PRNG of the calling thread, from which independent random
+     * number streams can be derived with `selectPRNGStream`.
+     *
+     * The key is reproducible for seeded executions, and nondeterministic otherwise.
+     */
+    static auto getPRNGKey() -> uint64_t
+    {
+        if (!seeded) {
+            std::random_device rd;
+            return (static_cast<uint64_t>(rd()) << 32) | rd();
+        }
+        return (static_cast<uint64_t>(gen()) << 32) | gen();
+    }
+
+    /**
+     * @brief Select the counter-based stream of the calling thread from a key and a stream
+     * index, e.g. the index of a shot executed by a parallel loop, and seed the state of the
+     * PRNG of the devices with its first numbers.
+     *
+     * The stream only depends on the key and the index, so that the results of a seeded
+     * execution do not depend on the thread which executes each iteration.
+     *
+     * @param key The key obtained by `getPRNGKey`.
+     * @param index The index of the stream.
+     */
+    static void selectPRNGStream(uint64_t key, uint64_t index)
+    {
+        gen.seed(stream.emplace(key, index));
+        seeded = true;
+    }
+
+    /**
+     * @brief Get the counter-based stream of the calling thread, from which independent
+     * substreams can be derived for bulk generation of random numbers, e.g. one per block of
+     * shots sampled in parallel.
+     *
+     * The stream is reproducible for seeded executions, and nondeterministic otherwise.
+     */
+    static auto getPRNGStream() -> PRNGStream &
+    {
+        if (!stream) {
+            std::random_device rd;
+            stream.emplace((static_cast<uint64_t>(rd()) << 32) | rd());
+        }
+        return *stream;
+    }
+
+    /**
+     * @brief Reset the state of an execution on the calling thread, so that the context can
+     * be reused by the next execution.
+     *
+     * Memory allocations of the calling thread that were not transferred to the caller are
+     * freed, and its tape recorder is turned off. A device that was left active, e.g. by an
+     * execution that failed, is removed from the pool. Inactive devices, together with their
+     * loaded backend libraries, are kept for reuse.
+     *
+     * @param active_device The device still active on the calling thread, if any.
+     */
+    void reset(RTDevice *active_device)
+    {
+        memory_man_ptr->releaseThreadAllocations();
+        initial_tape_recorder_status = false;
+
+        if (active_device != nullptr) {
+            std::lock_guard<std::mutex> lock(pool_mu);
+            std::erase_if(device_pool, [active_device](const std::shared_ptr<RTDevice> &device) {
+                return device.get() == active_device;
+            });
+        }
+    }
 };
 } // namespace Catalyst::Runtime
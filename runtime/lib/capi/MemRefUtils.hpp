@@ -18,6 +18,9 @@
 
 #include "mlir/ExecutionEngine/RunnerUtils.h"
 
+// Alignment in bytes of the buffers allocated by compiled programs.
+constexpr size_t MEMREF_BUFFER_ALIGNMENT = 64;
+
 extern "C" {
 void *_mlir_memref_to_llvm_alloc(size_t size);
 void *_mlir_memref_to_llvm_aligned_alloc(size_t alignment, size_t size);
@@ -12,11 +12,13 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+#include <algorithm>
 #include <bitset>
 #include <cstdarg>
 #include <cstdlib>
 #include <ctime>
 #include <memory>
+#include <mutex>
 #include <ostream>
 #include <stdexcept>
 #include <string_view>
@@ -42,6 +44,19 @@ static constexpr RESULT GLOBAL_RESULT_FALSE_CONST{false};
  */
 static std::unique_ptr<ExecutionContext> CTX = nullptr;
 
+/**
+ * @brief Number of `__catalyst__rt__initialize` calls not yet matched by a
+ * `__catalyst__rt__finalize` call. The global context is only destroyed once
+ * this drops to zero, which allows a persistent session to keep the context and
+ * its devices alive across executions.
+ */
+static size_t CTX_REFCOUNT = 0;
+
+/**
+ * @brief Mutex guarding the creation and destruction of the global context.
+ */
+static std::mutex CTX_MU;
+
 /**
  * @brief Thread local device pointer with internal linkage.
  */
@@ -78,7 +93,7 @@ std::vector<bool> getModifiersControlledValues(const Modifiers *modifiers)
 [[nodiscard]] bool initRTDevicePtr(std::string_view rtd_lib, std::string_view rtd_name,
                                    std::string_view rtd_kwargs, bool auto_qubit_management)
 {
-    auto &&device = CTX->getOrCreateDevice(rtd_lib, rtd_name, rtd_kwargs, auto_qubit_management);
+    auto device = CTX->getOrCreateDevice(rtd_lib, rtd_name, rtd_kwargs, auto_qubit_management);
     if (device) {
         RTD_PTR = device.get();
         return RTD_PTR ? true : false;
@@ -167,7 +182,12 @@ void __catalyst__host__rt__unrecoverable_error()
 
 void *_mlir_memref_to_llvm_alloc(size_t size)
 {
-    void *ptr = malloc(size);
+    // Buffers are aligned for SIMD loads, and such that buffers returned to Python can be wrapped
+    // by JAX arrays without a copy, which JAX only does for sufficiently aligned memory.
+    size_t alignedSize = std::max<size_t>(
+        (size + MEMREF_BUFFER_ALIGNMENT - 1) / MEMREF_BUFFER_ALIGNMENT * MEMREF_BUFFER_ALIGNMENT,
+        MEMREF_BUFFER_ALIGNMENT);
+    void *ptr = aligned_alloc(MEMREF_BUFFER_ALIGNMENT, alignedSize);
     CTX->getMemoryManager()->insert(ptr);
     return ptr;
 }
@@ -246,12 +266,38 @@ void __catalyst__rt__print_tensor(OpaqueMemRefT *c_memref, bool printDescriptor)
 
 void __catalyst__rt__fail_cstr(const char *cstr) { RT_FAIL(cstr); }
 
-void __catalyst__rt__initialize(uint32_t *seed) { CTX = std::make_unique<ExecutionContext>(seed); }
+void __catalyst__rt__initialize(uint32_t *seed)
+{
+    std::lock_guard<std::mutex> lock(CTX_MU);
+    if (CTX_REFCOUNT++ == 0) {
+        CTX = std::make_unique<ExecutionContext>(seed);
+    }
+    else {
+        ExecutionContext::reseed(seed);
+    }
+}
 
 void __catalyst__rt__finalize()
 {
+    std::lock_guard<std::mutex> lock(CTX_MU);
+    if (CTX_REFCOUNT == 0 || --CTX_REFCOUNT == 0) {
+        CTX.reset(nullptr);
+    }
+    else {
+        CTX->reset(RTD_PTR);
+    }
     RTD_PTR = nullptr;
-    CTX.reset(nullptr);
+}
+
+int64_t __catalyst__rt__prng_key()
+{
+    RT_FAIL_IF(!CTX, "Invalid use of the global driver before initialization");
+    return static_cast<int64_t>(ExecutionContext::getPRNGKey());
+}
+
+void __catalyst__rt__prng_stream(int64_t key, int64_t stream)
+{
+    ExecutionContext::selectPRNGStream(static_cast<uint64_t>(key), static_cast<uint64_t>(stream));
 }
 
 static int __catalyst__rt__device_init__impl(int8_t *rtd_lib, int8_t *rtd_name, int8_t *rtd_kwargs,
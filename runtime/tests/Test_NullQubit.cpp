@@ -16,9 +16,14 @@
 #include <catch2/catch_approx.hpp>
 #include <catch2/catch_test_macros.hpp>
 #include <catch2/matchers/catch_matchers_string.hpp>
+#include <cstdint>
 #include <cstdio>
+#include <cstdlib>
+#include <thread>
+#include <vector>
 
 #include "ExecutionContext.hpp"
+#include "MemRefUtils.hpp"
 #include "QuantumDevice.hpp"
 #include "QubitManager.hpp"
 #include "RuntimeCAPI.h"
@@ -52,6 +57,26 @@ TEST_CASE("Test __catalyst__rt__device_init registering device=null.qubit", "[Nu
     __catalyst__rt__finalize();
 }
 
+TEST_CASE("Test alignment of buffers allocated by compiled programs", "[NullQubit]")
+{
+    __catalyst__rt__initialize(nullptr);
+
+    for (size_t size : {0, 1, 24, 64, 1000}) {
+        void *ptr = _mlir_memref_to_llvm_alloc(size);
+        CHECK(ptr != nullptr);
+        CHECK(reinterpret_cast<uintptr_t>(ptr) % MEMREF_BUFFER_ALIGNMENT == 0);
+        _mlir_memref_to_llvm_free(ptr);
+    }
+
+    // Buffers transferred to the caller are no longer owned by the runtime.
+    void *ptr = _mlir_memref_to_llvm_alloc(100);
+    CHECK(_mlir_memory_transfer(ptr));
+    CHECK(!_mlir_memory_transfer(ptr));
+    free(ptr);
+
+    __catalyst__rt__finalize();
+}
+
 TEST_CASE("Test runtime device kwargs parsing", "[NullQubit]")
 {
     std::unique_ptr<NullQubit> sim0 = std::make_unique<NullQubit>("{foo : bar}");
@@ -752,3 +777,150 @@ TEST_CASE("Test NullQubit device resource tracking", "[NullQubit]")
     CHECK(sim->ResourcesGetNumGates() == 0);
     CHECK(sim->ResourcesGetNumQubits() == 0);
 }
+
+TEST_CASE("Test nested __catalyst__rt__initialize reuses the execution context", "[NullQubit]")
+{
+    char rtd_name[11] = "null.qubit";
+
+    // Hold the context open, as a persistent session does.
+    __catalyst__rt__initialize(nullptr);
+
+    uint32_t seed = 37;
+    for (size_t i = 0; i < 3; i++) {
+        __catalyst__rt__initialize(i % 2 ? &seed : nullptr);
+        __catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false);
+        QUBIT *q = __catalyst__rt__qubit_allocate();
+        __catalyst__rt__qubit_release(q);
+        __catalyst__rt__device_release();
+        __catalyst__rt__finalize();
+    }
+
+    // An execution which did not release its device leaves the context reusable.
+    __catalyst__rt__initialize(nullptr);
+    __catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false);
+    __catalyst__rt__finalize();
+
+    __catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false);
+    __catalyst__rt__device_release();
+
+    __catalyst__rt__finalize();
+
+    REQUIRE_THROWS_WITH(__catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false),
+                        ContainsSubstring("before initialization"));
+}
+
+TEST_CASE("Test concurrent executions sharing the execution context", "[NullQubit]")
+{
+    char rtd_name[11] = "null.qubit";
+
+    __catalyst__rt__initialize(nullptr);
+
+    std::vector<std::thread> workers;
+    for (size_t t = 0; t < 4; t++) {
+        workers.emplace_back([&rtd_name]() {
+            for (size_t i = 0; i < 16; i++) {
+                __catalyst__rt__initialize(nullptr);
+                __catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false);
+                QirArray *qs = __catalyst__rt__qubit_allocate_array(2);
+                __catalyst__rt__qubit_release_array(qs);
+                __catalyst__rt__device_release();
+                __catalyst__rt__finalize();
+            }
+        });
+    }
+    for (auto &worker : workers) {
+        worker.join();
+    }
+
+    __catalyst__rt__finalize();
+}
+
+TEST_CASE("Test concurrent executions creating and destroying the execution context",
+          "[NullQubit]")
+{
+    char rtd_name[11] = "null.qubit";
+
+    std::vector<std::thread> workers;
+    std::vector<size_t> transferred(8, 0);
+    for (size_t t = 0; t < transferred.size(); t++) {
+        workers.emplace_back([&rtd_name, &transferred, t]() {
+            for (size_t i = 0; i < 64; i++) {
+                __catalyst__rt__initialize(nullptr);
+                __catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false);
+                __catalyst__rt__toggle_recorder(i % 2);
+                QirArray *qs = __catalyst__rt__qubit_allocate_array(2);
+                QUBIT **q0 = (QUBIT **)__catalyst__rt__array_get_element_ptr_1d(qs, 0);
+                QUBIT **q1 = (QUBIT **)__catalyst__rt__array_get_element_ptr_1d(qs, 1);
+                __catalyst__qis__Hadamard(*q0, nullptr);
+                __catalyst__qis__CNOT(*q0, *q1, nullptr);
+                __catalyst__rt__toggle_recorder(false);
+
+                // A result handed over to the caller, and a temporary freed by the finalization.
+                void *result = _mlir_memref_to_llvm_alloc(64);
+                _mlir_memref_to_llvm_alloc(64);
+                transferred[t] += _mlir_memory_transfer(result);
+
+                __catalyst__rt__qubit_release_array(qs);
+                __catalyst__rt__device_release();
+                __catalyst__rt__finalize();
+                free(result);
+            }
+        });
+    }
+    for (auto &worker : workers) {
+        worker.join();
+    }
+
+    CHECK(transferred == std::vector<size_t>(transferred.size(), 64));
+    REQUIRE_THROWS_WITH(__catalyst__rt__device_init((int8_t *)rtd_name, nullptr, nullptr, 0, false),
+                        ContainsSubstring("before initialization"));
+}
+
+TEST_CASE("Test PRNG streams derived from the seed of an execution", "[NullQubit]")
+{
+    uint32_t seed = 37;
+
+    __catalyst__rt__initialize(&seed);
+    const int64_t key = __catalyst__rt__prng_key();
+    __catalyst__rt__finalize();
+
+    // The key is reproducible with the same seed.
+    __catalyst__rt__initialize(&seed);
+    CHECK(__catalyst__rt__prng_key() == key);
+    __catalyst__rt__finalize();
+
+    auto draw = [key](int64_t stream) {
+        __catalyst__rt__prng_stream(key, stream);
+        return ExecutionContext::getPRNGKey();
+    };
+
+    // Streams do not depend on the thread which selects them.
+    std::vector<uint64_t> expected{draw(0), draw(1), draw(2), draw(3)};
+    CHECK(expected[0] != expected[1]);
+
+    std::vector<uint64_t> results(expected.size());
+    std::vector<std::thread> workers;
+    for (size_t i = 0; i < expected.size(); i++) {
+        workers.emplace_back([&draw, &results, i]() { results[i] = draw(i); });
+    }
+    for (auto &worker : workers) {
+        worker.join();
+    }
+    CHECK(results == expected);
+
+    // The selected stream is also the source of bulk random numbers of the thread.
+    auto fill = [key](int64_t stream) {
+        __catalyst__rt__prng_stream(key, stream);
+        PRNGStream &selected = ExecutionContext::getPRNGStream();
+        CHECK(selected.getStream() == static_cast<uint64_t>(stream));
+        std::vector<double> numbers(16);
+        selected.fillUniform(numbers.data(), numbers.size());
+        return numbers;
+    };
+    CHECK(fill(5) == fill(5));
+    CHECK(fill(5) != fill(6));
+
+    __catalyst__rt__initialize(&seed);
+    CHECK(ExecutionContext::getPRNGStream().getKey() == seed);
+    __catalyst__rt__finalize();
+}
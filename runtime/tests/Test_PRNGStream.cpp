@@ -0,0 +1,123 @@
+// Copyright 2025 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <array>
+#include <cstdint>
+#include <random>
+#include <vector>
+
+#include <catch2/catch_test_macros.hpp>
+
+#include "PRNGStream.hpp"
+
+using namespace Catalyst::Runtime;
+
+TEST_CASE("Test the known answers of Philox4x32-10", "[PRNGStream]")
+{
+    // Known answer tests of the Random123 library
+    using Block = std::array<uint32_t, 4>;
+
+    CHECK(PRNGStream::generateBlock(0, 0, 0) ==
+          Block{0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8});
+    CHECK(PRNGStream::generateBlock(UINT64_MAX, UINT64_MAX, UINT64_MAX) ==
+          Block{0x408f276d, 0x41c83b0e, 0xa20bc7c6, 0x6d5451fd});
+    CHECK(PRNGStream::generateBlock(0x299f31d0a4093822, 0x0370734413198a2e, 0x85a308d3243f6a88) ==
+          Block{0xd16cfe09, 0x94fdcceb, 0x5001e420, 0x24126ea1});
+
+    // Streams enumerate the blocks of their counter.
+    PRNGStream gen(0x299f31d0a4093822, 0x0370734413198a2e);
+    gen.discard(4 * 3 + 1);
+    const Block block = PRNGStream::generateBlock(0x299f31d0a4093822, 0x0370734413198a2e, 3);
+    CHECK(gen() == block[1]);
+    CHECK(gen() == block[2]);
+}
+
+TEST_CASE("Test jumping ahead in a PRNG stream", "[PRNGStream]")
+{
+    PRNGStream reference(37, 1);
+    std::vector<uint32_t> expected(64);
+    for (auto &number : expected) {
+        number = reference();
+    }
+
+    for (uint64_t start = 0; start < 8; start++) {
+        for (uint64_t offset = 0; offset < 16; offset++) {
+            PRNGStream gen(37, 1);
+            gen.discard(start);
+            gen.discard(offset);
+            CHECK(gen() == expected[start + offset]);
+        }
+    }
+}
+
+TEST_CASE("Test bulk generation from a PRNG stream", "[PRNGStream]")
+{
+    PRNGStream reference(37);
+    std::vector<uint32_t> expected(64);
+    for (auto &number : expected) {
+        number = reference();
+    }
+
+    // Bulk generation is consistent with single draws, whatever the position in a block.
+    for (size_t start = 0; start < 8; start++) {
+        PRNGStream gen(37);
+        gen.discard(start);
+        std::vector<uint32_t> numbers(expected.size() - start - 3);
+        gen.fill(numbers.data(), numbers.size());
+        CHECK(numbers == std::vector<uint32_t>(expected.begin() + start, expected.end() - 3));
+        CHECK(gen() == expected[expected.size() - 3]);
+    }
+
+    // Uniform numbers are consistent with single draws as well.
+    for (size_t start = 0; start < 4; start++) {
+        PRNGStream gen(37);
+        gen.discard(start);
+        std::vector<double> numbers(8);
+        gen.fillUniform(numbers.data(), numbers.size());
+        for (size_t i = 0; i < numbers.size(); i++) {
+            const uint64_t bits = (static_cast<uint64_t>(expected[start + 2 * i] >> 5) << 26) |
+                                  (expected[start + 2 * i + 1] >> 6);
+            CHECK(numbers[i] == static_cast<double>(bits) / static_cast<double>(uint64_t{1} << 53));
+        }
+    }
+
+    std::vector<double> uniform(1000);
+    PRNGStream gen(37);
+    gen.fillUniform(uniform.data(), uniform.size());
+    double mean = 0;
+    for (double number : uniform) {
+        CHECK((number >= 0 && number < 1));
+        mean += number / uniform.size();
+    }
+    CHECK((mean > 0.45 && mean < 0.55));
+}
+
+TEST_CASE("Test independent substreams of a PRNG stream", "[PRNGStream]")
+{
+    PRNGStream gen(37);
+    PRNGStream first = gen.substream(1);
+    PRNGStream second = gen.substream(2);
+
+    CHECK(first.getKey() == gen.getKey());
+    CHECK(first.getStream() == 1);
+    CHECK(first() != second());
+
+    // The stream can be used with the distributions of the standard library.
+    std::uniform_int_distribution<int> dist(0, 100);
+    PRNGStream copy = gen.substream(1);
+    PRNGStream other = gen.substream(1);
+    for (int i = 0; i < 16; i++) {
+        CHECK(dist(copy) == dist(other));
+    }
+}